@@ -1,2 +1,6 @@
 from .appbase import SkAppBase, SkAppInitError, SkAppNotFoundWindow
+from .framescheduler import SkFrameScheduler
+from .inputrecorder import SkInputRecorder, SkInputReplayer
+from .raster import SkRasterWindow
+from .rendercontext import SkLayerCache, SkRenderContext
 from .windowbase import SkWindowBase
@@ -1,11 +1,13 @@
+import asyncio
 import typing
 import warnings
 
 import glfw
 import skia
 
-from ..event import SkEvent, SkEventHandling
+from ..event import SkEvent, SkEventHandling, SkTimerScheduler
 from ..misc import SkMisc
+from .framescheduler import SkFrameScheduler
 
 
 class SkAppInitError(Exception):
@@ -84,6 +86,15 @@ class SkAppBase(SkEventHandling, SkMisc):
     :param bool is_get_context_on_focus:
         Is the context only obtained when the window gains focus.
         【是否只有在窗口获得焦点时，获得上下文】
+    :param framework:
+        "glfw", "sdl2" or "raster" (render into CPU surfaces without any display, see `SkRasterWindow`).
+        【"raster"无需显示器，渲染到CPU Surface】
+    :param max_fps:
+        Maximum frames per second of each window, unlimited if None (vsync still applies).
+        【每个窗口的最大帧率】
+    :param frame_budget:
+        Seconds a frame may take before it is reported as late, see `SkFrameScheduler`.
+        【帧预算（秒），超出则记为迟到帧】
     """
 
     _instance = None  # 实例过SkAppBase
@@ -95,9 +106,11 @@ class SkAppBase(SkEventHandling, SkMisc):
         *,
         is_always_update: bool = False,
         is_get_context_on_focus: bool = True,
-        framework: typing.Literal["glfw", "sdl2"] = "glfw",
+        framework: typing.Literal["glfw", "sdl2", "raster"] = "glfw",
         vsync: bool = True,
         samples: int = 4,
+        max_fps: float | None = None,
+        frame_budget: float | None = None,
     ) -> None:
         super().__init__()
         from .windowbase import SkWindowBase
@@ -110,6 +123,9 @@ class SkAppBase(SkEventHandling, SkMisc):
         self.is_get_context_on_focus: bool = is_get_context_on_focus
         self.vsync = vsync
         self.samples = samples
+        self.frame_scheduler: SkFrameScheduler = SkFrameScheduler(
+            max_fps=max_fps, frame_budget=frame_budget
+        )
         self.alive: bool = False  # Is the program currently running. 【程序是否正在运行】
 
         SkAppBase.default_application = self
@@ -120,11 +136,18 @@ class SkAppBase(SkEventHandling, SkMisc):
                 init_glfw()
             case "sdl2":
                 init_sdl2()
+            case "raster":
+                pass  # Nothing to initialize
 
         if SkAppBase._instance is not None:
             raise RuntimeError("App is a singleton, use App.get_instance()")
         SkAppBase._instance = self
 
+    @property
+    def timer_scheduler(self) -> SkTimerScheduler:
+        """The scheduler of the delay and repeat tasks of all windows and widgets."""
+        return SkEventHandling.timers
+
     @classmethod
     def get_instance(cls) -> int:
         """Get the instance of the application."""
@@ -155,36 +178,94 @@ class SkAppBase(SkEventHandling, SkMisc):
 
     # region about mainloop 事件循环相关
 
-    def update(self) -> None:
-        """Update all windows.
+    def update(self, wait: bool = True) -> None:
+        """Update all windows, then wait for the next event.
 
-        :param bool redraw: Whether to redraw the window.
-        """
-        from glfw import poll_events, wait_events
+        The loop sleeps in `glfw.wait_events_timeout()` until the next input event, delay task,
+        animation frame or `post()`, see `time_until_next_event()`.
 
-        input_mode: bool = True
+        :param wait: Whether to wait for events, if False pending events are only polled
+        """
+        from glfw import poll_events, wait_events, wait_events_timeout
 
-        # poll_events()
+        self.run_ui_callbacks()
+        self.timer_scheduler.run_due()
 
         for window in self.windows:
             if window.visible and window.alive:
                 window.update()
-                if window.mode == "input":
-                    input_mode = True
-                if glfw.get_current_context():
+                if self.framework == "glfw" and glfw.get_current_context():
                     glfw.swap_interval(1 if self.vsync else 0)  # 是否启用垂直同步
 
-        if input_mode:
+        if self.framework == "raster":
+            return  # Events are injected, nothing to poll
+
+        timeout = self.time_until_next_event() if wait else 0.0
+        if timeout is None:
+            wait_events()
+        elif timeout <= 0:
             poll_events()
         else:
-            # if self._check_delay_events()
-            wait_events()
+            wait_events_timeout(timeout)
+
+    def time_until_next_event(self) -> float | None:
+        """Get how long the event loop may sleep before something is due.
+
+        Delay/repeat tasks of every window and widget (e.g. the blinking cursor of
+        `SkLineInput`) are in `timer_scheduler`.
+
+        :return: Seconds until the next delay/repeat task or animation frame, 0 to keep polling
+            (`is_always_update`, queued `call_soon()` callbacks or a window in `input` mode),
+            None to sleep until an input event or `post()`
+        """
+        if self.is_always_update or self.has_ui_callbacks():
+            return 0.0
+        timeouts = []
+        for window in self.windows:
+            if not (window.visible and window.alive):
+                continue
+            if window.mode == "input":
+                return 0.0
+            if window.need_redraw or window._input_queue:
+                timeouts.append(self.frame_scheduler.time_until_frame(window))
+        timer_timeout = self.timer_scheduler.time_until_next()
+        if timer_timeout is not None:
+            timeouts.append(timer_timeout)
+        if not timeouts:
+            return None
+        return max(0.0, min(timeouts))
 
     def run(self) -> None:
         """Run the program (i.e., start the event loop).
 
         :return:
         """
+        self._start()
+        while self._check_windows():
+            self.update()
+        self.cleanup()
+
+    async def run_async(self, poll_interval: float = 0.005) -> None:
+        """Run the program inside a running asyncio event loop.
+
+        Between two iterations the asyncio loop runs, so handlers may be coroutine functions
+        that await sockets, subprocesses etc. The loop sleeps until the next delay/repeat task
+        or frame is due, but at most `poll_interval` as GLFW events cannot wake asyncio up.
+
+        >>> asyncio.run(app.run_async())
+
+        :param poll_interval: Maximum seconds between two polls of window events
+        :return:
+        """
+        self._start()
+        while self._check_windows():
+            self.update(wait=False)
+            timeout = self.time_until_next_event()
+            await asyncio.sleep(poll_interval if timeout is None else min(timeout, poll_interval))
+        self.cleanup()
+
+    def _start(self) -> None:
+        """Prepare the event loop."""
         self.alive = True
 
         if not self.windows:
@@ -198,17 +279,20 @@ class SkAppBase(SkEventHandling, SkMisc):
                 glfw.window_hint(glfw.SAMPLES, self.samples)
                 glfw.set_error_callback(self.error)
 
-        while self.alive:
-            if not self.windows:
-                self.alive = False
-                break
-            for window in self.windows:
-                if window.can_be_close():
-                    window.destroy()
+    def _check_windows(self) -> bool:
+        """Destroy the windows that should close.
 
-            self.update()
-
-        self.cleanup()
+        :return: Whether the event loop should go on
+        """
+        if not self.alive:
+            return False
+        if not self.windows:
+            self.alive = False
+            return False
+        for window in tuple(self.windows):
+            if window.can_be_close():
+                window.destroy()
+        return True
 
     mainloop = run
 
@@ -218,15 +302,20 @@ class SkAppBase(SkEventHandling, SkMisc):
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        self.shutdown_executor(wait=False)
         match self.framework:
             case "glfw":
                 for window in self.windows:
+                    window.release_render_context()
                     glfw.destroy_window(window.the_window)
                 glfw.terminate()
             case "sdl2":
                 import sdl2
 
                 sdl2.SDL_Quit()
+            case "raster":
+                for window in self.windows:
+                    window.release_render_context()
             case _:
                 raise SkAppInitError(f"Unknown framework {self.framework}")
         self.quit()
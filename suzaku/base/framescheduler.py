@@ -0,0 +1,140 @@
+import contextlib
+import math
+import time
+import typing
+
+
+class SkFrameScheduler:
+    """Paces the redraws of the windows of an application.
+
+    Window callbacks only invalidate their window, the event loop renders each dirty window at
+    most once per frame interval (`1 / max_fps`). Every rendered frame is timed: frames taking
+    longer than `frame_budget` are counted as late, and the frame intervals they overran are
+    counted as dropped.
+
+    Example
+    -------
+    .. code-block:: python
+        app = SkApp(max_fps=60)
+        ...
+        print(app.frame_scheduler.stats())
+
+    :param max_fps: Maximum frames per second of each window, unlimited if None
+    :param frame_budget: Seconds a frame may take, defaults to the frame interval or 1/60
+    """
+
+    def __init__(self, max_fps: float | None = None, frame_budget: float | None = None) -> None:
+        self.max_fps: float | None = max_fps
+        self._frame_budget: float | None = frame_budget
+        self._last_frame: dict[int, float] = {}  # id(window) -> start of its last frame
+
+        # Statistics 【统计】
+        self.frame_count: int = 0
+        self.late_frames: int = 0
+        self.dropped_frames: int = 0
+        self.total_frame_time: float = 0.0
+        self.max_frame_time: float = 0.0
+
+    @property
+    def frame_interval(self) -> float:
+        """Minimum seconds between two frames of a window, 0 if unlimited."""
+        return 1 / self.max_fps if self.max_fps else 0.0
+
+    @property
+    def frame_budget(self) -> float:
+        """Seconds a frame may take before it is counted as late."""
+        if self._frame_budget is not None:
+            return self._frame_budget
+        return self.frame_interval or 1 / 60
+
+    @frame_budget.setter
+    def frame_budget(self, value: float | None) -> None:
+        self._frame_budget = value
+
+    def is_frame_due(self, window: typing.Any, now: float | None = None) -> bool:
+        """Check whether the window may render a frame now.
+
+        :param window: The window
+        :param now: Current `time.perf_counter()`, measured if None
+        :return: bool
+        """
+        last = self._last_frame.get(id(window))
+        if last is None or not self.max_fps:
+            return True
+        if now is None:
+            now = time.perf_counter()
+        # Tolerate a little jitter of the event loop 【容忍事件循环的少量抖动】
+        return now - last >= self.frame_interval * 0.95
+
+    def time_until_frame(self, window: typing.Any, now: float | None = None) -> float:
+        """Get the seconds until the window may render its next frame.
+
+        :param window: The window
+        :param now: Current `time.perf_counter()`, measured if None
+        :return: float
+        """
+        last = self._last_frame.get(id(window))
+        if last is None or not self.max_fps:
+            return 0.0
+        if now is None:
+            now = time.perf_counter()
+        return max(0.0, last + self.frame_interval - now)
+
+    @contextlib.contextmanager
+    def frame(self, window: typing.Any) -> typing.Iterator[None]:
+        """Time a frame of the window.
+
+        >>> with app.frame_scheduler.frame(window):
+        >>>     window.draw()
+
+        :param window: The window
+        """
+        start = time.perf_counter()
+        self._last_frame[id(window)] = start
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.frame_count += 1
+            self.total_frame_time += duration
+            self.max_frame_time = max(self.max_frame_time, duration)
+            budget = self.frame_budget
+            if duration > budget:
+                self.late_frames += 1
+                self.dropped_frames += math.floor(duration / budget)
+
+    def forget(self, window: typing.Any) -> None:
+        """Forget a destroyed window.
+
+        :param window: The window
+        :return: None
+        """
+        self._last_frame.pop(id(window), None)
+
+    def stats(self) -> dict[str, float | int]:
+        """Get the frame statistics.
+
+        :return: dict with frames, late_frames, dropped_frames, average_frame_time and
+            max_frame_time (in seconds)
+        """
+        return {
+            "frames": self.frame_count,
+            "late_frames": self.late_frames,
+            "dropped_frames": self.dropped_frames,
+            "average_frame_time": (
+                self.total_frame_time / self.frame_count if self.frame_count else 0.0
+            ),
+            "max_frame_time": self.max_frame_time,
+        }
+
+    def reset_stats(self) -> typing.Self:
+        """Reset the frame statistics.
+
+        :return: self
+        """
+        self.frame_count = 0
+        self.late_frames = 0
+        self.dropped_frames = 0
+        self.total_frame_time = 0.0
+        self.max_frame_time = 0.0
+        return self
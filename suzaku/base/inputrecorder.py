@@ -0,0 +1,239 @@
+import functools
+import json
+import math
+import os
+import time
+import typing
+
+import glfw
+
+#: Recorded callbacks of `SkWindowBase`, by their short name in the recordings
+CALLBACKS: dict[str, str] = {
+    "cursor_pos": "_on_cursor_pos",
+    "mouse_button": "_on_mouse_button",
+    "key": "_on_key",
+    "char": "_on_char",
+    "scroll": "_on_scroll",
+    "resize": "_on_resizing",
+}
+
+#: Setters of the GLFW callbacks, to route them through the recorder
+_GLFW_SETTERS: dict[str, typing.Callable] = {
+    "cursor_pos": glfw.set_cursor_pos_callback,
+    "mouse_button": glfw.set_mouse_button_callback,
+    "key": glfw.set_key_callback,
+    "char": glfw.set_char_callback,
+    "scroll": glfw.set_scroll_callback,
+    "resize": glfw.set_window_size_callback,
+}
+
+RECORDING_VERSION = 1
+
+
+class SkInputRecorder:
+    """Records the raw input callbacks of a window (cursor, button, key, char, scroll, resize).
+
+    Every callback is stored with its time since `start()`, before any coalescing, so that
+    `SkInputReplayer` can feed the same stream back through the same `_on_*` handlers.
+    Recordings are JSONL files: a header object, then one `[time, name, *args]` array per line.
+
+    Example
+    -------
+    .. code-block:: python
+        with SkInputRecorder(window, "session.jsonl"):
+            app.run()
+
+    :param window: The window to record
+    :param path: File to save the recording to on `stop()`, kept in memory only if None
+    """
+
+    def __init__(self, window: typing.Any, path: str | os.PathLike | None = None) -> None:
+        self.window: typing.Any = window
+        self.path: str | os.PathLike | None = path
+        self.records: list[list] = []
+        self.recording: bool = False
+        self._start: float = 0.0
+
+    def __enter__(self) -> typing.Self:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> typing.Self:
+        """Start recording, the callbacks of the window are routed through the recorder.
+
+        :return: self
+        """
+        if self.recording:
+            return self
+        self.recording = True
+        self._start = time.perf_counter()
+        window = self.window
+        for name, callback in CALLBACKS.items():
+            # Instance attributes shadow the methods, so direct calls (e.g. raster input) and
+            # `flush_input()` go through the recorder too
+            recorded = functools.partial(self._record, name, getattr(window, callback))
+            setattr(window, callback, recorded)
+        self._set_glfw_callbacks()
+        return self
+
+    def stop(self) -> typing.Self:
+        """Stop recording and save the recording if a `path` is set.
+
+        :return: self
+        """
+        if not self.recording:
+            return self
+        self.recording = False
+        for callback in CALLBACKS.values():
+            self.window.__dict__.pop(callback, None)
+        self._set_glfw_callbacks()
+        if self.path is not None:
+            self.save(self.path)
+        return self
+
+    def _set_glfw_callbacks(self) -> None:
+        window = self.window
+        if window.framework == "glfw" and window.the_window:
+            for name, callback in CALLBACKS.items():
+                _GLFW_SETTERS[name](window.the_window, getattr(window, callback))
+
+    def _record(self, name: str, callback: typing.Callable, window: typing.Any, *args) -> None:
+        # Queued input dispatched by `flush_input()` was recorded when it arrived
+        if not self.window._flushing_input:
+            self.records.append([round(time.perf_counter() - self._start, 6), name, *args])
+        callback(window, *args)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save the recording as JSONL.
+
+        :param path: File path
+        :return: None
+        """
+        header = {
+            "version": RECORDING_VERSION,
+            "size": [self.window.width, self.window.height],
+            "framework": self.window.framework,
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(json.dumps(header) + "\n")
+            for record in self.records:
+                file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> tuple[dict, list[list]]:
+        """Load a recording.
+
+        :param path: File path
+        :return: (header, records)
+        """
+        with open(path, encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            if header.get("version") != RECORDING_VERSION:
+                raise ValueError(f"Unsupported recording version {header.get('version')}")
+            records = [json.loads(line) for line in file if line.strip()]
+        return header, records
+
+
+class SkInputReplayer:
+    """Replays a recording of `SkInputRecorder` into a window and measures it.
+
+    The events go through the same `_on_*` handlers, one application loop step
+    (`SkAppBase.update(wait=False)`) runs after each event, as the event loop would. Replays are
+    deterministic on the `raster` framework, GLFW windows still query the real cursor position.
+
+    Example
+    -------
+    .. code-block:: python
+        app = SkApp(framework="raster")
+        window = ...
+        stats = SkInputReplayer(window, "session.jsonl", speed=None).run()
+        print(stats["latency_p95"], stats["cpu_time"])
+
+    :param window: The window to replay into
+    :param recording: File path of a recording, or its records
+    :param speed: Speed factor of the recorded timing, as fast as possible if None
+    :param resize: If the window should be resized to the recorded size first
+    """
+
+    def __init__(
+        self,
+        window: typing.Any,
+        recording: str | os.PathLike | list[list],
+        speed: float | None = 1.0,
+        resize: bool = True,
+    ) -> None:
+        self.window: typing.Any = window
+        if isinstance(recording, list):
+            self.header: dict = {}
+            self.records: list[list] = recording
+        else:
+            self.header, self.records = SkInputRecorder.load(recording)
+        self.speed: float | None = speed
+        self.resize: bool = resize
+        self.latencies: list[float] = []  # Seconds from each event to the frame showing it
+        self._wall_time: float = 0.0
+        self._cpu_time: float = 0.0
+
+    def run(self) -> dict[str, float | int]:
+        """Replay every record.
+
+        :return: Statistics, see `stats()`
+        """
+        window = self.window
+        app = window.application
+        scheduler = app.frame_scheduler
+        if self.resize and "size" in self.header:
+            window.resize(*self.header["size"])
+            app.update(wait=False)
+        self.latencies = []
+        pending: list[float] = []  # Injection times of the events not shown yet
+
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        for record_time, name, *args in self.records:
+            if self.speed:
+                delay = start + record_time / self.speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            pending.append(time.perf_counter())
+            if name == "resize":
+                window.resize(*args)  # Also resizes the native window, as the window manager did
+            else:
+                getattr(window, CALLBACKS[name])(window.the_window, *args)
+
+            frames = scheduler.frame_count
+            app.update(wait=False)
+            if scheduler.frame_count != frames:
+                now = time.perf_counter()
+                self.latencies.extend(now - injected for injected in pending)
+                pending.clear()
+            elif not window.need_redraw and not window._input_queue:
+                pending.clear()  # Nothing to show for these events
+        # Input still queued (coalesced, or waiting for a frame) is shown by a last frame
+        window.flush_input()
+        if window.need_redraw:
+            window.draw_frame()
+            now = time.perf_counter()
+            self.latencies.extend(now - injected for injected in pending)
+        self._wall_time = time.perf_counter() - start
+        self._cpu_time = time.process_time() - cpu_start
+        return self.stats()
+
+    def stats(self) -> dict[str, float | int]:
+        """Get the statistics of the last `run()`.
+
+        :return: dict with events, wall_time and cpu_time (seconds), and the event-to-frame
+            latency_mean, latency_p95 and latency_max (seconds) of the events that led to a frame
+        """
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "events": len(self.records),
+            "wall_time": self._wall_time,
+            "cpu_time": self._cpu_time,
+            "latency_mean": sum(latencies) / count if count else 0.0,
+            "latency_p95": latencies[max(0, math.ceil(count * 0.95) - 1)] if count else 0.0,
+            "latency_max": latencies[-1] if count else 0.0,
+        }
@@ -0,0 +1,106 @@
+import time
+import typing
+
+import skia
+
+
+class SkRasterWindow:
+    """Native window stand-in of the `raster` framework.
+
+    The raster framework renders windows into CPU `skia.Surface` objects, nothing is shown on
+    screen and no display, GLFW or OpenGL is needed. It is meant for benchmarks, screenshot
+    tests and server-side thumbnails. Input is injected through the same entry points the GLFW
+    callbacks use, e.g. `window._on_cursor_pos(window.the_window, 10, 10)`.
+
+    Example
+    -------
+    .. code-block:: python
+        app = SkApp(framework="raster")
+        window = SkWindow(app, size=(320, 240))
+        SkTextButton(window, text="Hello").box()
+        window.update(True)
+        window.save("hello.png")
+
+    :param width: Window width
+    :param height: Window height
+    :param title: Window title
+    :param buffer: Writable pixel buffer (RGBA8888, at least `width * height * 4` bytes)
+        to render into, a buffer is allocated by Skia if None
+    """
+
+    #: Clipboard shared by every raster window 【所有光栅窗口共享的剪贴板】
+    clipboard: str = ""
+
+    _time_offset: float = time.perf_counter()
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        title: str = "",
+        buffer: typing.Any = None,
+    ) -> None:
+        self.size: tuple[int, int] = (int(width), int(height))
+        self.pos: tuple[int, int] = (0, 0)
+        self.title: str = title
+        self.buffer: typing.Any = buffer
+        self.cursor: str = "arrow"
+        self.opacity: float = 1.0
+        self.should_close: bool = False
+        self.attribs: dict[str, typing.Any] = {
+            "topmost": False,
+            "focused": True,
+            "hovered": False,
+            "auto_iconify": True,
+            "focus_on_show": True,
+            "resizable": True,
+            "visible": True,
+            "border": True,
+            "maximized": False,
+        }
+        self.surface: skia.Surface | None = None
+
+    def make_surface(self) -> skia.Surface:
+        """Get the CPU surface of the window, it is rebuilt when the window size changes.
+
+        :return: Skia Surface
+        """
+        width, height = self.size
+        if self.surface is None or (self.surface.width(), self.surface.height()) != self.size:
+            info = skia.ImageInfo.Make(
+                width, height, skia.kRGBA_8888_ColorType, skia.kPremul_AlphaType
+            )
+            if self.buffer is None:
+                self.surface = skia.Surface.MakeRaster(info)
+            else:
+                if len(memoryview(self.buffer).cast("B")) < width * height * 4:
+                    raise ValueError(
+                        f"The buffer is too small for a {width}x{height} raster window"
+                    )
+                self.surface = skia.Surface.MakeRasterDirect(info, self.buffer, width * 4)
+            if self.surface is None:
+                raise RuntimeError("Failed to create Skia raster surface")
+        return self.surface
+
+    @classmethod
+    def time(cls, value: float | None = None) -> float | None:
+        """Get or set the clock of the raster framework (like `glfw.get_time`/`glfw.set_time`).
+
+        :param value: The time to set. Defaults to None.
+        :return: float | None: The time if value is None.
+        """
+        if value is not None:
+            cls._time_offset = time.perf_counter() - value
+            return None
+        return time.perf_counter() - cls._time_offset
+
+    @staticmethod
+    def key_name(key: int) -> str | None:
+        """Get the name of a printable key (like `glfw.get_key_name`).
+
+        :param key: GLFW key code
+        :return: Lower-case key name, None if the key is not printable
+        """
+        if 32 < key < 97:
+            return chr(key).lower()
+        return None
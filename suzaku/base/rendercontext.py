@@ -0,0 +1,216 @@
+import collections
+import typing
+
+import skia
+
+
+class SkLayerCache:
+    """LRU cache of the offscreen layers of one window (see `SkContainer.cache_as_layer`).
+
+    Layers are stored as images keyed by the id of their owner. When the layers take more than
+    `budget` bytes, the least recently used ones are evicted and their owners render a new one
+    the next time they are drawn.
+
+    :param budget: Maximum bytes of all layers of the window
+    :param max_size: Maximum width and height of a layer, larger containers are not cached
+    """
+
+    def __init__(self, budget: int = 64 * 1024 * 1024, max_size: int = 4096) -> None:
+        self.budget: int = budget
+        self.max_size: int = max_size
+        self.bytes: int = 0
+        self._layers: collections.OrderedDict[str, skia.Image] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def fits(self, width: int | float, height: int | float) -> bool:
+        """Check whether a layer of the given size may be cached.
+
+        :param width: Layer width
+        :param height: Layer height
+        :return: bool
+        """
+        return (
+            0 < width <= self.max_size
+            and 0 < height <= self.max_size
+            and width * height * 4 <= self.budget
+        )
+
+    def get(self, owner_id: str) -> skia.Image | None:
+        """Get the layer of an owner and mark it as recently used.
+
+        :param owner_id: Id of the owner
+        :return: skia.Image | None
+        """
+        image = self._layers.get(owner_id)
+        if image is not None:
+            self._layers.move_to_end(owner_id)
+        return image
+
+    def put(self, owner_id: str, image: skia.Image) -> None:
+        """Store the layer of an owner, evicting the least recently used layers if needed.
+
+        :param owner_id: Id of the owner
+        :param image: The layer
+        :return: None
+        """
+        self.discard(owner_id)
+        self._layers[owner_id] = image
+        self.bytes += image.width() * image.height() * 4
+        while self.bytes > self.budget and len(self._layers) > 1:
+            _, evicted = self._layers.popitem(last=False)
+            self.bytes -= evicted.width() * evicted.height() * 4
+
+    def discard(self, owner_id: str) -> None:
+        """Drop the layer of an owner.
+
+        :param owner_id: Id of the owner
+        :return: None
+        """
+        image = self._layers.pop(owner_id, None)
+        if image is not None:
+            self.bytes -= image.width() * image.height() * 4
+
+    def clear(self) -> None:
+        """Drop all layers."""
+        self._layers.clear()
+        self.bytes = 0
+
+
+class SkRenderContext:
+    """Owns the Skia GPU context and the backend surface of a window.
+
+    Creating a `GrDirectContext` is expensive and throws away Skia's glyph atlas, path cache and
+    shader cache, so every window keeps one context for its whole lifetime. The surface wrapping
+    the default framebuffer is kept alive across frames and only rebuilt after `invalidate()`,
+    which the window calls when its framebuffer size changes.
+
+    The window paints into an offscreen `layer` which is copied to the framebuffer every frame.
+    The contents of the framebuffer are undefined after swapping buffers, the layer keeps the
+    previous frame so that only the damaged parts of the window have to be repainted.
+
+    Example
+    -------
+    .. code-block:: python
+        render_context = SkRenderContext(resource_budget=64 * 1024 * 1024)
+        surface = render_context.gl_surface(800, 600)
+        ...
+        render_context.release()
+
+    :param resource_budget: Limit of Skia's GPU resource cache, in bytes
+    :param layer_budget: Limit of the cached container layers, in bytes (see `SkLayerCache`)
+    """
+
+    def __init__(
+        self, resource_budget: int = 16 * 1024 * 1024, layer_budget: int = 64 * 1024 * 1024
+    ) -> None:
+        self.context: skia.GrDirectContext | None = None
+        self.surface: skia.Surface | None = None
+        self.layer: skia.Surface | None = None
+        self.size: tuple[int, int] = (0, 0)
+        self._resource_budget: int = resource_budget
+        self.layers: SkLayerCache = SkLayerCache(budget=layer_budget)
+
+    def gl_surface(self, width: int, height: int) -> skia.Surface:
+        """Get the surface wrapping the default framebuffer of the current GL context.
+
+        The context is created on first use, the surface is reused until it is invalidated.
+
+        :param width: Framebuffer width
+        :param height: Framebuffer height
+        :return: Skia Surface
+        """
+        from OpenGL import GL
+
+        if self.context is None:
+            self.context = skia.GrDirectContext.MakeGL()
+            if self.context is None:
+                raise RuntimeError("Failed to create Skia GL context")
+            self.context.setResourceCacheLimit(self._resource_budget)
+
+        if self.surface is None or self.size != (width, height):
+            backend_render_target = skia.GrBackendRenderTarget(
+                width, height, 0, 0, skia.GrGLFramebufferInfo(0, GL.GL_RGBA8)
+            )
+            self.surface = skia.Surface.MakeFromBackendRenderTarget(
+                self.context,
+                backend_render_target,
+                skia.kBottomLeft_GrSurfaceOrigin,
+                skia.kRGBA_8888_ColorType,
+                skia.ColorSpace.MakeSRGB(),
+            )
+            if self.surface is None:
+                raise RuntimeError("Failed to create Skia surface")
+            self.size = (width, height)
+
+        return self.surface
+
+    def gl_layer(self) -> skia.Surface:
+        """Get the offscreen surface the window paints into, call `gl_surface` first.
+
+        Its contents are kept across frames, a new layer is created when the size changes.
+
+        :return: Skia Surface
+        """
+        width, height = self.size
+        if self.layer is None or (self.layer.width(), self.layer.height()) != self.size:
+            self.layer = skia.Surface.MakeRenderTarget(
+                self.context,
+                skia.Budgeted.kNo,
+                skia.ImageInfo.Make(
+                    width,
+                    height,
+                    skia.kRGBA_8888_ColorType,
+                    skia.kPremul_AlphaType,
+                    skia.ColorSpace.MakeSRGB(),
+                ),
+                0,
+                skia.kBottomLeft_GrSurfaceOrigin,
+            )
+            if self.layer is None:
+                raise RuntimeError("Failed to create Skia layer surface")
+        return self.layer
+
+    def invalidate(self) -> None:
+        """Drop the cached surface, it will be rebuilt on the next frame.
+
+        The GPU context and its caches are kept.
+        """
+        self.surface = None
+
+    def resource_budget(self, value: int | None = None) -> int | typing.Self:
+        """Get or set the limit of Skia's GPU resource cache.
+
+        :param value: New limit in bytes. Defaults to None.
+        :return: int | typing.Self: The limit if value is None, otherwise self.
+        """
+        if value is None:
+            return self._resource_budget
+        self._resource_budget = value
+        if self.context is not None:
+            self.context.setResourceCacheLimit(value)
+        return self
+
+    def purge(self) -> None:
+        """Free the GPU resources cached by the context (e.g. when the window is iconified).
+
+        Unlike `release()`, the context stays usable and the caches are refilled when needed.
+        """
+        self.layers.clear()
+        if self.context is not None:
+            self.context.freeGpuResources()
+
+    def release(self) -> None:
+        """Release the surface and abandon the GPU context.
+
+        The GL context of the window must be current when calling this.
+        """
+        self.surface = None
+        self.layer = None
+        self.layers.clear()
+        if self.context is not None:
+            self.context.freeGpuResources()
+            self.context.releaseResourcesAndAbandonContext()
+            self.context = None
+        self.size = (0, 0)
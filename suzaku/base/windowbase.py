@@ -2,6 +2,7 @@ import contextlib
 import os
 import os.path
 import sys
+import threading
 import typing
 import warnings
 
@@ -11,6 +12,8 @@ import skia
 from ..event import SkEvent, SkEventHandling
 from ..misc import SkMisc
 from . import SkAppBase
+from .raster import SkRasterWindow
+from .rendercontext import SkRenderContext
 
 
 class _GLFW_IMAGE:
@@ -41,6 +44,14 @@ class SkWindowBase(SkEventHandling, SkMisc):
     :param fullscreen: Window fullscreen
     :param opacity: Window opacity
     :param border: Whether it has border and titlebar
+    :param gpu_resource_budget: Limit of Skia's GPU resource cache of the window, in bytes
+    :param layer_cache_budget: Limit of the cached container layers of the window, in bytes
+    :param buffer: Pixel buffer the window renders into (only for the `raster` framework),
+        see `SkRasterWindow`
+    :param recycle_events: Reuse the event objects of mouse moves and scrolls instead of
+        allocating new ones, handlers must not keep these events around
+    :param coalesce_input: Merge the mouse moves, scrolls and resizes arriving between two
+        frames (latest position, summed scroll offsets, last size)
     """
 
     _instance_count = 0
@@ -57,6 +68,11 @@ class SkWindowBase(SkEventHandling, SkMisc):
         opacity: float = 1.0,
         minsize: tuple[int, int] = (80, 80),
         force_hardware_acceleration: bool = False,
+        gpu_resource_budget: int = 16 * 1024 * 1024,
+        layer_cache_budget: int = 64 * 1024 * 1024,
+        buffer: typing.Any = None,
+        recycle_events: bool = False,
+        coalesce_input: bool = False,
     ):
         # glfw.default_window_hints()
 
@@ -124,20 +140,18 @@ class SkWindowBase(SkEventHandling, SkMisc):
             "cursor": "arrow",  # default cursor
             "force_hardware_acceleration": force_hardware_acceleration,
             "minsize": minsize,
+            "gpu_resource_budget": gpu_resource_budget,
         }
 
-        [
-            self.EVENT_TYPES.append(event_type)
-            for event_type in [
-                "drop",
-                "maximize",
-                "iconify",
-                "dpi_change",
-                "delete_window",
-                "closed",
-                "move",
-            ]
-        ]
+        self.register_event_type(
+            "drop",
+            "maximize",
+            "iconify",
+            "dpi_change",
+            "delete_window",
+            "closed",
+            "move",
+        )
 
         buttons = [
             "button1",
@@ -156,11 +170,26 @@ class SkWindowBase(SkEventHandling, SkMisc):
         SkWindowBase._instance_count += 1
 
         self.draw_func = None
-        self.context = None
+        self.render_context = SkRenderContext(
+            resource_budget=gpu_resource_budget, layer_budget=layer_cache_budget
+        )
         self.surface = None
+        self._buffer = buffer
+        # Damage: the parts of the window to repaint in the next frame
+        # 【脏区域：下一帧需要重绘的部分】
+        self.damage: skia.Region = skia.Region()
+        self.damage_full: bool = True
+        self.frame_damage: skia.Region | None = None  # Damage of the frame being painted
+        self._painted_surface: skia.Surface | None = None
         self.attributes["fullscreen"] = fullscreen
         self.is_mouse_floating = False
         self.is_mouse_press = False
+        self.recycle_events: bool = recycle_events
+        self._recycled_events: dict[str, SkEvent] = {}
+        self.coalesce_input: bool = coalesce_input
+        self.coalesced_events: int = 0  # Input events merged into others
+        self._input_queue: list[tuple] = []
+        self._flushing_input: bool = False
 
         if self.width <= 0 or self.height <= 0:
             raise ValueError("The window size must be positive")
@@ -278,6 +307,13 @@ class SkWindowBase(SkEventHandling, SkMisc):
                         sdl2.SDL_WINDOW_OPENGL | sdl2.SDL_WINDOW_SHOWN | sdl2.SDL_WINDOW_RESIZABLE,
                     )
 
+                    self.visible = True
+                case "raster":
+                    window = SkRasterWindow(
+                        self.width, self.height, self.cget("title"), buffer=self._buffer
+                    )
+                    window.opacity = self.cget("opacity")
+
                     self.visible = True
             return window
         else:
@@ -311,6 +347,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
                     glfw.set_window_content_scale_callback(window, self._on_dpi_change)
                 case "sdl2":
                     print("TODO: implement sdl2 `create_bind`")
+                case "raster":
+                    # There is no event source, events are injected by calling `_on_*` directly
+                    # 【没有事件源，事件通过直接调用`_on_*`注入】
+                    pass
             self._event_init = True
 
     # endregion
@@ -320,23 +360,86 @@ class SkWindowBase(SkEventHandling, SkMisc):
     def update(self, redraw: bool = False) -> None:
         """Update window.
 
-        :param bool redraw: Whether to redraw the window.
+        A dirty window is redrawn once the frame scheduler of the application allows it, see
+        `SkFrameScheduler`.
+
+        :param bool redraw: Whether to redraw the window right now.
         """
         if self.visible:
             self.trigger("update", SkEvent(event_type="update"))
 
-            if self.mode == "input" or redraw:
-                self.draw()
-            else:
-
-                if self.need_redraw:
-                    self.draw()
-                    self.need_redraw = False
+            if self._input_queue and self.application.frame_scheduler.is_frame_due(self):
+                self.flush_input()
+            if redraw:
+                self.invalidate_rect()
+                self.draw_frame()
+            elif self.mode == "input" or self.need_redraw:
+                if self.application.frame_scheduler.is_frame_due(self):
+                    self.draw_frame()
             # for child in self.children:
             #    child.update(redraw=False, update_event=True)
             # self.update_layout: typing.Callable
             # self.post()
 
+    def draw_frame(self) -> None:
+        """Draw a frame of the window, timed by the frame scheduler of the application.
+
+        :return: None
+        """
+        with self.application.frame_scheduler.frame(self):
+            # Lay out first, the layout damages what it moves
+            if hasattr(self, "layout_if_needed"):
+                self.layout_if_needed()
+            # Reset before drawing, damage added while drawing goes to the next frame
+            self.need_redraw = False
+            self.draw()
+
+    def request_frame(self, rect: skia.Rect | None = None) -> typing.Self:
+        """Invalidate the window and draw it right away if a frame is due.
+
+        Used by callbacks that may run inside a blocking platform loop (e.g. while the window is
+        being resized), where the event loop of the application cannot draw.
+
+        :param rect: Damaged rect in window coordinates, the whole window if None
+        :return: self
+        """
+        self.invalidate_rect(rect)
+        if self.visible and self.application.frame_scheduler.is_frame_due(self):
+            self.draw_frame()
+        return self
+
+    def invalidate_rect(self, rect: skia.Rect | None = None) -> typing.Self:
+        """Mark a part of the window to be repainted in the next frame.
+
+        >>> window.invalidate_rect(skia.Rect.MakeXYWH(10, 10, 100, 30))
+
+        :param rect: Damaged rect in window coordinates, the whole window if None
+        :return: self
+        """
+        if rect is None:
+            self.damage_full = True
+        elif not self.damage_full and not rect.isEmpty():
+            self.damage.op(rect.roundOut(), skia.Region.kUnion_Op)
+        if not self.need_redraw and threading.current_thread() is not threading.main_thread():
+            self.post()  # Wake up the event loop waiting for events 【唤醒等待事件的事件循环】
+        self.need_redraw = True
+        return self
+
+    def _begin_frame(self, surface: skia.Surface) -> None:
+        """Move the accumulated damage to `frame_damage` before painting a frame.
+
+        A surface that has not been painted before is repainted entirely.
+
+        :param surface: The surface to paint
+        :return: None
+        """
+        if surface is not self._painted_surface:
+            self.damage_full = True
+            self._painted_surface = surface
+        self.frame_damage = None if self.damage_full else self.damage
+        self.damage = skia.Region()
+        self.damage_full = False
+
     @contextlib.contextmanager
     def skia_surface(self, arg: typing.Any) -> skia.Surface:
         """Create a Skia surface for the window.
@@ -346,28 +449,17 @@ class SkWindowBase(SkEventHandling, SkMisc):
         """
         match self.framework:
             case "glfw":
-                from OpenGL import GL
-
                 if not glfw.get_current_context() or glfw.window_should_close(arg):
                     yield None
                     return
 
-                self.context = skia.GrDirectContext.MakeGL()
-                fb_width, fb_height = glfw.get_framebuffer_size(arg)
-                backend_render_target = skia.GrBackendRenderTarget(
-                    fb_width, fb_height, 0, 0, skia.GrGLFramebufferInfo(0, GL.GL_RGBA8)
-                )
-                surface: skia.Surface = skia.Surface.MakeFromBackendRenderTarget(
-                    self.context,
-                    backend_render_target,
-                    skia.kBottomLeft_GrSurfaceOrigin,
-                    skia.kRGBA_8888_ColorType,
-                    skia.ColorSpace.MakeSRGB(),
-                )
-                self.context.setResourceCacheLimit(16 * 1024 * 1024)
-
+                # The context and the surface live across frames, the surface is only rebuilt
+                # after `_on_framebuffer_size` invalidated it
+                # 【上下文与Surface跨帧复用，仅在帧缓冲尺寸变化后重建Surface】
+                surface = self.render_context.surface
                 if surface is None:
-                    raise RuntimeError("Failed to create Skia surface")
+                    fb_width, fb_height = glfw.get_framebuffer_size(arg)
+                    surface = self.render_context.gl_surface(fb_width, fb_height)
 
                 yield surface
 
@@ -392,8 +484,13 @@ class SkWindowBase(SkEventHandling, SkMisc):
 
                 yield surface  # ⚠️ 必须用 yield，不要 return
 
+            case "raster":
+                yield arg.make_surface()
+
     def draw(self, event: SkEvent = None) -> None:
         if self.visible:
+            if hasattr(self, "layout_if_needed"):
+                self.layout_if_needed()
             # Set the current context for each arg
             # 【为该窗口设置当前上下文】
             match self.framework:
@@ -404,11 +501,17 @@ class SkWindowBase(SkEventHandling, SkMisc):
                     # 【创建Surface，交给该窗口】
                     with self.skia_surface(self.the_window) as self.surface:
                         if self.surface:
-                            with self.surface as canvas:
+                            # Paint into the layer, which still holds the previous frame
+                            # 【绘制到保留上一帧内容的图层】
+                            layer = self.render_context.gl_layer()
+                            self._begin_frame(layer)
+                            with layer as canvas:
                                 # Determine and call the drawing function of this arg.
                                 # 【判断并调用该窗口的绘制函数】
                                 if self.draw_func:
                                     self.draw_func(canvas)
+                            with self.surface as canvas:
+                                layer.draw(canvas, 0, 0, skia.Paint(BlendMode=skia.BlendMode.kSrc))
 
                             self.surface.flushAndSubmit()
                             self.trigger(
@@ -423,14 +526,19 @@ class SkWindowBase(SkEventHandling, SkMisc):
 
                     with self.skia_surface(surface) as sk_surface:
                         if sk_surface:
+                            self._begin_frame(sk_surface)
                             with sk_surface as canvas:
                                 if self.draw_func:
                                     self.draw_func(canvas)
 
                     sdl2.SDL_UpdateWindowSurface(self.the_window)
-        if self.context:
-            self.context.freeGpuResources()
-            self.context.releaseResourcesAndAbandonContext()
+                case "raster":
+                    with self.skia_surface(self.the_window) as self.surface:
+                        self._begin_frame(self.surface)
+                        with self.surface as canvas:
+                            if self.draw_func:
+                                self.draw_func(canvas)
+                        self.trigger("redrawing", SkEvent(self, "redrawing", surface=self.surface))
         for child in self.children:
             child.need_redraw = False
         self.trigger("redraw", SkEvent(self, "redraw"))
@@ -495,6 +603,11 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param value: Whether the window can be closed
         :return: None
         """
+        if self.framework == "raster":
+            if value is not None:
+                self.the_window.should_close = value
+                return self
+            return self.the_window.should_close if self.the_window else False
         if value is not None:
             glfw.set_window_should_close(self.the_window, value)
             return self
@@ -510,10 +623,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param window: GLFW Window
         :param char: Unicode character
         """
+        self.flush_input()  # Queued moves and scrolls happened before
 
+        # The focused widget repaints itself, a keystroke does not damage the whole window
         self.trigger("char", SkEvent(event_type="char", char=chr(char), glfw_window=window))
-        self.update(True)
-        # self.update(redraw=True)
 
     def _on_key(self, window: typing.Any, key: str, scancode: str, action: str, mods: int) -> None:
         """
@@ -525,11 +638,15 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param action: Action
         :param mods: Modifiers
         """
+        self.flush_input()  # Queued moves and scrolls happened before
         from glfw import PRESS, RELEASE, REPEAT, get_key_name
 
-        keyname: str = get_key_name(
-            key, scancode
-        )  # 获取对应的键名，不同平台scancode不同，因此需要输入scancode来正确转换。有些按键不具备键名
+        if self.framework == "raster":
+            keyname: str | None = SkRasterWindow.key_name(key)
+        else:
+            keyname: str = get_key_name(
+                key, scancode
+            )  # 获取对应的键名，不同平台scancode不同，因此需要输入scancode来正确转换。有些按键不具备键名
         # print(self.mods_name(mods))
         # 我真尼玛服了啊，改了半天，发现delete键获取不到键名，卡了我半天啊
 
@@ -553,7 +670,6 @@ class SkWindowBase(SkEventHandling, SkMisc):
                 glfw_window=window,
             ),
         )
-        self.update(True)
 
     def _on_focus(self, window, focused) -> None:
         """Triggers the focus event (triggered when the window gains or loses focus).
@@ -562,16 +678,17 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param focused: Focused
         :return: None
         """
+        self.flush_input()  # Queued moves and scrolls happened before
         if focused:
             self.configure(focus=True)
             self.trigger("focus_gain", SkEvent(event_type="focus_gain", glfw_window=window))
-            self.update(redraw=True)
         else:
             self.configure(focus=False)
             self.trigger("focus_loss", SkEvent(event_type="focus_loss", glfw_window=window))
 
     def _on_refresh(self, window: typing.Any):
-        self.update(True)
+        self.flush_input()  # A queued resize must be applied before painting
+        self.request_frame()
 
     def _on_scroll(self, window, x_offset, y_offset):
         """Trigger scroll event (triggered when the mouse scroll wheel is scrolled).
@@ -581,10 +698,12 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param y_offset: Y offset
         :return: None
         """
+        if self._coalesce_input("_on_scroll", window, x_offset, y_offset):
+            return
         self.trigger(
             "scroll",
-            SkEvent(
-                event_type="scroll",
+            self._input_event(
+                "scroll",
                 x_offset=x_offset,
                 y_offset=y_offset,
                 glfw_window=window,
@@ -592,7 +711,14 @@ class SkWindowBase(SkEventHandling, SkMisc):
         )
 
     def _on_framebuffer_size(self, window: typing.Any, width: int, height: int) -> None:
-        pass
+        """Rebuild the Skia surface on the next frame (triggered when the framebuffer size changes).
+
+        :param window: GLFW Window
+        :param width: Framebuffer width
+        :param height: Framebuffer height
+        :return: None
+        """
+        self.render_context.invalidate()
 
     def _on_resizing(self, window, width: int, height: int) -> None:
         """Trigger resize event (triggered when the window size changes).
@@ -602,6 +728,8 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param height: Window height
         :return: None
         """
+        if self._coalesce_input("_on_resizing", window, width, height):
+            return
         # GL.glViewport(0, 0, width, height)
         self._on_framebuffer_size(window, width, height)
         self.width = width
@@ -615,8 +743,7 @@ class SkWindowBase(SkEventHandling, SkMisc):
         self.trigger("resize", event)
         for child in self.children:
             child.trigger("resize", event)
-        self.update(True)
-        # cls.update()
+        self.request_frame()
 
     def _on_window_pos(self, window: typing.Any, x: int, y: int) -> None:
         """Trigger move event (triggered when the window position changes).
@@ -653,6 +780,7 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param mods: Modifiers
         :return: None
         """
+        self.flush_input()  # Queued moves and scrolls happened before
         # print(arg1, arg2)
 
         self.mouse_x, self.mouse_y = self.mouse_pos()
@@ -666,27 +794,22 @@ class SkWindowBase(SkEventHandling, SkMisc):
             state = "release"
             self.button = -1
 
-        names = [
-            f"mouse_{state}",
-            f"mouse_{state}[button{button+1}]",
-            f"mouse_{state}[b{button+1}]",
-        ]
-
         self.button = button
 
-        for name in names:
-            self.trigger(
-                name,
-                SkEvent(
-                    event_type=name,
-                    x=self.mouse_x,
-                    y=self.mouse_y,
-                    rootx=self.mouse_rootx,
-                    rooty=self.mouse_rooty,
-                    button=button,
-                    mods=self.mods_name(mods),
-                ),
-            )
+        # Triggered once, the tasks bound to the button specific names run once too
+        self.trigger(
+            f"mouse_{state}",
+            SkEvent(
+                event_type=f"mouse_{state}",
+                x=self.mouse_x,
+                y=self.mouse_y,
+                rootx=self.mouse_rootx,
+                rooty=self.mouse_rooty,
+                button=button,
+                mods=self.mods_name(mods),
+            ),
+            aliases=(f"mouse_{state}[button{button+1}]", f"mouse_{state}[b{button+1}]"),
+        )
 
     def _on_cursor_enter(self, window: typing.Any, is_enter: bool) -> None:
         """Trigger mouse enter event (triggered when the mouse enters the window) or mouse leave event (triggered when the mouse leaves the window).
@@ -695,6 +818,7 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param is_enter: Whether entered
         :return: None
         """
+        self.flush_input()  # Queued moves and scrolls happened before
         self.mouse_x, self.mouse_y = self.mouse_pos()
         self.mouse_rootx, self.mouse_rooty = self.mouse_root_pos()
 
@@ -731,6 +855,8 @@ class SkWindowBase(SkEventHandling, SkMisc):
         :param y: Mouse Y position
         :return: None
         """
+        if self._coalesce_input("_on_cursor_pos", window, x, y):
+            return
 
         self.mouse_x = x
         self.mouse_y = y
@@ -740,28 +866,22 @@ class SkWindowBase(SkEventHandling, SkMisc):
 
         button = self.button
         if button >= 0:
-            names = [
+            # One event for the three names, they are all of the `mouse_motion` type
+            event = self._input_event(
                 "mouse_motion",
-                f"mouse_motion[button{button+1}]",
-                f"mouse_motion[b{button+1}]",
-            ]
-
-            for name in names:
-                self.trigger(
-                    name,
-                    SkEvent(
-                        event_type=name,
-                        x=self.mouse_x,
-                        y=self.mouse_y,
-                        rootx=self.mouse_rootx,
-                        rooty=self.mouse_rooty,
-                        glfw_window=window,
-                    ),
-                )
+                x=self.mouse_x,
+                y=self.mouse_y,
+                rootx=self.mouse_rootx,
+                rooty=self.mouse_rooty,
+                glfw_window=window,
+            )
+            self.trigger("mouse_motion", event)
+            self.trigger(f"mouse_motion[button{button+1}]", event)
+            self.trigger(f"mouse_motion[b{button+1}]", event)
         self.trigger(
             "mouse_move",
-            SkEvent(
-                event_type="mouse_move",
+            self._input_event(
+                "mouse_move",
                 x=self.mouse_x,
                 y=self.mouse_y,
                 rootx=self.mouse_rootx,
@@ -770,6 +890,67 @@ class SkWindowBase(SkEventHandling, SkMisc):
             ),
         )
 
+    def _coalesce_input(self, callback: str, window: typing.Any, *args) -> bool:
+        """Queue a mouse move, scroll or resize to be dispatched with the next frame.
+
+        A run of the same kind is merged: moves and resizes keep the latest values, scroll
+        offsets are summed. Other input flushes the queue first, so nothing is reordered.
+
+        :param callback: Name of the `_on_*` method dispatching the event
+        :param window: GLFW Window
+        :param args: Arguments of the callback
+        :return: Whether the event was queued (and must not be dispatched now)
+        """
+        if not self.coalesce_input or self._flushing_input:
+            return False
+        queue = self._input_queue
+        if queue and queue[-1][0] == callback:
+            if callback == "_on_scroll":
+                _, _, x_offset, y_offset = queue[-1]
+                args = (x_offset + args[0], y_offset + args[1])
+            queue[-1] = (callback, window, *args)
+            self.coalesced_events += 1
+        else:
+            queue.append((callback, window, *args))
+        return True
+
+    def flush_input(self) -> None:
+        """Dispatch the input queued by `coalesce_input`.
+
+        :return: None
+        """
+        if not self._input_queue:
+            return
+        queue, self._input_queue = self._input_queue, []
+        self._flushing_input = True
+        try:
+            for callback, *args in queue:
+                getattr(self, callback)(*args)
+        finally:
+            self._flushing_input = False
+
+    def _input_event(self, event_type: str, **kwargs) -> SkEvent:
+        """Get the event object of a high-frequency input path (mouse moves, scrolls).
+
+        With `recycle_events` one object per event type is reused.
+
+        :param event_type: Type of the event
+        :param kwargs: Properties of the event
+        :return: SkEvent
+        """
+        if self.recycle_events:
+            event = self._recycled_events.get(event_type)
+            if event is None:
+                event = self._recycled_events[event_type] = SkEvent(event_type=event_type)
+            # Same items every time, only what handlers may have changed is reset
+            event.event_type = event_type
+            event.widget = event.window_base = event.window = event._extra = None
+            event.propagation_stopped = False
+            for prop, value in kwargs.items():
+                setattr(event, prop, value)
+            return event
+        return SkEvent(event_type=event_type, **kwargs)
+
     def _on_maximize(self, window, maximized: bool):
         self.trigger(
             "maximize",
@@ -777,9 +958,14 @@ class SkWindowBase(SkEventHandling, SkMisc):
         )
 
     def _on_drop(self, window: typing.Any, paths):
+        self.flush_input()
         self.trigger("drop", SkEvent(event_type="drop", paths=paths, glfw_window=window))
 
     def _on_iconify(self, window: typing.Any, iconified: bool):
+        if iconified and self.framework == "glfw":
+            # Nothing will be drawn for a while, give the cached GPU resources back
+            glfw.make_context_current(window)
+            self.render_context.purge()
         self.trigger(
             "iconify",
             SkEvent(event_type="iconify", iconified=iconified, glfw_window=window),
@@ -917,7 +1103,8 @@ class SkWindowBase(SkEventHandling, SkMisc):
 
         :return: None
         """
-        glfw.request_window_attention(self.the_window)
+        if self.framework == "glfw":
+            glfw.request_window_attention(self.the_window)
 
     ask_notice = ask_focus = wm_ask_notice
 
@@ -946,7 +1133,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
             width = glfw.DONT_CARE
         if height is None:
             height = glfw.DONT_CARE
-        glfw.set_window_size_limits(self.the_window, glfw.DONT_CARE, glfw.DONT_CARE, width, height)
+        if self.framework == "glfw":
+            glfw.set_window_size_limits(
+                self.the_window, glfw.DONT_CARE, glfw.DONT_CARE, width, height
+            )
 
     maxsize = wm_maxsize
 
@@ -971,9 +1161,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
             if height is None:
                 height = glfw.DONT_CARE
 
-            glfw.set_window_size_limits(
-                self.the_window, width, height, glfw.DONT_CARE, glfw.DONT_CARE
-            )
+            if self.framework == "glfw":
+                glfw.set_window_size_limits(
+                    self.the_window, width, height, glfw.DONT_CARE, glfw.DONT_CARE
+                )
             return self
 
     minsize = wm_minsize
@@ -1011,6 +1202,12 @@ class SkWindowBase(SkEventHandling, SkMisc):
             "maximized": glfw.MAXIMIZED,
         }
 
+        if self.framework == "raster":
+            if value is not None:
+                self.the_window.attribs[name] = value
+                return self
+            return self.the_window.attribs.get(name, False)
+
         if name in attrib_names:
             attrib_name = attrib_names[name]
         else:
@@ -1057,6 +1254,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
         if cursor_name is None:
             return self._cursor
 
+        if self.framework == "raster":
+            self.the_window.cursor = cursor_name
+            return self
+
         name = cursor_name.upper()
 
         if name not in self.cursors:
@@ -1127,7 +1328,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
         self.visible = True
         if hasattr(self, "update_layout"):
             self.update_layout()  # 添加初始布局更新
-        glfw.show_window(self.the_window)
+        if self.framework == "raster":
+            self.the_window.attribs["visible"] = True
+        else:
+            glfw.show_window(self.the_window)
         self.update(True)  # 添加初始绘制触发
         return self
 
@@ -1140,7 +1344,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
         """
         from glfw import hide_window
 
-        hide_window(self.the_window)
+        if self.framework == "raster":
+            self.the_window.attribs["visible"] = False
+        else:
+            hide_window(self.the_window)
         self.visible = False
         return self
 
@@ -1153,7 +1360,11 @@ class SkWindowBase(SkEventHandling, SkMisc):
         """
         from glfw import maximize_window
 
-        maximize_window(self.the_window)
+        if self.framework == "raster":
+            self.the_window.attribs["maximized"] = True
+            self._on_maximize(self.the_window, True)
+        else:
+            maximize_window(self.the_window)
         return self
 
     maximize = wm_maximize
@@ -1165,7 +1376,10 @@ class SkWindowBase(SkEventHandling, SkMisc):
         """
         from glfw import iconify_window
 
-        iconify_window(self.the_window)
+        if self.framework == "raster":
+            self._on_iconify(self.the_window, True)
+        else:
+            iconify_window(self.the_window)
         return self
 
     iconify = wm_iconify
@@ -1177,7 +1391,12 @@ class SkWindowBase(SkEventHandling, SkMisc):
         """
         from glfw import restore_window
 
-        restore_window(self.the_window)
+        if self.framework == "raster":
+            if self.the_window.attribs["maximized"]:
+                self.the_window.attribs["maximized"] = False
+                self._on_maximize(self.the_window, False)
+        else:
+            restore_window(self.the_window)
         return self
 
     restore = wm_restore
@@ -1190,20 +1409,41 @@ class SkWindowBase(SkEventHandling, SkMisc):
         # self._event_init = False
         # print(self.id)
         self.application.destroy_window(self)
-        try:
-            glfw.destroy_window(self.the_window)
-        except TypeError:
-            pass
+        self.application.frame_scheduler.forget(self)
+        self.release_render_context()
+        if self.framework == "glfw":
+            try:
+                glfw.destroy_window(self.the_window)
+            except TypeError:
+                pass
 
         self.alive = False
         self.draw_func = None
         self.the_window = None  # Clear the reference
 
-        for child in self.children:
+        for child in tuple(self.children):  # Children remove themselves when destroyed
             child.destroy()
 
     destroy = wm_destroy
 
+    def release_render_context(self) -> None:
+        """Release the GPU context and the surface of the window.
+
+        :return: None
+        """
+        match self.framework:
+            case "glfw":
+                if self.the_window and self.render_context.context is not None:
+                    glfw.make_context_current(self.the_window)
+                    self.render_context.release()
+            case _:
+                self.render_context.release()
+
+    @property
+    def context(self) -> skia.GrDirectContext | None:
+        """The Skia GPU context of the window (None before the first frame)."""
+        return self.render_context.context
+
     def wm_title(self, text: str | None = None) -> typing.Union[str, "SkWindowBase"]:
         """Get or set the window title.
 
@@ -1218,9 +1458,12 @@ class SkWindowBase(SkEventHandling, SkMisc):
             return self.cget("title")
         else:
             self.configure(title=text)
-            from glfw import set_window_title
+            if self.framework == "raster":
+                self.the_window.title = text
+            else:
+                from glfw import set_window_title
 
-            set_window_title(self.the_window, text)
+                set_window_title(self.the_window, text)
 
         return self
 
@@ -1238,6 +1481,12 @@ class SkWindowBase(SkEventHandling, SkMisc):
         if height is None:
             height = self.height
 
+        if self.framework == "raster":
+            # What the window manager would do, GLFW calls back `_on_resizing` itself
+            self.the_window.size = (round(width), round(height))
+            self._on_resizing(self.the_window, round(width), round(height))
+            return self
+
         self.width = width
         self.height = height
 
@@ -1265,17 +1514,25 @@ class SkWindowBase(SkEventHandling, SkMisc):
             y = round(-self.height / 2)
         self.root_x = x
         self.root_y = y
-        from glfw import set_window_pos
+        if self.framework == "raster":
+            self.the_window.pos = (round(x), round(y))
+        else:
+            from glfw import set_window_pos
 
-        set_window_pos(self.the_window, round(x), round(y))
+            set_window_pos(self.the_window, round(x), round(y))
         self.trigger("move", SkEvent(event_type="move", rootx=x, rooty=y))
 
         return self
 
     def window_pos(self):
+        if self.framework == "raster":
+            return self.the_window.pos
         return glfw.get_window_pos(self.the_window)
 
     def mouse_pos(self):
+        if self.framework == "raster":
+            # Updated by the injected `_on_cursor_pos`
+            return self.mouse_x, self.mouse_y
         return glfw.get_cursor_pos(self.the_window)
 
     def mouse_root_pos(self):
@@ -1292,6 +1549,8 @@ class SkWindowBase(SkEventHandling, SkMisc):
         if attribute_name == "opacity":
             if not hasattr(self, "the_window") or not self.the_window:
                 return 1.0
+            if self.framework == "raster":
+                return self.the_window.opacity
             from glfw import get_window_opacity
 
             return get_window_opacity(self.the_window)
@@ -1315,12 +1574,18 @@ class SkWindowBase(SkEventHandling, SkMisc):
                 raise ValueError("Opacity must be a float between 0.0 and 1.0")
 
             try:
-                from glfw import set_window_opacity
+                if self.framework == "raster":
+                    self.the_window.opacity = float(opacity)
+                else:
+                    from glfw import set_window_opacity
 
-                set_window_opacity(self.the_window, float(opacity))
+                    set_window_opacity(self.the_window, float(opacity))
             except Exception as e:
                 print(f"[ERROR] Failed to set opacity: {e}")
 
+        if "gpu_resource_budget" in kwargs:
+            self.render_context.resource_budget(kwargs["gpu_resource_budget"])
+
         self.attributes.update(kwargs)
         self.trigger("configure", SkEvent(event_type="configure", widget=self))
         return self
@@ -1,17 +1,51 @@
 from __future__ import annotations as _
 
+import asyncio
+import collections
 import collections.abc
+import concurrent.futures
+import functools
+import heapq
+import inspect
+import itertools
 import re
+import sys
 import threading
 import time
 import typing
 import warnings
+import weakref
 
-# [TODO] Implementation of repeat events
 # [TODO] Fix a type error in SkEventHandling.bind()
 # [TODO] Support unbind for another widget's event
 
 
+class SkWeakTarget:
+    """A callable holding a task target by a weak reference, see `SkEventHandling.bind()`.
+
+    Bound methods are held with `weakref.WeakMethod`, so the task does not keep their object
+    alive. Calling it once the target is collected does nothing.
+    """
+
+    __slots__ = ("ref",)
+
+    def __init__(self, target: typing.Callable):
+        self.ref: weakref.ref = (
+            weakref.WeakMethod(target) if inspect.ismethod(target) else weakref.ref(target)
+        )
+
+    @property
+    def alive(self) -> bool:
+        """If the target is not collected yet."""
+        return self.ref() is not None
+
+    def __call__(self, event_obj: SkEvent) -> typing.Any:
+        target = self.ref()
+        if target is not None:
+            return target(event_obj)
+        return None
+
+
 class SkBoundTask:
     """A class to represent bound task when a event is triggered."""
 
@@ -21,6 +55,7 @@ class SkBoundTask:
         target: typing.Callable | typing.Iterable,
         multithread: bool = False,
         _keep_at_clear: bool = False,
+        weak: bool = False,
     ):
         """Each object is to represent a task bound to the event.
 
@@ -39,11 +74,38 @@ class SkBoundTask:
         :param target: A callable thing, what to do when this task is executed
         :param multithread: If this task should be executed in another thread (False by default)
         :param _keep_at_clear: If the task should be kept when cleaning the event's binding
+        :param weak: If the target(s) should be held by weak references (`SkWeakTarget`)
         """
+        if weak:
+            if callable(target):
+                target = SkWeakTarget(target)
+            else:
+                target = [SkWeakTarget(task_step) for task_step in target]
         self.id: str = id_
         self.target: typing.Callable | typing.Iterable = target
         self.multithread: bool = multithread
         self.keep_at_clear: bool = _keep_at_clear
+        self.weak: bool = weak
+
+    @property
+    def alive(self) -> bool:
+        """If the target(s) of the task are not collected, always True for strong tasks."""
+        if not self.weak:
+            return True
+        if isinstance(self.target, SkWeakTarget):
+            return self.target.alive
+        return all(task_step.alive for task_step in self.target)
+
+
+def _parse_duration(duration: str | int | float) -> float:
+    """To parse a duration like `500ms`, `1.5s` or `2` (seconds) into seconds."""
+    if isinstance(duration, str):
+        duration = duration.strip()
+        if duration.endswith("ms"):
+            return float(duration[:-2]) / 1000
+        if duration.endswith("s"):
+            return float(duration[:-1])
+    return float(duration)
 
 
 class SkDelayTask(SkBoundTask):
@@ -54,37 +116,215 @@ class SkDelayTask(SkBoundTask):
     ):
         """Inherited from SkBoundTask, used to store tasks bound to `delay` events.
 
-        :param delay: Time to delay, in seconds, indicating how log to wait before the task is
-                      executed.
+        :param delay: Time to delay, in seconds (or `ms`/`s` suffixed), indicating how log to wait
+                      before the task is executed.
         :param (Other): See `SkBoundTask.__init__()`
         """
         SkBoundTask.__init__(self, id_, target, *args, **kwargs)  # For other things,same as
         # SkBoundTask
-        if delay_.endswith("s"):
-            if delay_.endswith("ms"):
-                delay_ = float(delay_[:-2]) / 1000
-            else:
-                delay_ = float(delay_[:-1])
-        else:
-            delay_ = float(delay_)
-        self.target_time = float(time.time()) + delay_  # To store when to execute the task
+        # To store when to execute the task, in `SkTimerScheduler.clock()` time
+        self.target_time = SkTimerScheduler.clock() + _parse_duration(delay_)
 
 
 class SkRepeatTask(SkBoundTask):
     """A class to represent repeat tasks"""
 
-    def __init__(self, id_: str, target: typing.Callable, interval, *args, **kwargs):
+    def __init__(
+        self, id_: str, target: typing.Callable | typing.Iterable, interval: str, *args, **kwargs
+    ):
         """Inherited from SkBoundTask, used to store tasks bound to `repeat` events.
 
-        :param delay: Time to delay, in seconds, indicating how log to wait before the task is
-                      executed.
+        :param interval: Interval of the task, in seconds (or `ms`/`s` suffixed)
+        :param (Other): See `SkBoundTask.__init__()`
         """
         SkBoundTask.__init__(self, id_, target, *args, **kwargs)  # For other things,same as
         # SkBoundTask
-        self.target_time = float(time.time()) + interval  # To store when to execute the task for
-        # the next time, will be accumulated after
+        self.interval = _parse_duration(interval)  # Interval of the task
+        if self.interval <= 0:
+            raise ValueError(f"Interval of repeat task {id_} must be positive")
+        # To store when to execute the task for the next time, will be accumulated after
         # execution of the task
-        self.interval = interval  # Interval of the task
+        self.target_time = SkTimerScheduler.clock() + self.interval
+
+
+class SkTimerScheduler:
+    """A class to run the delay and repeat tasks of every SkEventHandling object.
+
+    Tasks are kept in a min-heap ordered by their target time on a monotonic clock, so adding a
+    task costs O(log n) and the event loop only looks at the top of the heap. Unbinding a task
+    marks its heap entry as cancelled, the entry is dropped once it reaches the top.
+
+    Example
+    -------
+    This is mostly for internal use of suzaku, the event loop runs the due tasks and sleeps until
+    `time_until_next()`.
+    .. code-block:: python
+        SkEventHandling.timers.run_due()
+    """
+
+    clock: typing.Callable[[], float] = staticmethod(time.monotonic)
+
+    def __init__(self):
+        # Heap entries: [target_time, sequence, owner, task], task is None if cancelled
+        self._heap: list[list] = []
+        self._entries: dict[int, list] = {}  # id(task) -> heap entry
+        self._sequence = itertools.count()  # Keeps tasks with the same target time in order
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def schedule(self, owner: SkEventHandling, task: SkDelayTask | SkRepeatTask) -> None:
+        """To add a task to the heap at its target time (rescheduling it if already added).
+
+        :param owner: The object the task is bound to
+        :param task: The delay or repeat task
+        """
+        self.cancel(task)
+        entry = [task.target_time, next(self._sequence), owner, task]
+        self._entries[id(task)] = entry
+        heapq.heappush(self._heap, entry)
+
+    def cancel(self, task: SkBoundTask) -> bool:
+        """To cancel a scheduled task.
+
+        :param task: The delay or repeat task
+        :return: If the task was scheduled
+        """
+        entry = self._entries.pop(id(task), None)
+        if entry is None:
+            return False
+        entry[2] = entry[3] = None  # Do not keep the owner alive until the entry is popped
+        # Rebuild the heap if it is mostly made of cancelled entries
+        if len(self._heap) > 64 and len(self._entries) * 2 < len(self._heap):
+            self._heap = [entry for entry in self._heap if entry[-1] is not None]
+            heapq.heapify(self._heap)
+        return True
+
+    def next_deadline(self) -> float | None:
+        """To get the target time of the earliest task.
+
+        :return: Target time in `clock()` time, None if no task is scheduled
+        """
+        heap = self._heap
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def time_until_next(self) -> float | None:
+        """To get how long until the earliest task is due.
+
+        :return: Seconds (0 if already due), None if no task is scheduled
+        """
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self.clock())
+
+    def run_due(self) -> int:
+        """To execute every task whose target time has passed.
+
+        Repeat tasks are rescheduled one interval later, ticks missed while the loop was busy are
+        skipped instead of being executed in a burst.
+
+        :return: Number of executed tasks
+        """
+        now = self.clock()
+        heap = self._heap
+        count = 0
+        while heap and heap[0][0] <= now:
+            target_time, _, owner, task = heapq.heappop(heap)
+            if task is None:
+                continue
+            del self._entries[id(task)]
+            if isinstance(task, SkRepeatTask):
+                task.target_time = target_time + task.interval
+                if task.target_time <= now:
+                    task.target_time = now + task.interval
+                # Rescheduled before execution, so that the task may unbind itself
+                self.schedule(owner, task)
+                event_type = "repeat"
+            else:
+                event_type = "delay"
+            owner.execute_task(task, SkEvent(widget=owner, event_type=event_type))
+            count += 1
+        return count
+
+
+class SkEventKey:
+    """A class to represent a parsed event type string, e.g. `mouse_press[b1]`.
+
+    Keys are interned: `SkEventKey.get()` parses each string once and returns the cached key
+    afterwards, so triggering an event does not parse anything. Keys with params (e.g.
+    `delay[500ms]`) can be made up endlessly, only the `param_cache_size` most recently used
+    ones are kept.
+
+    Example
+    -------
+    .. code-block:: python
+        key = SkEventKey.get("mouse_press[b1]")
+        key.type  # "mouse_press"
+        key.params  # ("b1",)
+        key.targets  # ("mouse_press", "mouse_press[b1]")
+    """
+
+    __slots__ = ("key", "type", "params", "targets", "phase_targets")
+
+    _PATTERN: re.Pattern = re.compile(r"^(.*?)\[(.*)\]$")
+    _cache: dict[str, SkEventKey] = {}  # Keys without params, one per event type
+    _param_cache: collections.OrderedDict[str, SkEventKey] = collections.OrderedDict()
+    param_cache_size: int = 256
+
+    def __init__(self, key: str, type_: str, params: tuple[str, ...]):
+        """Use `SkEventKey.get()` to get interned keys.
+
+        :param key: The event type string
+        :param type_: Type of the event, without params
+        :param params: Params in brackets
+        """
+        self.key: str = key
+        self.type: str = type_
+        self.params: tuple[str, ...] = params
+        # Keys of `SkEventHandling.tasks` a trigger is dispatched to, triggers without params
+        # also reach tasks bound to `type[*]`
+        self.targets: tuple[str, ...] = (type_, key) if params else (type_, type_ + "[*]")
+        # Targets of each routing phase, tasks of the capture/bubble phases are stored under
+        # `phase:key`, see `SkEventHandling.bind()`
+        self.phase_targets: dict[str, tuple[str, ...]] = {
+            "target": self.targets,
+            "capture": tuple(f"capture:{target}" for target in self.targets),
+            "bubble": tuple(f"bubble:{target}" for target in self.targets),
+        }
+
+    def __repr__(self) -> str:
+        return f"SkEventKey({self.key!r})"
+
+    @classmethod
+    def get(cls, event_type_str: str) -> SkEventKey:
+        """To get the interned key of an event type string.
+
+        :param event_type_str: The event type string, e.g. `delay[500ms]`
+        :return: SkEventKey
+        """
+        try:
+            return cls._cache[event_type_str]
+        except KeyError:
+            pass
+        param_cache = cls._param_cache
+        key = param_cache.get(event_type_str)
+        if key is not None:
+            param_cache.move_to_end(event_type_str)
+            return key
+        match = cls._PATTERN.match(event_type_str)
+        if match is None:
+            key = cls._cache[event_type_str] = cls(event_type_str, event_type_str, ())
+            return key
+        params = tuple(match.group(2).split(","))
+        if len(params) == 1 and params[0].strip() == "":
+            params = ()
+        key = param_cache[event_type_str] = cls(event_type_str, match.group(1), params)
+        if len(param_cache) > cls.param_cache_size:
+            param_cache.popitem(last=False)
+        return key
 
 
 class SkEventHandling:
@@ -96,53 +336,190 @@ class SkEventHandling:
     `delay[500]`
     """
 
+    # Registry of the known event types, shared by all classes, see `register_event_type()`
     # fmt: off
-    EVENT_TYPES: list[str] = [
+    EVENT_TYPES: set[str] = {
         "resize", "move", 
         "configure", "update", "redraw", 
         "mouse_move", "mouse_enter", "mouse_leave", "mouse_press", "mouse_release", "click", "double_click",
         "focus_gain", "focus_loss", 
         "key_press", "key_release", "key_repeat", "char", 
         "delay", "repeat", # This row shows special event type(s)
-    ]
+    }
     # fmt: on
-    multithread_tasks: list[tuple[SkBoundTask, SkEvent]] = []
-    WORKING_THREAD: threading.Thread
+    timers: SkTimerScheduler = SkTimerScheduler()  # Shared by all objects
+    #: Worker count of the default thread pool, None for the `ThreadPoolExecutor` default
+    max_workers: int | None = None
+    _executor: concurrent.futures.Executor | None = None  # Created on first use
+    # Callbacks queued by `call_soon()`, drained by the main loop on the UI thread
+    _ui_callbacks: collections.deque[tuple[typing.Callable, tuple]] = collections.deque()
+    _async_tasks: set[asyncio.Task] = set()  # Running coroutines of async bound tasks
     instance_count = 0
 
-    @classmethod
-    def _working_thread_loop(cls):
-        while True:
-            try:
-                SkEventHandling._execute_task(
-                    cls.multithread_tasks[0][0], cls.multithread_tasks[0][1]
-                )
-                # For line above: [0][0] is task object, [0][1] is SkEvent object
-            except Exception as e:
-                warnings.warn(
-                    RuntimeWarning(
-                        "Error in multithread suzaku-event-bound task "
-                        f"with ID {cls.multithread_tasks[0][0].id}, "
-                        f'detailed error info: "{str(e)}". '
-                        "The working thread will head to the next task "
-                        "(skipping current causing the error)."
-                    )
+    # region Executor & UI thread 线程池与UI线程
+
+    @staticmethod
+    def get_executor() -> concurrent.futures.Executor:
+        """To get the executor running multithread tasks and `run_in_executor()` functions.
+
+        :return: The executor set by `set_executor()`, a `ThreadPoolExecutor` by default
+        """
+        if SkEventHandling._executor is None:
+            SkEventHandling._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=SkEventHandling.max_workers, thread_name_prefix="suzaku-worker"
+            )
+        return SkEventHandling._executor
+
+    @staticmethod
+    def set_executor(executor: concurrent.futures.Executor | None) -> None:
+        """To set the executor running multithread tasks and `run_in_executor()` functions.
+
+        Example
+        -------
+        .. code-block:: python
+            SkEventHandling.set_executor(ProcessPoolExecutor())
+        A process pool suits CPU-bound work, the functions and their arguments must be picklable
+        (bound tasks usually are not, as their events refer to widgets).
+
+        :param executor: The executor, None to use a default thread pool again
+        """
+        SkEventHandling._executor = executor
+
+    @staticmethod
+    def shutdown_executor(wait: bool = True) -> None:
+        """To shut down the executor, pending functions are cancelled.
+
+        :param wait: Whether to wait for the running functions to finish
+        """
+        if SkEventHandling._executor is not None:
+            SkEventHandling._executor.shutdown(wait=wait, cancel_futures=True)
+            SkEventHandling._executor = None
+
+    def call_soon(self, callback: typing.Callable, *args) -> None:
+        """To run a callback on the UI thread, in the next iteration of the main loop.
+
+        This is the thread-safe way to mutate widgets from worker threads.
+
+        Example
+        -------
+        .. code-block:: python
+            def load(path):
+                text = open(path).read()  # In a worker thread
+                label.call_soon(label.set, text)  # Back on the UI thread
+
+            label.run_in_executor(load, "notes.txt")
+
+        :param callback: The callback
+        :param args: Arguments of the callback
+        """
+        SkEventHandling._ui_callbacks.append((callback, args))
+        if threading.current_thread() is not threading.main_thread():
+            from .misc import SkMisc
+
+            SkMisc.post()  # Wake up the event loop waiting for events
+
+    after_idle = call_soon
+
+    def run_in_executor(
+        self,
+        func: typing.Callable,
+        *args,
+        callback: typing.Callable[[typing.Any], typing.Any] | None = None,
+    ) -> concurrent.futures.Future:
+        """To run a function in the executor, off the UI thread.
+
+        :param func: The function
+        :param args: Arguments of the function
+        :param callback: Called with the result of the function, on the UI thread
+        :return: Future of the function
+        """
+        future = self.get_executor().submit(func, *args)
+        if callback is not None:
+            future.add_done_callback(
+                lambda future: self.call_soon(SkEventHandling._resolve_future, future, callback)
+            )
+        return future
+
+    @staticmethod
+    def _resolve_future(future: concurrent.futures.Future, callback: typing.Callable) -> None:
+        """To pass the result of a future to its callback, errors are raised on the UI thread."""
+        if not future.cancelled():
+            callback(future.result())
+
+    @staticmethod
+    def has_ui_callbacks() -> bool:
+        """To check whether callbacks are waiting for the UI thread."""
+        return bool(SkEventHandling._ui_callbacks)
+
+    @staticmethod
+    def run_ui_callbacks() -> int:
+        """To run the callbacks queued by `call_soon()`, on the UI thread.
+
+        Callbacks queued while running are left for the next call, so that a callback queueing
+        itself cannot block the main loop.
+
+        :return: Number of executed callbacks
+        """
+        callbacks = SkEventHandling._ui_callbacks
+        count = len(callbacks)
+        for _ in range(count):
+            callback, args = callbacks.popleft()
+            callback(*args)
+        return count
+
+    @staticmethod
+    def _schedule_coroutine(coroutine: typing.Coroutine, task_id: str) -> asyncio.Task:
+        """To run the coroutine of an async bound task as an asyncio task, mainly for internal use.
+
+        :raises RuntimeError: If no asyncio event loop is running (see `SkAppBase.run_async()`)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coroutine.close()
+            raise RuntimeError(
+                f"Task with ID {task_id} is a coroutine, "
+                "run the application with `run_async()` to await it"
+            ) from None
+        async_task = loop.create_task(coroutine, name=task_id)
+        # The loop only keeps weak references to its tasks
+        SkEventHandling._async_tasks.add(async_task)
+        async_task.add_done_callback(SkEventHandling._async_tasks.discard)
+        async_task.add_done_callback(
+            functools.partial(SkEventHandling._check_multithread_task, task_id)
+        )
+        return async_task
+
+    @staticmethod
+    def _check_multithread_task(task_id: str, future: concurrent.futures.Future) -> None:
+        """To report the error of a multithread or async task, mainly for internal use."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            warnings.warn(
+                RuntimeWarning(
+                    "Error in multithread/async suzaku-event-bound task "
+                    f"with ID {task_id}, "
+                    f'detailed error info: "{str(error)}".'
                 )
-            cls.multithread_tasks.pop(0)  # Executed tasks should be removed, anyway
+            )
 
-            if not cls.multithread_tasks:
-                time.sleep(0.01)  # Avoid CPU draining while no tasks avail
-                continue
+    # endregion
 
     @staticmethod
     def _execute_task(task: SkBoundTask, event_obj: SkEvent) -> None:
         """To execute the binded task directly, regardless its props, mainly for internal use."""
         match task.target:
             case _ if callable(task.target):
-                task.target(event_obj)
+                result = task.target(event_obj)
+                if inspect.iscoroutine(result):
+                    SkEventHandling._schedule_coroutine(result, task.id)
             case _ if isinstance(task.target, collections.abc.Iterable):
                 for task_step in task.target:
-                    task_step(event_obj)
+                    result = task_step(event_obj)
+                    if inspect.iscoroutine(result):
+                        SkEventHandling._schedule_coroutine(result, task.id)
             case _:
                 raise ValueError(
                     "Error type for suzaku task target! Excepted callable or "
@@ -163,16 +540,28 @@ class SkEventHandling:
         This shows subclassing SkEventHandling to let SkWidget gain the ability of handling events.
         """
         self.latest_event: SkEvent = SkEvent(widget=None, event_type="NO_EVENT")
+        # Lists of bound tasks, only for the event types that have tasks bound
         self.tasks: dict[str, list[SkBoundTask]] = {}
+        # (emitter, task) of the tasks bound to other objects for this one, see `bind()`
+        self.subscriptions: list[tuple[SkEventHandling, SkBoundTask]] | None = None
         # Make a initial ID here as it will be needed anyway even if the object does not have an ID.
         self.id = f"{self.__class__.__name__}{self.__class__.instance_count}"
-        ## Initialize tasks list
-        for event_type in self.__class__.EVENT_TYPES:
-            self.tasks[event_type] = []
         ## Accumulate instance count
         self.__class__.instance_count += 1
-        # Event binds
-        self.bind("update", self._check_delay_events, _keep_at_clear=True)  # Delay checking loop
+
+    @staticmethod
+    def register_event_type(*event_types: str) -> None:
+        """To register event types in the global registry (`EVENT_TYPES`).
+
+        Example
+        -------
+        .. code-block:: python
+            SkEventHandling.register_event_type("drop", "maximize")
+
+        :param event_types: Event types, without params
+        """
+        for event_type in event_types:
+            SkEventHandling.EVENT_TYPES.add(sys.intern(event_type))
 
     def parse_event_type_str(self, event_type_str) -> dict:
         """This function parses event type string.
@@ -180,15 +569,8 @@ class SkEventHandling:
         :param event_type_str: The event type string to be parsed
         :returns: json, parsed event type
         """
-        if not re.match(".*\\[.*\\]", event_type_str):
-            return {"type": event_type_str, "params": []}
-        event_type = re.findall("^(.*?)\\[", event_type_str)[0]
-        params_raw = re.findall("\\[(.*?)\\]$", event_type_str)[0]
-        params = params_raw.split(",")
-        if len(params) == 1:
-            if params[0].strip() == "":
-                params = []
-        return {"type": event_type, "params": params}
+        key = SkEventKey.get(event_type_str)
+        return {"type": key.type, "params": list(key.params)}
 
     def execute_task(self, task: SkBoundTask, event_obj: SkEvent | None = None):
         """To execute a task
@@ -199,6 +581,10 @@ class SkEventHandling:
             my_task = SkWidget.bind("delay[5]", lambda: print("Hello Suzaku"))
             SkWidget.execute_task(my_task)
         """
+        if task.weak and not task.alive:
+            # The target is collected, the task is dropped rather than executed
+            self.unbind(task)
+            return
         if event_obj is None:
             event_obj = SkEvent()
         assert event_obj is not None
@@ -211,19 +597,22 @@ class SkEventHandling:
             if isinstance(task, SkDelayTask):
                 self.unbind(task)
         else:
-            # Otherwise add to multithread tasks list and let the working thread to deal with it
-            # If is a delay task, should add some code to let it unbind itself, here is a way,
-            # which is absolutely not perfect, though works, to implement this mechanism, by
-            # overriding its target with a modified version
-            def self_destruct_template(task, event_obj):
-                SkEventHandling._execute_task(task, event_obj)
-                self.unbind(task)
-
+            # Otherwise run it in the executor, results should come back through `call_soon()`
+            # If is a delay task, it is unbound right away, still on the UI thread
             if isinstance(task, SkDelayTask):
-                task.target = lambda event_obj: self_destruct_template(task, event_obj)
-            SkEventHandling.multithread_tasks.append((task, event_obj))
+                self.unbind(task)
+            future = self.get_executor().submit(SkEventHandling._execute_task, task, event_obj)
+            future.add_done_callback(
+                functools.partial(SkEventHandling._check_multithread_task, task.id)
+            )
 
-    def trigger(self, event_type: str, event_obj: SkEvent | None = None) -> None:
+    def trigger(
+        self,
+        event_type: str,
+        event_obj: SkEvent | None = None,
+        phase: typing.Literal["target", "capture", "bubble"] = "target",
+        aliases: tuple[str, ...] = (),
+    ) -> None:
         """To trigger a type of event
 
         Example
@@ -238,28 +627,32 @@ class SkEventHandling:
         ability to handle events.
 
         :param event_type: The type of event to trigger
+        :param phase: Which tasks to execute, those bound for events of the object itself
+            (`target`), or those bound to see the events of descendants (`capture`/`bubble`),
+            see `SkWidget.dispatch()`
+        :param aliases: Other names of the same event, e.g. `mouse_press[b1]` for a
+            `mouse_press`, only the tasks bound to these exact names are executed for them (those
+            bound to their type were reached by `event_type`)
         """
-        # Parse event type string
-        parsed_event_type = self.parse_event_type_str(event_type)
+        key = SkEventKey.get(event_type)
         # Create a default SkEvent object if not specified
         if event_obj is None:
-            event_obj = SkEvent(widget=self, event_type=tuple(parsed_event_type.keys())[0])
+            event_obj = SkEvent(widget=self, event_type=key.type)
         # Add the event to event lists (the widget itself and the global list)
         self.latest_event = event_obj
         SkEvent.latest = event_obj
-        # Find targets
-        targets = [parsed_event_type["type"]]
-        if not parsed_event_type["params"]:
-            targets.append(parsed_event_type["type"] + "[*]")
-        else:
-            targets.append(event_type)
-        # if parsed_event_type["params"][0] in ["", "*"]: # If match all
-        #     targets.append(parsed_event_type["type"])
-        #     targets.append(parsed_event_type["type"] + "[*]")
-        for target in targets:
-            if target in self.tasks:
-                for task in self.tasks[target]:
-                    # To execute all tasks bound under this event
+        tasks = self.tasks
+        for target in key.phase_targets[phase]:
+            bound_tasks = tasks.get(target)
+            if bound_tasks:
+                # To execute all tasks bound under this event, a copy as tasks may unbind
+                # themselves
+                for task in tuple(bound_tasks):
+                    self.execute_task(task, event_obj)
+        for alias in aliases:
+            bound_tasks = tasks.get(alias if phase == "target" else f"{phase}:{alias}")
+            if bound_tasks:
+                for task in tuple(bound_tasks):
                     self.execute_task(task, event_obj)
 
     def bind(
@@ -268,6 +661,10 @@ class SkEventHandling:
         target: typing.Callable | typing.Iterable,
         multithread: bool = False,
         _keep_at_clear: bool = False,
+        *,
+        phase: typing.Literal["target", "capture", "bubble"] = "target",
+        weak: bool = False,
+        owner: SkEventHandling | None = None,
     ) -> SkBoundTask | bool:
         """To bind a task to the object when a specific type of event is triggered.
 
@@ -278,38 +675,97 @@ class SkEventHandling:
             press_down_event = my_button.bind("mouse_press", lambda _: print("Hello world!"))
         This shows binding a hello world to the button when it's press.
 
+        .. code-block
+            my_form.bind("mouse_press", lambda event: print(event.widget), phase="bubble")
+        This shows a container seeing the presses of all the widgets inside it.
+
+        .. code-block
+            self.window.bind("mouse_release", self._mouse_release, phase="capture")
+            self.window.bind("resize", lambda _: self.update_layout(), owner=self)
+        This shows a widget binding tasks to its window, both are unbound when the widget is
+        destroyed (see `unbind_subscriptions()`).
+
         :param event_type: The type of event to be bound to
         :param target: A (list of) callable thing, what to do when this task is executed
         :param multithread: If this task should be executed in another thread (False by default)
         :param _keep_at_clear: If the task should be kept when cleaning the event's binding
+        :param phase: `target` for the events of the object itself, `capture`/`bubble` for the
+            routed events of its descendants, before (from the window down) or after (back up)
+            the target, see `SkWidget.dispatch()`
+        :param weak: If the target(s) should be held by weak references, the task is dropped
+            once they are collected. Only for targets referenced elsewhere, e.g. bound methods
+        :param owner: The object the task is bound for, which unbinds it with
+            `unbind_subscriptions()`, defaults to the object of a bound method target
         :return: SkBoundTask that is bound to the task if success, otherwise False
         """
-        parsed_event_type = self.parse_event_type_str(event_type)
-        if parsed_event_type["type"] not in self.__class__.EVENT_TYPES:
+        key = SkEventKey.get(event_type)
+        if key.type not in SkEventHandling.EVENT_TYPES:
             # warnings.warn(f"Event type {event_type} is not present in {self.__class__.__name__}, "
             #                "so the task cannot be bound as expected.")
             # return False
-            self.EVENT_TYPES.append(event_type)
-        if event_type not in self.tasks:
-            self.tasks[event_type] = []
-        task_id = f"{self.id}.{event_type}.{len(self.tasks[event_type])}"
+            self.register_event_type(key.type)
+        if phase != "target":
+            if key.type in ("delay", "repeat"):
+                raise ValueError(f"{key.type} tasks cannot be bound to the {phase} phase")
+            event_type = f"{phase}:{event_type}"
+        tasks = self.tasks.get(event_type)
+        if tasks is None:
+            tasks = self.tasks[event_type] = []
+        task_id = f"{self.id}.{event_type}.{len(tasks)}"
         # e.g. SkButton114.focus_gain.514 / SkEventHandling114.focus_gain.514
-        match parsed_event_type["type"]:
+        match key.type:
             case "delay":
                 task = SkDelayTask(
                     task_id,
                     target,  # I will fix this type error later (ignore is ur type check is off)
-                    parsed_event_type["params"][0],
+                    key.params[0],
                     multithread,
                     _keep_at_clear,
+                    weak,
                 )
             case "repeat":
-                raise NotImplementedError("repeat events is not implemented yet!")
+                task = SkRepeatTask(
+                    task_id,
+                    target,
+                    key.params[0],
+                    multithread,
+                    _keep_at_clear,
+                    weak,
+                )
             case _:  # All normal event types
-                task = SkBoundTask(task_id, target, multithread, _keep_at_clear)
-        self.tasks[event_type].append(task)
+                task = SkBoundTask(task_id, target, multithread, _keep_at_clear, weak)
+        tasks.append(task)
+        if isinstance(task, (SkDelayTask, SkRepeatTask)):
+            self.timers.schedule(self, task)
+        if owner is None:
+            owner = getattr(target, "__self__", None)
+        if owner is not self and isinstance(owner, SkEventHandling):
+            # Recorded so that the owner can unbind it, e.g. when it is destroyed
+            if owner.subscriptions is None:
+                owner.subscriptions = []
+            owner.subscriptions.append((self, task))
         return task
 
+    def unbind_subscriptions(self) -> int:
+        """To unbind the tasks bound to other objects for this object (see the `owner` of
+        `bind()`).
+
+        Example
+        -------
+        .. code-block:: python
+            my_popup = SkPopup(...)  # Binds `mouse_release` to its window
+            my_popup.unbind_subscriptions()
+        This shows `my_popup` no longer receiving the mouse releases of its window.
+
+        :return: Number of unbound tasks
+        """
+        count = 0
+        if self.subscriptions:
+            for emitter, task in self.subscriptions:
+                count += emitter.unbind(task)
+        self.subscriptions = None
+        return count
+
     def find_task(self, task_id: str) -> SkBoundTask | bool:
         """To find a bound task using task ID.
 
@@ -326,7 +782,7 @@ class SkEventHandling:
         task_id_parsed = task_id.split(".")
         if len(task_id_parsed) == 2:  # If is a shortened ID (without widget indicator)
             task_id_parsed.insert(0, self.id)  # We assume that this indicates self
-        for task in self.tasks[task_id_parsed[1]]:
+        for task in self.tasks.get(task_id_parsed[1], ()):
             if task.id == task_id:
                 return task
         else:
@@ -362,16 +818,18 @@ class SkEventHandling:
                     # Still not inplemented, as we currently cannot get a SkWidget object itself
                     # only with its ID (waiting for @XiangQinxi)
                     # This part should call the unbind function of the widget with such ID
-                for task_index, task in enumerate(self.tasks[task_id_parsed[1]]):
+                for task in self.tasks.get(task_id_parsed[1], ()):
                     if task.id == target_task:
-                        self.tasks[task_id_parsed[1]].pop(task_index)
-                        return True
+                        return self.unbind(task)
                 else:
                     return False
             case SkBoundTask():
-                for event_type in self.tasks:
-                    if target_task in self.tasks[event_type]:
-                        self.tasks[event_type].remove(target_task)
+                for event_type, tasks in self.tasks.items():
+                    if target_task in tasks:
+                        tasks.remove(target_task)
+                        if not tasks:  # Keep the table compact
+                            del self.tasks[event_type]
+                        self.timers.cancel(target_task)
                         return True
                 else:
                     return False
@@ -401,45 +859,41 @@ class SkEventHandling:
         :return: Boolean, whether success or not
         """
         if event_type == "*":  # Clear all tasks of this object
-            return not False in [self.clear_bind(this_type) for this_type in self.tasks]
+            return not False in [self.clear_bind(this_type) for this_type in tuple(self.tasks)]
         else:  # In other cases, this must be an specific event type
             if event_type in self.tasks:  # If type given existed and include some tasks
-                for task in self.tasks[event_type]:
+                for task in tuple(self.tasks[event_type]):
                     if not task.keep_at_clear:  # Skip any keep_at_clear tasks
                         self.unbind(task)
                 return True
             else:
                 return False
 
-    def _check_delay_events(self, _=None) -> None:
-        """To check and execute delay events.
-
-        Example
-        -------
-        Mostly used by SkWidget.update(), which is internal use.
-
-        :param _: To accept an event object if is given, will be ignored
-        """
-        # print("Checking delayed events...")
-        for binded_event_type in tuple(self.tasks):
-            if self.parse_event_type_str(binded_event_type)["type"] == "delay":
-                for task in self.tasks[binded_event_type]:
-                    if isinstance(task, SkDelayTask):
-                        if float(time.time()) >= task.target_time:
-                            # print(f"Current time is later than target time of {task.id}, "
-                            #        "execute the task.")
-                            self.execute_task(task)
-
-
-# Initialize working thread
-SkEventHandling.WORKING_THREAD = threading.Thread(target=SkEventHandling._working_thread_loop)
-
 
-# @dataclass
 class SkEvent:
     """Used to represent an event."""
 
-    latest: SkEvent
+    # Payloads of the frequent mouse, key and scroll events are stored in slots, other items in
+    # a dict created on demand, so that high-frequency events stay small
+    FIELDS: typing.ClassVar[frozenset[str]] = frozenset(
+        (
+            "x", "y", "rootx", "rooty", "button",  # Mouse
+            "key", "keyname", "mods", "mods_key", "char",  # Keyboard
+            "x_offset", "y_offset",  # Scroll
+            "glfw_window",
+        )
+    )  # fmt: skip
+    __slots__ = (
+        "event_type",
+        "widget",
+        "window_base",
+        "window",
+        "propagation_stopped",
+        "_extra",
+        *sorted(FIELDS),
+    )
+
+    latest: typing.ClassVar[SkEvent]
 
     def __init__(
         self,
@@ -465,21 +919,51 @@ class SkEvent:
         self.widget: typing.Optional[typing.Any] = widget  # Relating widget
         self.window_base: typing.Optional[typing.Any] = None  # WindowBase of the current window
         self.window: typing.Optional[typing.Any] = None  # Current window
-        self.event_data: dict = {}
+        self.propagation_stopped: bool = False  # See `stop_propagation()`
+        self._extra: dict | None = None  # Items that are not in FIELDS
         # Not all properties above will be used
         # Update stuff from args into attributes
-        for prop in kwargs.keys():
-            if prop not in ["widget", "event_type"]:
-                self[prop] = kwargs[prop]
+        if kwargs:
+            fields = SkEvent.FIELDS
+            for prop, value in kwargs.items():
+                if prop in fields:
+                    setattr(self, prop, value)
+                else:
+                    self[prop] = value
+
+    def stop_propagation(self) -> None:
+        """To stop a routed event from reaching the next objects of its route.
+
+        The other tasks of the current object are still executed.
+        """
+        self.propagation_stopped = True
+
+    @property
+    def event_data(self) -> dict:
+        """The items of the event, as a new dict."""
+        data = {prop: getattr(self, prop) for prop in SkEvent.FIELDS if hasattr(self, prop)}
+        if self._extra:
+            data.update(self._extra)
+        return data
 
     def __setitem__(self, key: str, value: typing.Any):
-        self.event_data[key] = value
+        if key in SkEvent.FIELDS:
+            setattr(self, key, value)
+        elif key not in ("widget", "event_type"):
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
 
     def __getitem__(self, key: str) -> typing.Any:
-        if key in self.event_data:
-            return self.event_data[key]
+        if key in SkEvent.FIELDS:
+            return getattr(self, key, None)
+        elif self._extra is not None:
+            return self._extra.get(key)
         else:
             return None  # If no such item avail, returns None
 
+    def __repr__(self) -> str:
+        return f"SkEvent({self.event_type!r}, {self.event_data!r})"
+
 
 SkEvent.latest = SkEvent(widget=None, event_type="NO_EVENT")
@@ -12,6 +12,14 @@ if typing.TYPE_CHECKING:
 class SkMisc:
     window: "window.SkWindow"
 
+    @property
+    def _framework(self) -> str:
+        """The framework of the application, e.g. "glfw" or "raster"."""
+        framework = getattr(self, "framework", None)
+        if framework is None:
+            framework = self.window.framework
+        return framework
+
     def get_widget_with_id(self, widget_id: str) -> "window.SkWidget | None":
         """Get the widget with the given ID.
 
@@ -31,6 +39,14 @@ class SkMisc:
         :return: float | typing.Self: The time if value is None, otherwise self.
         """
 
+        if self._framework == "raster":
+            from .base.raster import SkRasterWindow
+
+            if value is not None:
+                SkRasterWindow.time(value)
+                return self
+            return SkRasterWindow.time()
+
         if value is not None:
             glfw.set_time(value)
             return self
@@ -84,6 +100,13 @@ class SkMisc:
         :return: str | typing.Self: The string if value is None, otherwise self.
         """
         self.window: window.SkWindow
+        if self._framework == "raster":
+            from .base.raster import SkRasterWindow
+
+            if value is not None:
+                SkRasterWindow.clipboard = value
+                return self
+            return SkRasterWindow.clipboard
         if value is not None:
             glfw.set_clipboard_string(self.window.the_window, value)
             return self
@@ -95,9 +118,15 @@ class SkMisc:
 
     @staticmethod
     def post():
-        """Post an empty event to the event queue."""
-        return
-        glfw.post_empty_event()
+        """Post an empty event to the event queue, waking up an idle event loop.
+
+        Safe to call from any thread.
+        """
+        from .base.appbase import SkAppBase
+
+        app = SkAppBase._instance
+        if app is not None and app.framework == "glfw" and app.alive:
+            glfw.post_empty_event()
 
     @staticmethod
     def mods_name(_mods, join: str = "+") -> str:
@@ -1,7 +1,7 @@
 # 处理关于样式的模块，包含颜色等
 from .color import SkColor, SkGradient, style_to_color
 from .drop_shadow import SkDropShadow
-from .font import SkFont, default_font
+from .font import SkFont, SkTextMeasureCache, default_font, text_measure_cache
 from .point import point
 from .texture import SkAcrylic  # ⛔ 暂时停止制作
 from .theme import (SkStyleNotFoundError, SkTheme, dark_theme, default_theme,
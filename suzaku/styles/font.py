@@ -1,3 +1,4 @@
+import collections
 import os
 import warnings
 from pathlib import Path
@@ -30,10 +31,18 @@ class SkFont:
         match self.default_font_retrieval_method:
             case "tkinter":
                 import platform
-                import tkinter as tk
-                import tkinter.font as tkfont
 
-                root = tk.Tk()
+                try:
+                    import tkinter as tk
+                    import tkinter.font as tkfont
+                except ImportError:  # Python built without Tk
+                    return self.font(name=None)
+
+                try:
+                    root = tk.Tk()
+                except tk.TclError:
+                    # No display, e.g. headless with the raster framework 【无显示器时使用skia默认字体】
+                    return self.font(name=None)
                 f = tkfont.nametofont("TkDefaultFont").actual().get("family")
                 root.destroy()
 
@@ -87,4 +96,72 @@ class SkFont:
         return _font
 
 
+class SkTextMeasureCache:
+    """LRU cache of text widths, shared by the widgets, keyed by (typeface id, size, text).
+
+    `SkWidget.measure_text()` measures through it, and `SkWidget.text_width()` keeps the last
+    width of each widget in front of it. The counters tell whether the caches work.
+
+    Example
+    -------
+    .. code-block:: python
+        from suzaku.styles.font import text_measure_cache
+
+        print(text_measure_cache.stats())
+
+    :param maxsize: Number of widths kept, 0 to measure every time
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize: int = maxsize
+        self._widths: collections.OrderedDict[tuple, float] = collections.OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.widget_hits: int = 0  # Served by the cache of a widget, see `SkWidget.text_width()`
+
+    def measure(self, font: skia.Font, text: str) -> float:
+        """Get the width of a text.
+
+        :param font: The font
+        :param text: The text
+        :return: Width
+        """
+        if not self.maxsize:
+            self.misses += 1
+            return font.measureText(text)
+        key = (font.getTypeface().uniqueID(), font.getSize(), font.getScaleX(), text)
+        widths = self._widths
+        width = widths.get(key)
+        if width is not None:
+            self.hits += 1
+            widths.move_to_end(key)
+            return width
+        self.misses += 1
+        width = widths[key] = font.measureText(text)
+        if len(widths) > self.maxsize:
+            widths.popitem(last=False)
+        return width
+
+    def clear(self) -> None:
+        """Forget the widths and reset the counters.
+
+        :return: None
+        """
+        self._widths.clear()
+        self.hits = self.misses = self.widget_hits = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get the counters.
+
+        :return: dict with `hits`, `misses`, `widget_hits` and `size` (widths kept)
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "widget_hits": self.widget_hits,
+            "size": len(self._widths),
+        }
+
+
 default_font = SkFont().default_font
+text_measure_cache = SkTextMeasureCache()
@@ -19,7 +19,7 @@ class SkVar(SkEventHandling):
         self.id = self.__class__.__name__ + str(self._instance + 1)
         SkVar._instance += 1
         # self.bindedtasks = {"change": {}}
-        self.EVENT_TYPES = ["change"]
+        self.register_event_type("change")
         self._value: type = default_value if default_value is not None else value_type()
         self._value_type: type = value_type
 
@@ -12,6 +12,9 @@ class SkAppWindow(SkWindow):
         is_always_update: bool = ...,
         is_get_context_on_focus: bool = ...,
         vsync: bool = ...,
+        framework: str = "glfw",
+        max_fps: float | None = None,
+        frame_budget: float | None = None,
         **kwargs,
     ) -> None:
         """Main window that connects SkApp with SkWindow."""
@@ -21,10 +24,17 @@ class SkAppWindow(SkWindow):
             if "force_hardware_acceleration" in kwargs.keys():
                 kwargs.pop("force_hardware_acceleration")
 
+        app_kwargs = {
+            "is_always_update": is_always_update,
+            "is_get_context_on_focus": is_get_context_on_focus,
+            "vsync": vsync,
+        }
         self.app = SkApp(
-            is_always_update=is_always_update,
-            is_get_context_on_focus=is_get_context_on_focus,
-            vsync=vsync,
+            # Unspecified (`...`) options keep the defaults of SkApp
+            **{key: value for key, value in app_kwargs.items() if value is not ...},
+            framework=framework,
+            max_fps=max_fps,
+            frame_budget=frame_budget,
         )
         super().__init__(parent=self.app, *args, **kwargs)
         if self.__class__._instance_count == 0:
@@ -39,6 +49,10 @@ class SkAppWindow(SkWindow):
         """Run application."""
         self.app.run(*args, **kwargs)
 
+    async def run_async(self, *args, **kwargs) -> None:
+        """Run application inside a running asyncio event loop."""
+        await self.app.run_async(*args, **kwargs)
+
     def quit(self, *args, **kwargs) -> None:
         """Exit application."""
         self.app.quit(*args, **kwargs)
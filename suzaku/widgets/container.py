@@ -1,6 +1,7 @@
 from __future__ import annotations as _
 
 import array
+import contextlib
 import typing
 
 import skia
@@ -8,6 +9,8 @@ import skia
 from ..const import Orient
 from ..event import SkEvent
 from ..misc import SkMisc
+from .flowlayout import SkFlowLayout
+from .gridlayout import SkGridLayout
 
 if typing.TYPE_CHECKING:
     from .. import SkEventHandling
@@ -51,6 +54,10 @@ class SkContainer:
     index will be drawn first, and may get covered by those with higher index. Same for layers,
     layers with higher index cover those with lower index.
 
+    With `cache_as_layer=True`, the children are rendered into an offscreen image once, which is
+    drawn instead until a descendant is invalidated. The image covers the whole content, so
+    scrolling only moves it. The images are kept in the `SkLayerCache` of the window.
+
     Example:
 
     .. code-block:: python
@@ -78,7 +85,12 @@ class SkContainer:
             self.trigger("update", SkEvent(widget=self, event_type="update"))
             self.update()
 
-    def __init__(self, allowed_out_of_bounds: bool = False, is_combo_widget: bool = False):
+    def __init__(
+        self,
+        allowed_out_of_bounds: bool = False,
+        is_combo_widget: bool = False,
+        cache_as_layer: bool = False,
+    ):
 
         # self.parent = None
         self.is_combo_widget: bool = (
@@ -105,13 +117,23 @@ class SkContainer:
         self.allowed_scrolled: bool = False
         self.scroll_speed: float | int = 18  # 滚动距离：滚动量x滚动速度
 
-        self._grid_lists = []  # [ [row1, ], [] ]
+        self._grid_layout: SkGridLayout | None = None  # See `grid_layout`
+        self._flow_layout: SkFlowLayout | None = None  # See `flow_layout`
         self._box_direction: Orient | None = None  # h(horizontal) or v(vertical)
-        self._flow_row = 0
         self.allowed_out_of_bounds = allowed_out_of_bounds  # 【是否允许组件超出容器范围】
 
+        # 【是否将子元素缓存为离屏图层】
+        self.cache_as_layer: bool = cache_as_layer
+        self._layer_dirty: bool = True
+        self._layer_key: tuple | None = None
+
+        # 【布局脏标记，见 invalidate_layout()】
+        self._layout_dirty: bool = True  # The children have to be laid out again
+        self._child_layout_dirty: bool = False  # A descendant container has to be laid out
+        self.layout_count: int = 0  # How many times the children were laid out
+
         # Events
-        self.bind("resize", lambda _: self.update_layout())
+        self.bind("resize", self._mark_layout_dirty)
 
     # endregion
 
@@ -119,7 +141,9 @@ class SkContainer:
     def bind_scroll_event(self):
         # 【容器绑定滚动事件，鼠标滚轮滚动可以滚动容器】
         self.allowed_scrolled = True
-        self.window.bind("scroll", self.scroll_event)
+        # Under the pointer, or one of its children is, see `SkWindow._scroll()`
+        self.bind("scroll", self.scroll_event)
+        self.bind("scroll", self.scroll_event, phase="bubble")
 
     def scroll_event(self, event: SkEvent) -> None:
         """【处理滚动事件】"""
@@ -165,7 +189,6 @@ class SkContainer:
         self.x_offset = min(self.x_offset + x_offset, 0)
         # 防止容器超出上边界
         self.y_offset = min(self.y_offset + y_offset, 0)
-        self.update(redraw=True)
         self.trigger("scrolled", SkEvent(self, "scrolled"))
 
     # endregion
@@ -187,7 +210,17 @@ class SkContainer:
     def remove_child(self, child):
         """Remove child widget from window.
         :param child: The child to remove"""
-        pass
+        from .app import SkApp
+
+        if child in self.children:
+            self.window.invalidate_traversal()
+            self.children.remove(child)
+            for layer in self.draw_list:
+                if child in layer:
+                    layer.remove(child)
+            # Like `add_child()`, the ancestors also list the child
+            if not isinstance(self.parent, SkApp) and hasattr(self.parent, "remove_child"):
+                self.parent.remove_child(child)
 
     def remove_all(self):
         for child in self.children:
@@ -226,8 +259,13 @@ class SkContainer:
 
     def add_layer_child(self, layer, child):
         self.draw_list[layer].append(child)
+        self.window.invalidate_traversal()
 
-        self.update_layout()
+        self._layer_dirty = True
+        if isinstance(child, SkContainer):
+            child.invalidate_layout()
+        self.invalidate_layout()
+        self.window.invalidate_rect()
 
     def add_layer1_child(self, child):
         """Add layout child widget to window.
@@ -290,6 +328,7 @@ class SkContainer:
         :return: None
         """
 
+        clipped = False
         if "SkWindow" not in SkMisc.sk_get_type(self):
             if "SkWidget" in SkMisc.sk_get_type(self):
                 typing.cast("SkWidget", self)
@@ -300,6 +339,7 @@ class SkContainer:
                 y = 0
 
             if not self.allowed_out_of_bounds:
+                clipped = True
                 canvas.save()
                 canvas.clipRect(
                     skia.Rect.MakeXYWH(
@@ -309,26 +349,167 @@ class SkContainer:
                         h=self.height,
                     )
                 )
+        if not (clipped and self.cache_as_layer and self._draw_layer(canvas)):
+            self._draw_children(canvas)
+        if clipped:
+            canvas.restore()
+
+    def _draw_children(self, canvas: skia.Canvas) -> None:
+        # Children outside the damage of the frame are skipped 【跳过不在脏区域内的子元素】
+        damage = self.window.frame_damage
         for layer in self.draw_list:
             for child in layer:
                 if child.visible:
-                    child.draw(canvas)
-        canvas.restore()
+                    if damage is None or child.is_damaged(damage):
+                        child.draw(canvas)
+
+    def _draw_layer(self, canvas: skia.Canvas) -> bool:
+        """Draw the children from the cached layer, render the layer first if needed.
+
+        :param canvas: The canvas to draw on
+        :return: False if the layer cannot be cached (too large or unsupported canvas)
+        """
+        typing.cast("SkWidget", self)
+        layers = self.window.render_context.layers
+        # The layer holds the whole content in content coordinates 【图层以内容坐标保存全部内容】
+        width = round(max(self.width, self.content_width))
+        height = round(max(self.height, self.content_height))
+        if not layers.fits(width, height):
+            layers.discard(self.id)
+            return False
+        origin_x = self.canvas_x + self.x_offset
+        origin_y = self.canvas_y + self.y_offset
+
+        key = (width, height, self.width, self.height)
+        image = layers.get(self.id)
+        if image is None or self._layer_dirty or key != self._layer_key:
+            surface = canvas.makeSurface(skia.ImageInfo.MakeN32Premul(width, height))
+            if surface is None:
+                return False
+            layer_canvas = surface.getCanvas()
+            layer_canvas.clear(skia.ColorTRANSPARENT)
+            layer_canvas.translate(-origin_x, -origin_y)
+            # Everything is drawn into the layer, whatever the damage of the frame is
+            frame_damage = self.window.frame_damage
+            self.window.frame_damage = None
+            try:
+                self._draw_children(layer_canvas)
+            finally:
+                self.window.frame_damage = frame_damage
+            image = surface.makeImageSnapshot()
+            layers.put(self.id, image)
+            self._layer_dirty = False
+            self._layer_key = key
+        canvas.drawImage(image, origin_x, origin_y)
+        return True
 
     # endregion
 
     # region layout 布局
 
+    def invalidate_layout(self, event: SkEvent | None = None) -> None:
+        """Mark the children of the container to be laid out again before the next frame.
+        【标记容器在下一帧前重新布局】
+
+        Called on layout option changes and configuration changes that may affect the size of
+        any child, which are all measured again. When only one child asks for a new size, use
+        `invalidate_child()`. The ancestors are marked too, so that `layout_if_needed()` only
+        walks down to the dirty containers.
+
+        :param event: Unused, so that it can be bound to events
+        :return: None
+        """
+        for engine in self._grid_layout, self._flow_layout:
+            if engine is not None:
+                engine.invalidate()
+        self._mark_layout_dirty()
+
+    def invalidate_child(self, child: SkWidget) -> None:
+        """Mark the container to be laid out again because a child asks for a new size.
+
+        The grid and flow layouts only measure that child again.
+
+        :param child: The child whose `dwidth` or `dheight` changed
+        :return: None
+        """
+        for engine in self._grid_layout, self._flow_layout:
+            if engine is not None:
+                engine.invalidate_cell(child)
+        self._mark_layout_dirty()
+
+    def _mark_layout_dirty(self, event: SkEvent | None = None) -> None:
+        # Resizes go straight here, the children still ask for the same sizes
+        self._layout_dirty = True
+        parent = self.parent
+        while isinstance(parent, SkContainer) and not parent._child_layout_dirty:
+            parent._child_layout_dirty = True
+            parent = parent.parent
+        self.window.need_redraw = True
+
+    def layout_if_needed(self) -> None:
+        """Lay out the dirty containers of this subtree, parents before their children.
+
+        `SkWindow` calls it once before painting a frame, a steady UI does not run any layout.
+
+        :return: None
+        """
+        if self._layout_dirty:
+            self._layout_dirty = False
+            self.layout_count += 1
+            content_size = self.content_width, self.content_height
+            self.update_scroll()
+            self._handle_layout()
+            # Auto sized parents (e.g. SkFrame) depend on the content size
+            if (self.content_width, self.content_height) != content_size and isinstance(
+                self.parent, SkContainer
+            ):
+                self.parent.invalidate_child(self)
+        if self._child_layout_dirty:
+            self._child_layout_dirty = False
+            for layer in self.draw_list:
+                for child in layer:
+                    if isinstance(child, SkContainer) and (
+                        child._layout_dirty or child._child_layout_dirty
+                    ):
+                        child.layout_if_needed()
+
     def update_layout(self, event: SkEvent | None = None):
-        """if self.allowed_scrolled and self.y_offset < 0:
-        if not self._check_scroll(0, -5):
-            self._y_offset = self.height - self.content_height
-            if self._y_offset > 0:
-                self._y_offset = 0"""
-        self.update_scroll()
-        self._handle_layout()
-        for widget in self.children:
-            widget.trigger("resize", SkEvent(widget=self, event_type="resize"))
+        """Lay out the container and its dirty descendants right away.
+
+        Most changes only need `invalidate_layout()`, which lays out once before the next frame.
+
+        :param event: Unused, so that it can be bound to events
+        :return: None
+        """
+        self._layout_dirty = True
+        self.layout_if_needed()
+
+    @contextlib.contextmanager
+    def geometry_batch(self) -> typing.Iterator[None]:
+        """Defer the position updates of the widgets moved in the block to its end.
+
+        The canvas and root positions of each moved subtree are then recomputed in one
+        traversal, and each widget whose geometry changed gets one `move` (and, with
+        `SkWidget.set_geometry()`, one `resize`) event. Batches can be nested, the outermost one
+        applies the changes. The layouts run in a batch.
+
+        Example
+        -------
+        .. code-block:: python
+            with container.geometry_batch():
+                for index, child in enumerate(container.children):
+                    child.set_geometry(0, index * 30, 100, 30)
+
+        :return: Context manager
+        """
+        window = self.window
+        window._geometry_batch += 1
+        try:
+            yield
+        finally:
+            window._geometry_batch -= 1
+            if not window._geometry_batch:
+                window._flush_geometry()
 
     def reset_content_size(self):
         self.content_width, self.content_height = 0, 0
@@ -342,118 +523,114 @@ class SkContainer:
 
         :return: None
         """
-        for layer in self.draw_list:
-            for child in layer:
-                if child.visible:
-                    match child.layout_config:
-                        case {"place": _}:
-                            pass
-                        case {"grid": _}:
-                            self.layout_names[0] = "grid"
-                            self._handle_grid()
-                            break
-                        case {"box": _}:
-                            self.layout_names[0] = "box"
-                            self._handle_box()
-                            break
-                        case {"fixed": _}:
-                            self.layout_names[2] = "fixed"
-                            self._handle_fixed(child)
-                        case {"flow": _}:
-                            self.layout_names[0] = "flow"
-                            self._handle_flow(child)
-
-    def _handle_flow(self, child):
-        pass
+        children = [child for layer in self.draw_list for child in layer]
+        geometries = [(child.x, child.y, child.width, child.height) for child in children]
+        with self.geometry_batch():
+            for layer in self.draw_list:
+                for child in layer:
+                    if child.visible:
+                        match child.layout_config:
+                            case {"place": _}:
+                                pass
+                            case {"grid": _}:
+                                self.layout_names[0] = "grid"
+                                self._handle_grid()
+                                break
+                            case {"box": _}:
+                                self.layout_names[0] = "box"
+                                self._handle_box()
+                                break
+                            case {"fixed": _}:
+                                self.layout_names[2] = "fixed"
+                                self._handle_fixed(child)
+                            case {"flow": _}:
+                                self.layout_names[0] = "flow"
+                                self._handle_flow()
+                                break
+        self._layout_changed(children, geometries)
+
+    def _layout_changed(self, children: list, geometries: list[tuple]) -> None:
+        """Handle the children moved or resized by `_handle_layout()`.
+
+        :param children: The children of the container
+        :param geometries: (x, y, width, height) of the children before the layout
+        :return: None
+        """
+        # Moved children update the hit index themselves, resized ones are checked here
+        resized = False
+        for child, (x, y, width, height) in zip(children, geometries):
+            if child.width != width or child.height != height:
+                resized = True
+                child.trigger("resize", SkEvent(widget=self, event_type="resize"))
+            elif child.x == x and child.y == y:
+                continue
+            if child.visible:
+                # Repaint where the child was and where it is now
+                child.invalidate_rect()
+        if resized:
+            self.window.hit_index.invalidate()
 
-    def _handle_pack(self):
-        pass
+    @property
+    def flow_layout(self) -> SkFlowLayout:
+        """The flow layout engine of the container, see `SkWidget.flow()`."""
+        if self._flow_layout is None:
+            self._flow_layout = SkFlowLayout(self)
+        return self._flow_layout
+
+    def _handle_flow(self):
+        self.flow_layout.arrange()
 
     def _handle_place(self):
         pass
 
-    def _handle_grid(self):
-        self.reset_content_size()
-
-        # Grid
-        row_heights: list[int | float] = []
-        col_widths: list[int | float] = []
-        grid_map = self.grid_map()
-
-        # 第一步：计算行列尺寸（包含ipadx/ipady）
-        for row, rows in enumerate(grid_map):
-            for col, widget in enumerate(rows):
-                if widget is None:
-                    continue
-                child_config = widget.layout_config["grid"]
-
-                # 解包外部padding
-                pad_left, pad_top, pad_right, pad_bottom = self.unpack_padding(
-                    child_config["padx"],
-                    child_config["pady"],
-                )
-
-                # 解包内部padding（形式相同）
-                ipad_left, ipad_top, ipad_right, ipad_bottom = self.unpack_padding(
-                    child_config["ipadx"],
-                    child_config["ipady"],
-                )
-
-                if len(col_widths) <= col:
-                    col_widths.append(0)
-                # 总宽度 = 内容宽度 + 内部padding
-                total_width = widget.dwidth + ipad_left + ipad_right + pad_left + pad_right
-                col_widths[col] = max(col_widths[col], total_width)
-
-                if len(row_heights) <= row:
-                    row_heights.append(0)
-                # 总高度 = 内容高度 + 内部padding
-                total_height = widget.dheight + ipad_top + ipad_bottom + pad_top + pad_bottom
-                row_heights[row] = max(row_heights[row], total_height)
-
-        self.content_height = total_row_height = sum(row_heights)
-        self.content_width = total_col_width = sum(col_widths)
-
-        # 第二步：定位widgets（包含ipadx/ipady）
-        for row, rows in enumerate(grid_map):
-            row_top = sum(row_heights[:row])
-            col_left = 0
-
-            for col, widget in enumerate(rows):
-                if widget is None:
-                    continue
-                child_config = widget.layout_config["grid"]
-
-                # 解包外部padding
-                pad_left, pad_top, pad_right, pad_bottom = self.unpack_padding(
-                    child_config["padx"],
-                    child_config["pady"],
-                )
-
-                # 解包内部padding
-                ipad_left, ipad_top, ipad_right, ipad_bottom = self.unpack_padding(
-                    child_config["ipadx"],
-                    child_config["ipady"],
-                )
-
-                col_width = sum(col_widths[col : col + child_config["columnspan"]])
-                row_height = sum(row_heights[row : row + child_config["rowspan"]])
+    @property
+    def grid_layout(self) -> SkGridLayout:
+        """The grid layout engine of the container, see `SkWidget.grid()`."""
+        if self._grid_layout is None:
+            self._grid_layout = SkGridLayout(self)
+        return self._grid_layout
 
-                # widget实际尺寸 = 单元格尺寸 - 外部padding - 内部padding
-                widget.width, widget.height = (
-                    col_width - pad_left - pad_right,
-                    row_height - pad_top - pad_bottom,
-                )
+    def grid_columnconfigure(
+        self,
+        index: int,
+        weight: int | float | None = None,
+        minsize: int | float | None = None,
+    ) -> typing.Self:
+        """Configure a column of the grid layout, like `grid_columnconfigure` of Tkinter.
+
+        Example
+        -------
+        .. code-block:: python
+            frame.grid_columnconfigure(1, weight=1)  # The column 1 takes the space left
+
+        :param index: Index of the column
+        :param weight: Share of the space left in the container that the column takes
+        :param minsize: Minimum width of the column
+        :return: self
+        """
+        self.grid_layout.columns.configure(index, weight=weight, minsize=minsize)
+        self.invalidate_layout()
+        return self
 
-                # widget位置 = 单元格位置 + 外部padding + 内部padding
-                widget.x, widget.y = (
-                    col_left + pad_left,
-                    row_top + pad_top,
-                )
-                widget.x += self.x_offset
-                widget.y += self.y_offset
+    def grid_rowconfigure(
+        self,
+        index: int,
+        weight: int | float | None = None,
+        minsize: int | float | None = None,
+    ) -> typing.Self:
+        """Configure a row of the grid layout, like `grid_rowconfigure` of Tkinter.
+
+        :param index: Index of the row
+        :param weight: Share of the space left in the container that the row takes
+        :param minsize: Minimum height of the row
+        :return: self
+        """
+        self.grid_layout.rows.configure(index, weight=weight, minsize=minsize)
+        self.invalidate_layout()
+        return self
 
-                col_left = widget.x + widget.width + ipad_right
+    def _handle_grid(self):
+        self.grid_layout.arrange()
 
     def _handle_box(self) -> None:
         """Process box layout.
@@ -649,12 +826,16 @@ class SkContainer:
     # region other 其他
     @property
     def visible_children(self):
+        """The visible descendants in paint order, see `SkWindow.traverse()`."""
+        if self.window is self:
+            return list(self.traverse())
         children = []
         for layer in self.draw_list:
             for child in layer:
-                children.append(child)
-                if hasattr(child, "visible_children"):
-                    children.extend(child.visible_children)
+                if child.visible:
+                    children.append(child)
+                    if hasattr(child, "visible_children"):
+                        children.extend(child.visible_children)
         return children
 
     # endregion
@@ -669,8 +850,7 @@ class SkContainer:
 
     @x_offset.setter
     def x_offset(self, value: int | float):
-        self._x_offset = value
-        self.update_layout(None)
+        self._scroll_to(value, self._y_offset)
 
     @property
     def y_offset(self) -> int | float:
@@ -681,8 +861,33 @@ class SkContainer:
 
     @y_offset.setter
     def y_offset(self, value: int | float):
-        self._y_offset = value
-        self.update_layout(None)
+        self._scroll_to(self._x_offset, value)
+
+    def _scroll_to(self, x_offset: int | float, y_offset: int | float) -> None:
+        """Set the scroll offsets, clamped to the content, and move the children with them.
+
+        The children keep their layout, the descendants move at once in the geometry store
+        instead of laying them out again, and the container is repainted.
+        """
+        previous = self._x_offset, self._y_offset
+        self._x_offset, self._y_offset = x_offset, y_offset
+        self.update_scroll()
+        dx, dy = self._x_offset - previous[0], self._y_offset - previous[1]
+        if not dx and not dy:
+            return
+        geometry = self.window.geometry
+        for child in self.children:
+            if child.parent is not self:
+                continue
+            geometry.x[child._slot] += dx
+            geometry.y[child._slot] += dy
+        slots = [child._slot for child in self.children]  # All the descendants
+        geometry.shift(slots, dx, dy)
+        self.window.hit_index.invalidate()
+        self.invalidate_rect()
+        for child in self.children:
+            if child.tasks.get("move"):
+                child.trigger("move", SkEvent(widget=child, event_type="move"))
 
     def update(self):
         self.update_layout()
@@ -0,0 +1,216 @@
+import bisect
+import typing
+
+from .gridlayout import _pair
+
+if typing.TYPE_CHECKING:
+    from .container import SkContainer
+    from .widget import SkWidget
+
+
+class SkFlowLayout:
+    """Flow layout of a container, used by `SkWidget.flow()`.
+
+    The children are placed left to right in lines, wrapped at the width of the container, e.g.
+    tag chips or thumbnail walls. The sizes asked for by the children and the line breaks are
+    cached: when a child reports a new size (`SkContainer.invalidate_child()`) or the container
+    is resized, the lines are only flowed again from the first affected one, and the lines
+    after it that keep their children are moved as a whole (or not at all).
+
+    :param container: The container
+    """
+
+    def __init__(self, container: "SkContainer") -> None:
+        self.container: "SkContainer" = container
+        self.items: list["SkWidget"] = []
+        self._index: dict["SkWidget", int] = {}
+        self._pads: list[tuple] = []  # (left, top, right, bottom) per item
+        self._ipads: list[tuple] = []  # (width, height) of the internal paddings per item
+        self._widths: list[float] = []  # Sizes asked for, with the paddings
+        self._heights: list[float] = []
+        # Lines: index of their first item, their width, height and top
+        self.line_starts: list[int] = []
+        self.line_widths: list[float] = []
+        self.line_heights: list[float] = []
+        self.line_tops: list[float] = []
+        self._width: float | None = None  # Width the lines were flowed for
+        self._key: list[tuple] | None = None  # Children and configs the items were built from
+        self._dirty_cells: set["SkWidget"] = set()
+        self.measure_count: int = 0  # Items measured, for benchmarks
+        self.flow_count: int = 0  # Lines flowed, for benchmarks
+
+    def invalidate(self) -> None:
+        """Measure all the items and flow all the lines again at the next layout.
+
+        :return: None
+        """
+        self._key = None
+
+    def invalidate_cell(self, widget: "SkWidget") -> None:
+        """Measure an item again at the next layout.
+
+        :param widget: The child whose size changed
+        :return: None
+        """
+        self._dirty_cells.add(widget)
+
+    def line_of(self, index: int) -> int:
+        """Get the line of an item.
+
+        :param index: Index of the item
+        :return: Index of the line
+        """
+        return bisect.bisect_right(self.line_starts, index) - 1
+
+    def _measure(self, index: int) -> bool:
+        widget = self.items[index]
+        pad_left, pad_top, pad_right, pad_bottom = self._pads[index]
+        ipad_width, ipad_height = self._ipads[index]
+        width = widget.dwidth + ipad_width + pad_left + pad_right
+        height = widget.dheight + ipad_height + pad_top + pad_bottom
+        changed = width != self._widths[index] or height != self._heights[index]
+        self._widths[index] = width
+        self._heights[index] = height
+        return changed
+
+    def _rebuild(self, children: typing.Iterable["SkWidget"]) -> None:
+        self.items = list(children)
+        self._index = {widget: index for index, widget in enumerate(self.items)}
+        self._pads = []
+        self._ipads = []
+        for widget in self.items:
+            config = widget.layout_config["flow"]
+            pad_left, pad_right = _pair(config["padx"])
+            pad_top, pad_bottom = _pair(config["pady"])
+            self._pads.append((pad_left, pad_top, pad_right, pad_bottom))
+            self._ipads.append((sum(_pair(config["ipadx"])), sum(_pair(config["ipady"]))))
+        self._widths = [0] * len(self.items)
+        self._heights = [0] * len(self.items)
+        for index in range(len(self.items)):
+            self._measure(index)
+        self.measure_count += len(self.items)
+
+    def _first_broken_line(self, width: float) -> int | None:
+        # First line whose break changes at a new width, None if none does
+        starts, widths = self.line_starts, self.line_widths
+        for line, start in enumerate(starts):
+            end = starts[line + 1] if line + 1 < len(starts) else len(self.items)
+            if widths[line] > width and end - start > 1:
+                return line
+            if end < len(self.items) and widths[line] + self._widths[end] <= width:
+                return line
+        return None
+
+    def arrange(self) -> None:
+        """Lay out the children of the container using the flow layout.
+
+        :return: None
+        """
+        container = self.container
+        children = dict.fromkeys(
+            child
+            for child in container.draw_list[0]
+            if child.visible and "flow" in child.layout_config
+        )
+        key = [(child, id(child.layout_config["flow"])) for child in children]
+        width = container.width
+        first_line: int | None = None
+        last_dirty = -1  # Last item measured with a new size
+        if key != self._key:
+            self._key = key
+            self._rebuild(children)
+            self.line_starts, self.line_widths, self.line_heights, self.line_tops = [], [], [], []
+            first_line, last_dirty = 0, len(self.items) - 1
+        else:
+            for widget in self._dirty_cells:
+                index = self._index.get(widget)
+                if index is not None:
+                    self.measure_count += 1
+                    if self._measure(index):
+                        last_dirty = max(last_dirty, index)
+                        line = self.line_of(index)
+                        if line > 0 and self.line_starts[line] == index:
+                            line -= 1  # It may fit at the end of the previous line now
+                        first_line = line if first_line is None else min(first_line, line)
+            if width != self._width:
+                broken = self._first_broken_line(width)
+                if broken is not None:
+                    first_line = broken if first_line is None else min(first_line, broken)
+                    last_dirty = len(self.items) - 1  # Lines can not be reused at a new width
+        self._dirty_cells.clear()
+        self._width = width
+
+        if first_line is not None and self.items:
+            self._flow(first_line, last_dirty, width)
+        container.content_width = max(self.line_widths, default=0)
+        container.content_height = (
+            self.line_tops[-1] + self.line_heights[-1] if self.line_tops else 0
+        )
+
+    def _flow(self, first_line: int, last_dirty: int, width: float) -> None:
+        """Break the items in lines again from a line, and place them.
+
+        :param first_line: First line to flow again
+        :param last_dirty: The lines starting after this item are reused if they start at
+            the same item
+        :param width: Available width
+        :return: None
+        """
+        old_starts = self.line_starts
+        old_tops = self.line_tops
+        old_lines = {start: line for line, start in enumerate(old_starts) if line > first_line}
+        starts = old_starts[:first_line]
+        widths = self.line_widths[:first_line]
+        heights = self.line_heights[:first_line]
+        tops = old_tops[:first_line]
+        top = tops[-1] + heights[-1] if tops else 0
+        item_widths, item_heights = self._widths, self._heights
+        count = len(self.items)
+        index = old_starts[first_line] if first_line < len(old_starts) else 0
+        while index < count:
+            old_line = old_lines.get(index)
+            if old_line is not None and index > last_dirty:
+                # The rest of the lines keep their items, move them as a whole
+                delta = top - old_tops[old_line]
+                starts += old_starts[old_line:]
+                widths += self.line_widths[old_line:]
+                heights += self.line_heights[old_line:]
+                tops += [line_top + delta for line_top in old_tops[old_line:]]
+                if delta:
+                    for widget in self.items[index:]:
+                        widget.y += delta
+                break
+            end = index
+            line_width = line_height = 0
+            while end < count and (end == index or line_width + item_widths[end] <= width):
+                line_width += item_widths[end]
+                line_height = max(line_height, item_heights[end])
+                end += 1
+            self._place(index, end, top)
+            self.flow_count += 1
+            starts.append(index)
+            widths.append(line_width)
+            heights.append(line_height)
+            tops.append(top)
+            top += line_height
+            index = end
+        self.line_starts, self.line_widths, self.line_heights, self.line_tops = (
+            starts,
+            widths,
+            heights,
+            tops,
+        )
+
+    def _place(self, start: int, end: int, top: float) -> None:
+        container = self.container
+        x_offset, y_offset = container.x_offset, container.y_offset
+        left = 0
+        for index in range(start, end):
+            widget = self.items[index]
+            pad_left, pad_top, pad_right, pad_bottom = self._pads[index]
+            # The internal paddings are part of the widget 【内部padding属于组件本身】
+            widget.width = self._widths[index] - pad_left - pad_right
+            widget.height = self._heights[index] - pad_top - pad_bottom
+            widget.x = left + pad_left + x_offset
+            widget.y = top + pad_top + y_offset
+            left += self._widths[index]
@@ -15,6 +15,7 @@ class SkFrame(SkWidget, SkContainer):
     :param args:
     :param size: Default size
     :param border: Whether to draw a border
+    :param cache_as_layer: Cache the children as an offscreen layer (for static content)
     :param kwargs:
     """
 
@@ -25,11 +26,15 @@ class SkFrame(SkWidget, SkContainer):
         style: str = "SkFrame",
         allowed_out_of_bounds: bool = False,
         is_combo_widget: bool = False,
+        cache_as_layer: bool = False,
         **kwargs,
     ) -> None:
         SkWidget.__init__(self, parent, style_name=style, **kwargs)
         SkContainer.__init__(
-            self, allowed_out_of_bounds=allowed_out_of_bounds, is_combo_widget=is_combo_widget
+            self,
+            allowed_out_of_bounds=allowed_out_of_bounds,
+            is_combo_widget=is_combo_widget,
+            cache_as_layer=cache_as_layer,
         )
 
     @property
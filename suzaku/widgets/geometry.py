@@ -0,0 +1,340 @@
+import array
+import typing
+
+try:
+    import numpy
+except ImportError:  # Operations on many widgets then loop in Python 【可选依赖】
+    numpy = None
+
+if typing.TYPE_CHECKING:
+    from .widget import SkWidget
+    from .window import SkWindow
+
+#: Columns of the store and their type codes (``array`` / NumPy)
+COLUMNS: dict[str, str] = {
+    "x": "d",  # Position in the parent
+    "y": "d",
+    "width": "d",
+    "height": "d",
+    "canvas_x": "d",  # Position in the window
+    "canvas_y": "d",
+    "root_x": "d",  # Position on the screen
+    "root_y": "d",
+    "visible": "?",
+    "parent": "i",  # Slot of the parent, -1 for the window
+    "clip": "i",  # Slot of the nearest ancestor clipping the widget, -1 for the window
+}
+
+
+class SkGeometryStore:
+    """Geometry of the widgets of a window, in parallel arrays indexed by widget slot.
+
+    Each widget gets a slot when it is created. Its `x`, `y`, `width`, `height`, `canvas_*`,
+    `root_*` and `visible` properties read and write the arrays through memoryviews (e.g.
+    `store.width[slot]`), which are as fast to index as lists.
+
+    Operations on many widgets at once, moving a subtree (`shift()`), moving the window
+    (`move_window()`), and the `clipped_rects()` / `query_rect()` queries, are vectorized with
+    NumPy when it is installed, and loop in Python otherwise.
+
+    Example
+    -------
+    .. code-block:: python
+        under_selection = window.geometry.query_rect(0, 0, 200, 100)
+
+    :param window: The window
+    :param capacity: Initial number of slots, the arrays grow as needed
+    """
+
+    def __init__(self, window: "SkWindow", capacity: int = 64) -> None:
+        self.window: "SkWindow" = window
+        self.capacity: int = 0
+        self.size: int = 0  # Slots in use are below it
+        self.widgets: list["SkWidget | None"] = []  # By slot, None for the free ones
+        self._free: list[int] = []
+        self.arrays: dict[str, typing.Any] = {}  # NumPy arrays, or array.array without NumPy
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity: int) -> None:
+        old = self.capacity
+        for name, code in COLUMNS.items():
+            if numpy is not None:
+                column = numpy.zeros(capacity, dtype=code)
+            else:
+                column = array.array("B" if code == "?" else code, [0]) * capacity
+            if old:
+                column[:old] = self.arrays[name][:old]
+            self.arrays[name] = column
+            setattr(self, name, memoryview(column))
+        self.widgets.extend([None] * (capacity - old))
+        self.capacity = capacity
+
+    # region Slots 槽位
+
+    def allocate(self, widget: "SkWidget") -> int:
+        """Give the widget a slot, placed at the top left of its parent.
+
+        :param widget: The widget, its `parent` has to be set
+        :return: The slot
+        """
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self.size == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+        self.widgets[slot] = widget
+        parent = widget.parent
+        parent_slot = getattr(parent, "_slot", -1)
+        if parent_slot < 0:
+            clip = -1
+        elif parent.allowed_out_of_bounds:
+            clip = self.clip[parent_slot]
+        else:
+            clip = parent_slot
+        self.x[slot] = self.y[slot] = self.width[slot] = self.height[slot] = 0
+        self.canvas_x[slot] = parent.canvas_x
+        self.canvas_y[slot] = parent.canvas_y
+        self.root_x[slot] = parent.canvas_x + self.window.root_x
+        self.root_y[slot] = parent.canvas_y + self.window.root_y
+        self.visible[slot] = False
+        self.parent[slot] = parent_slot
+        self.clip[slot] = clip
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Free the slot of a destroyed widget.
+
+        :param slot: The slot
+        :return: None
+        """
+        self.widgets[slot] = None
+        self.visible[slot] = False
+        self.parent[slot] = self.clip[slot] = -1
+        self._free.append(slot)
+
+    def detach(self, slot: int) -> "SkDetachedGeometry":
+        """Move a widget out of the store and free its slot.
+
+        Destroyed widgets keep their last geometry this way, without holding a slot.
+
+        :param slot: The slot
+        :return: The geometry of the widget, at slot 0
+        """
+        geometry = SkDetachedGeometry(getattr(self, name)[slot] for name in COLUMNS)
+        geometry.parent[0] = geometry.clip[0] = -1
+        self.release(slot)
+        return geometry
+
+    def subtree(self, slot: int) -> typing.Sequence[int]:
+        """Get the slots of a widget and of its descendants.
+
+        :param slot: The slot of the widget
+        :return: Sequence of slots
+        """
+        size = self.size
+        parent = self.arrays["parent"][:size]
+        if numpy is not None:
+            # The last element stands for the window (parent -1), which is never in a subtree
+            member = numpy.zeros(size + 1, dtype=bool)
+            member[slot] = True
+            while True:
+                grown = member[:size] | member[parent]
+                if numpy.array_equal(grown, member[:size]):
+                    return numpy.flatnonzero(grown)
+                member[:size] = grown
+        slots = []
+        for index in range(size):
+            node = index
+            while node >= 0 and node != slot:
+                node = parent[node]
+            if node == slot:
+                slots.append(index)
+        return slots
+
+    def widgets_of(self, slots: typing.Iterable[int]) -> list["SkWidget"]:
+        """Get the widgets of slots.
+
+        :param slots: Slots
+        :return: list of widgets
+        """
+        widgets = self.widgets
+        return [widgets[slot] for slot in slots]
+
+    # endregion
+
+    # region Operations 批量操作
+
+    def shift(self, slots: typing.Sequence[int], dx: float, dy: float) -> None:
+        """Move the canvas and root positions of widgets, e.g. of a moved subtree.
+
+        :param slots: Slots of the widgets
+        :param dx: Horizontal distance
+        :param dy: Vertical distance
+        :return: None
+        """
+        arrays = self.arrays
+        if numpy is not None:
+            slots = numpy.asarray(slots, dtype=numpy.intp)
+            for name, delta in ("canvas_x", dx), ("root_x", dx), ("canvas_y", dy), ("root_y", dy):
+                if delta:
+                    arrays[name][slots] += delta
+            return
+        for slot in slots:
+            arrays["canvas_x"][slot] += dx
+            arrays["root_x"][slot] += dx
+            arrays["canvas_y"][slot] += dy
+            arrays["root_y"][slot] += dy
+
+    def move_window(self, root_x: float, root_y: float) -> None:
+        """Update the root (screen) positions of every widget after the window moved.
+
+        :param root_x: X position of the window on the screen
+        :param root_y: Y position of the window on the screen
+        :return: None
+        """
+        arrays = self.arrays
+        size = self.size
+        if numpy is not None:
+            numpy.add(arrays["canvas_x"][:size], root_x, out=arrays["root_x"][:size])
+            numpy.add(arrays["canvas_y"][:size], root_y, out=arrays["root_y"][:size])
+            return
+        for slot in range(size):
+            arrays["root_x"][slot] = arrays["canvas_x"][slot] + root_x
+            arrays["root_y"][slot] = arrays["canvas_y"][slot] + root_y
+
+    def clipped_rects(self) -> tuple[typing.Sequence, ...]:
+        """Get the visible part of every widget, as it is drawn.
+
+        The rects (in window coordinates) are clipped by the ancestors that are not
+        `allowed_out_of_bounds` and by the window. A widget is shown if it and all its ancestors
+        are visible.
+
+        :return: (left, top, right, bottom, shown), sequences indexed by slot
+        """
+        arrays = self.arrays
+        size = self.size
+        window = self.window
+        if numpy is None:
+            return self._clipped_rects_loop()
+        parent = arrays["parent"][:size]
+        clip = arrays["clip"][:size]
+        # The last element stands for the window (slot -1)
+        shown = numpy.append(arrays["visible"][:size], True)
+        while True:
+            grown = shown[:size] & shown[parent]
+            if numpy.array_equal(grown, shown[:size]):
+                break
+            shown[:size] = grown
+        left = numpy.append(arrays["canvas_x"][:size], 0.0)
+        top = numpy.append(arrays["canvas_y"][:size], 0.0)
+        right = numpy.append(left[:size] + arrays["width"][:size], window.width)
+        bottom = numpy.append(top[:size] + arrays["height"][:size], window.height)
+        own = left[:size].copy(), top[:size].copy(), right[:size].copy(), bottom[:size].copy()
+        # Clip by the clipped rect of the clipping ancestor, until the deepest ones settled
+        while True:
+            new_left = numpy.maximum(own[0], left[clip])
+            new_top = numpy.maximum(own[1], top[clip])
+            new_right = numpy.minimum(own[2], right[clip])
+            new_bottom = numpy.minimum(own[3], bottom[clip])
+            settled = (
+                numpy.array_equal(new_left, left[:size])
+                and numpy.array_equal(new_top, top[:size])
+                and numpy.array_equal(new_right, right[:size])
+                and numpy.array_equal(new_bottom, bottom[:size])
+            )
+            left[:size], top[:size], right[:size], bottom[:size] = (
+                new_left,
+                new_top,
+                new_right,
+                new_bottom,
+            )
+            if settled:
+                break
+        return left[:size], top[:size], right[:size], bottom[:size], shown[:size]
+
+    def _clipped_rects_loop(self) -> tuple[list, ...]:
+        size = self.size
+        window = self.window
+        rects: list[tuple | None] = [None] * size
+        shown: list[bool] = [False] * size
+
+        def resolve(slot: int) -> tuple:
+            if slot < 0:
+                return 0.0, 0.0, window.width, window.height, True
+            if rects[slot] is None:
+                clip_left, clip_top, clip_right, clip_bottom, _ = resolve(self.clip[slot])
+                parent_shown = self.parent[slot] < 0 or resolve(self.parent[slot])[4]
+                left, top = self.canvas_x[slot], self.canvas_y[slot]
+                rects[slot] = (
+                    max(left, clip_left),
+                    max(top, clip_top),
+                    min(left + self.width[slot], clip_right),
+                    min(top + self.height[slot], clip_bottom),
+                )
+                shown[slot] = bool(self.visible[slot]) and parent_shown
+            return *rects[slot], shown[slot]
+
+        for slot in range(size):
+            resolve(slot)
+        return (
+            [rect[0] for rect in rects],
+            [rect[1] for rect in rects],
+            [rect[2] for rect in rects],
+            [rect[3] for rect in rects],
+            shown,
+        )
+
+    def query_rect(
+        self, left: float, top: float, right: float, bottom: float
+    ) -> list["SkWidget"]:
+        """Get the shown widgets whose visible part intersects a rect, in slot order.
+
+        :param left: Left of the rect, in window coordinates
+        :param top: Top of the rect
+        :param right: Right of the rect
+        :param bottom: Bottom of the rect
+        :return: list of widgets
+        """
+        rect_left, rect_top, rect_right, rect_bottom, shown = self.clipped_rects()
+        if numpy is not None:
+            hit = (
+                shown
+                & (rect_left <= rect_right)
+                & (rect_top <= rect_bottom)
+                & (rect_left <= right)
+                & (rect_right >= left)
+                & (rect_top <= bottom)
+                & (rect_bottom >= top)
+            )
+            return self.widgets_of(numpy.flatnonzero(hit))
+        return self.widgets_of(
+            slot
+            for slot in range(self.size)
+            if shown[slot]
+            and rect_left[slot] <= rect_right[slot]
+            and rect_top[slot] <= rect_bottom[slot]
+            and rect_left[slot] <= right
+            and rect_right[slot] >= left
+            and rect_top[slot] <= bottom
+            and rect_bottom[slot] >= top
+        )
+
+    # endregion
+
+
+class SkDetachedGeometry:
+    """Last geometry of a destroyed widget, see `SkGeometryStore.detach()`.
+
+    It has the columns of a store with a single slot, 0, as one item lists, so that the
+    properties of the widget still read and write it.
+
+    :param values: Values of the columns, in the order of `COLUMNS`
+    """
+
+    __slots__ = tuple(COLUMNS)
+
+    def __init__(self, values: typing.Iterable) -> None:
+        for name, value in zip(COLUMNS, values):
+            setattr(self, name, [value])
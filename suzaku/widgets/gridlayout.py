@@ -0,0 +1,215 @@
+import itertools
+import typing
+
+if typing.TYPE_CHECKING:
+    from .container import SkContainer
+    from .widget import SkWidget
+
+
+def _pair(value: int | float | tuple | None) -> tuple[int | float, int | float]:
+    if isinstance(value, tuple):
+        return value[0] or 0, value[1] or 0
+    return value or 0, value or 0
+
+
+class _GridCell:
+    """A child of a grid, with the size it asks for."""
+
+    __slots__ = ("widget", "start", "span", "pad", "ipad", "request")
+
+    def __init__(self, widget: "SkWidget") -> None:
+        config = widget.layout_config["grid"]
+        self.widget: "SkWidget" = widget
+        self.start: tuple[int, int] = (config["column"], config["row"])
+        self.span: tuple[int, int] = (max(1, config["columnspan"]), max(1, config["rowspan"]))
+        # (before, after) paddings, per axis (0 for the columns, 1 for the rows)
+        self.pad: tuple[tuple, tuple] = (_pair(config["padx"]), _pair(config["pady"]))
+        self.ipad: tuple[tuple, tuple] = (_pair(config["ipadx"]), _pair(config["ipady"]))
+        self.request: tuple[float, float] = (0, 0)
+
+    def measure(self) -> bool:
+        """Measure the size the widget asks for, with its paddings.
+
+        :return: If it changed
+        """
+        widget = self.widget
+        pad, ipad = self.pad, self.ipad
+        request = (
+            widget.dwidth + sum(pad[0]) + sum(ipad[0]),
+            widget.dheight + sum(pad[1]) + sum(ipad[1]),
+        )
+        changed = request != self.request
+        self.request = request
+        return changed
+
+
+class _GridAxis:
+    """The columns (axis 0) or the rows (axis 1) of a grid."""
+
+    def __init__(self, axis: int) -> None:
+        self.axis: int = axis
+        self.options: dict[int, dict[str, int | float]] = {}  # See `configure()`
+        self.single: dict[int, list[_GridCell]] = {}  # Cells spanning one track, by track
+        self.spanning: list[_GridCell] = []  # Cells spanning several tracks, narrowest first
+        self.base: list[float] = []  # Track sizes asked for by `single` and `minsize`
+        self.sizes: list[float] = []
+        self.offsets: list[float] = [0]  # Prefix sums of `sizes`
+        self.natural: float = 0  # Total size before the extra space is given to the weights
+
+    def configure(self, index: int, **options: int | float | None) -> None:
+        track = self.options.setdefault(index, {})
+        track.update({name: value for name, value in options.items() if value is not None})
+
+    def rebuild(self, cells: list[_GridCell]) -> None:
+        axis = self.axis
+        self.single = {}
+        self.spanning = []
+        for cell in cells:
+            if cell.span[axis] == 1:
+                self.single.setdefault(cell.start[axis], []).append(cell)
+            else:
+                self.spanning.append(cell)
+        self.spanning.sort(key=lambda cell: cell.span[axis])
+        count = max((cell.start[axis] + cell.span[axis] for cell in cells), default=0)
+        self.base = [0] * count
+        self.update(range(count))
+
+    def update(self, tracks: typing.Iterable[int]) -> None:
+        """Compute the sizes asked for by the tracks again.
+
+        :param tracks: Indexes of the tracks
+        :return: None
+        """
+        axis = self.axis
+        for track in tracks:
+            size = self.options.get(track, {}).get("minsize", 0)
+            for cell in self.single.get(track, ()):
+                size = max(size, cell.request[axis])
+            self.base[track] = size
+
+    def solve(self, available: float) -> None:
+        """Size the tracks for the available space, and compute their offsets.
+
+        Cells spanning several tracks grow them if they do not fit, then the space left is
+        given to the tracks with a weight.
+
+        :param available: Size of the container
+        :return: None
+        """
+        axis = self.axis
+        sizes = self.base.copy()
+        for cell in self.spanning:
+            start = cell.start[axis]
+            tracks = range(start, start + cell.span[axis])
+            missing = cell.request[axis] - sum(sizes[start : tracks.stop])
+            if missing > 0:
+                self._distribute(sizes, tracks, missing)
+        self.natural = sum(sizes)
+        if available > self.natural:
+            weighted = [track for track in range(len(sizes)) if self._weight(track)]
+            if weighted:
+                self._distribute(sizes, weighted, available - self.natural)
+        self.sizes = sizes
+        self.offsets = list(itertools.accumulate(sizes, initial=0))
+
+    def _weight(self, track: int) -> int | float:
+        return self.options.get(track, {}).get("weight", 0)
+
+    def _distribute(self, sizes: list[float], tracks: typing.Sequence[int], amount: float) -> None:
+        # By weight if some tracks have one, evenly otherwise
+        weights = [self._weight(track) for track in tracks]
+        total = sum(weights)
+        if not total:
+            weights, total = [1] * len(tracks), len(tracks)
+        for track, weight in zip(tracks, weights):
+            sizes[track] += amount * weight / total
+
+
+class SkGridLayout:
+    """Grid layout of a container, used by `SkWidget.grid()`.
+
+    The sizes asked for by the cells and by the tracks (rows and columns) are cached. When a
+    child reports a new size (`SkContainer.invalidate_child()`), only that cell is measured and
+    only its tracks are computed again. Cells spanning several tracks grow them when they do not
+    fit, the space left in the container goes to the tracks with a weight
+    (`SkContainer.grid_columnconfigure()`, `SkContainer.grid_rowconfigure()`), and the offsets
+    of the tracks are prefix sums.
+
+    :param container: The container
+    """
+
+    def __init__(self, container: "SkContainer") -> None:
+        self.container: "SkContainer" = container
+        self.columns: _GridAxis = _GridAxis(0)
+        self.rows: _GridAxis = _GridAxis(1)
+        self.cells: dict["SkWidget", _GridCell] = {}
+        self._key: list[tuple] | None = None  # Children and configs the cells were built from
+        self._dirty_cells: set["SkWidget"] = set()
+        self.measure_count: int = 0  # Cells measured, for benchmarks
+
+    def invalidate(self) -> None:
+        """Measure all the cells again at the next layout.
+
+        :return: None
+        """
+        self._key = None
+
+    def invalidate_cell(self, widget: "SkWidget") -> None:
+        """Measure a cell again at the next layout.
+
+        :param widget: The child whose size changed
+        :return: None
+        """
+        self._dirty_cells.add(widget)
+
+    def arrange(self) -> None:
+        """Lay out the children of the container using the grid layout.
+
+        :return: None
+        """
+        container = self.container
+        children = dict.fromkeys(
+            child
+            for child in container.draw_list[0]
+            if child.visible and "grid" in child.layout_config
+        )
+        key = [(child, id(child.layout_config["grid"])) for child in children]
+        if key != self._key:
+            self._key = key
+            self.cells = {child: _GridCell(child) for child in children}
+            for cell in self.cells.values():
+                cell.measure()
+            self.measure_count += len(self.cells)
+            self.columns.rebuild(list(self.cells.values()))
+            self.rows.rebuild(list(self.cells.values()))
+        elif self._dirty_cells:
+            tracks: tuple[set, set] = (set(), set())
+            for widget in self._dirty_cells:
+                cell = self.cells.get(widget)
+                if cell is not None and cell.measure():
+                    for axis in (0, 1):
+                        if cell.span[axis] == 1:
+                            tracks[axis].add(cell.start[axis])
+                self.measure_count += 1
+            self.columns.update(tracks[0])
+            self.rows.update(tracks[1])
+        self._dirty_cells.clear()
+
+        columns, rows = self.columns, self.rows
+        columns.solve(container.width)
+        rows.solve(container.height)
+        container.content_width = columns.natural
+        container.content_height = rows.natural
+
+        x_offset, y_offset = container.x_offset, container.y_offset
+        for cell in self.cells.values():
+            (column, row), (columnspan, rowspan) = cell.start, cell.span
+            (pad_left, pad_right), (pad_top, pad_bottom) = cell.pad
+            left = columns.offsets[column]
+            top = rows.offsets[row]
+            widget = cell.widget
+            # The internal paddings are part of the widget 【内部padding属于组件本身】
+            widget.width = columns.offsets[column + columnspan] - left - pad_left - pad_right
+            widget.height = rows.offsets[row + rowspan] - top - pad_top - pad_bottom
+            widget.x = left + pad_left + x_offset
+            widget.y = top + pad_top + y_offset
@@ -0,0 +1,88 @@
+import math
+import typing
+
+if typing.TYPE_CHECKING:
+    from .widget import SkWidget
+    from .window import SkWindow
+
+
+class SkHitIndex:
+    """Spatial index of the widgets of a window, to find the widget under the mouse.
+
+    The visible widgets are put in the cells of a uniform grid over the window, in paint order
+    (layers, then children after their parent), with their rects clipped by the ancestors that
+    are not `allowed_out_of_bounds`, as they are drawn (`SkGeometryStore.clipped_rects()`). A
+    lookup only tests the widgets of one cell, from the topmost down.
+
+    The index is rebuilt lazily on the first lookup after `invalidate()`, which layout, scroll,
+    and structural changes (`SkWindow.invalidate_traversal()`) call.
+
+    Example
+    -------
+    .. code-block:: python
+        widget = window.hit_index.widget_at(event["x"], event["y"])
+
+    :param window: The window
+    :param cell_size: Width and height of the grid cells, in pixels
+    """
+
+    def __init__(self, window: "SkWindow", cell_size: int = 64) -> None:
+        self.window: "SkWindow" = window
+        self.cell_size: int = cell_size
+        self.dirty: bool = True
+        # (column, row) -> [(left, top, right, bottom, widget), ...] in paint order
+        self._cells: dict[tuple[int, int], list[tuple]] = {}
+        self.rebuild_count: int = 0
+
+    def invalidate(self) -> None:
+        """Mark the index to be rebuilt before the next lookup.
+
+        :return: None
+        """
+        self.dirty = True
+
+    def rebuild(self) -> None:
+        """Index the visible widgets of the window, in `SkWindow.traverse()` order.
+
+        :return: None
+        """
+        self._cells = {}
+        self.dirty = False
+        self.rebuild_count += 1
+        cells = self._cells
+        size = self.cell_size
+        # Visible parts of the widgets, clipped as they are drawn
+        lefts, tops, rights, bottoms, _ = (
+            column.tolist() if hasattr(column, "tolist") else column
+            for column in self.window.geometry.clipped_rects()
+        )
+        for widget in self.window.traverse():
+            slot = widget._slot
+            left, top, right, bottom = lefts[slot], tops[slot], rights[slot], bottoms[slot]
+            if left > right or top > bottom:
+                continue
+            entry = (left, top, right, bottom, widget)
+            for column in range(math.floor(left / size), math.floor(right / size) + 1):
+                for row in range(math.floor(top / size), math.floor(bottom / size) + 1):
+                    cell = cells.get((column, row))
+                    if cell is None:
+                        cells[(column, row)] = [entry]
+                    else:
+                        cell.append(entry)
+
+    def widget_at(self, x: float, y: float) -> "SkWidget | None":
+        """Get the topmost widget at the point.
+
+        :param x: X position in the window
+        :param y: Y position in the window
+        :return: The widget, None if there is no widget there
+        """
+        if self.dirty:
+            self.rebuild()
+        size = self.cell_size
+        cell = self._cells.get((math.floor(x / size), math.floor(y / size)))
+        if cell:
+            for left, top, right, bottom, widget in reversed(cell):
+                if left <= x <= right and top <= y <= bottom:
+                    return widget
+        return None
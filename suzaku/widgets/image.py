@@ -57,6 +57,7 @@ class SkImage(SkWidget):
             if self.image:
                 self.image.close()
             self.image: skia.Image = skia.Image.open(filename)
+            self.parent.invalidate_child(self)
         else:
             return self.path
         return self.path
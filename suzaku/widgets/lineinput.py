@@ -10,13 +10,13 @@ xxxxxx|xxxxxxx|xxxx
 
 """
 
-from typing import Self
+from typing import Hashable, Self
 
 import glfw
 import skia
 
 from .. import SkColor
-from ..event import SkEvent
+from ..event import SkEvent, SkRepeatTask
 from ..styles.color import skcolor_to_color, style_to_color
 from ..var import SkStringVar
 from .container import SkContainer
@@ -67,6 +67,7 @@ class SkLineInput(SkWidget):
         self._right = 0  # 文本右边离画布的距离
         self.cursor_visible = True  # 文本光标是否可显
         self.attributes["blink_interval"] = 500  # 闪烁间隔 (毫秒)
+        self._blink_task: SkRepeatTask | None = None  # Only bound while focused 【仅在获得焦点时绑定】
         self.textvariable = textvariable
         self.focusable = True
         self.undo_stack = []
@@ -79,11 +80,12 @@ class SkLineInput(SkWidget):
         # Event binding
         self.bind("double_click", self._double_click)
         self.bind("focus_gain", self._focus_gain)
+        self.bind("focus_loss", self._focus_loss)
         self.bind("char", self._char)
         self.bind("key_press", self._key)
         self.bind("key_repeat", self._key)
         self.bind("mouse_press[b1]", self._press)
-        self.window.bind("mouse_motion", self._motion)
+        self.bind("mouse_motion", self._motion)
         self.bind("scroll", self._scroll)
         # self.window
 
@@ -95,9 +97,9 @@ class SkLineInput(SkWidget):
         if _width <= 0:
             if not self.get():
                 if self.cget("placeholder"):
-                    _width = self.measure_text(self.cget("placeholder")) + self.ipadx * 2
+                    _width = self.text_width(self.cget("placeholder")) + self.ipadx * 2
             else:
-                _width = self.measure_text(self.get()) + self.ipadx * 2
+                _width = self.text_width(self.get()) + self.ipadx * 2
         return _width
 
     @property
@@ -141,8 +143,19 @@ class SkLineInput(SkWidget):
         【当输入框获得焦点时触发】
         :param event: SkEvent
         """
-        self.blink()
         self.cursor_visible = True
+        if self._blink_task is None:
+            self._blink_task = self.bind(f"repeat[{self.cget('blink_interval')}ms]", self.blink)
+
+    def _focus_loss(self, event: SkEvent) -> None:
+        """Triggered when the input box loses focus.
+        【当输入框失去焦点时触发】
+        :param event: SkEvent
+        """
+        if self._blink_task is not None:
+            self.unbind(self._blink_task)
+            self._blink_task = None
+        self.invalidate_rect()
 
     def _motion(self, event: SkEvent) -> None:
         """Record the `end_index` when the text is press and moved.
@@ -162,6 +175,7 @@ class SkLineInput(SkWidget):
         # 【只有在左键按下时，才记录start_index】
         self.cursor_visible = True
         self.start_index = self.end_index = self.index(event["x"])
+        self.grab_pointer()  # Keep selecting when dragged out of the input 【拖出输入框时继续选择】
         self.update(True)
 
     def _char(self, event: SkEvent):
@@ -271,7 +285,7 @@ class SkLineInput(SkWidget):
         self.update(True)
 
         if self.cget("dwidth") <= 0:
-            self.parent.update_layout()
+            self.parent.invalidate_child(self)
         return self
 
     def index(self, mouse_x: int) -> int:
@@ -602,14 +616,23 @@ class SkLineInput(SkWidget):
 
     # region Draw 绘制
 
+    def content_key(self) -> Hashable:
+        return (
+            super().content_key(),
+            self.get(),
+            self.start_index,
+            self.end_index,
+            self._cursor_index,
+            self.visible_start_index,
+            self.cursor_visible,
+        )
+
     def blink(self, event=None):
         if self.is_focus:
             self.cursor_visible = not self.cursor_visible
             # 【仅当输入框获得焦点时光标闪烁】
-            # 【如果一同执行，会导致只有最后一个输入框的光标闪烁】
-            blink_interval = self.cget("blink_interval")
-            self.bind(f"delay[{blink_interval}ms]", self.blink)
-            # self.update(True, update_event=False)
+            # Only the input box itself is repainted 【仅重绘输入框自身】
+            self.invalidate_rect()
 
     def _on_mouse_press(self, event: SkEvent):
         if self.cget("disabled"):
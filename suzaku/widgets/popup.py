@@ -13,7 +13,8 @@ class SkPopup(SkCard):
         self.bind("hide", self._hide)
 
         # 【来检查是否需要关闭改弹出菜单】
-        self.window.bind("mouse_release", self._mouse_release)
+        # Every release routed in the window passes the window in the capture phase
+        self.window.bind("mouse_release", self._mouse_release, phase="capture")
 
         self.hide()
 
@@ -5,6 +5,7 @@ import skia
 from .container import SkContainer
 from .widget import SkWidget
 from ..const import Orient
+from ..event import SkEvent
 from ..var import SkIntVar, SkFloatVar
 
 
@@ -32,10 +33,15 @@ class SkProgressBar(SkWidget):
         self.attributes["variable"]: SkFloatVar | SkIntVar = variable
         if variable:
             self.attributes["value"] = variable.get()
-            variable.bind("change", lambda _: self.configure(value=variable.get()))
+            # A bound method, so that destroy() unbinds it from the variable
+            variable.bind("change", self._on_variable_change)
         else:
             self.attributes["value"]: int | float = value
 
+    def _on_variable_change(self, event: SkEvent = None):
+        """【处理变量变化事件】"""
+        self.configure(value=self.attributes["variable"].get())
+
     def set_attribute(self, **kwargs):
         if "value" in kwargs:
             raw_value = kwargs.pop("value")
@@ -35,9 +35,11 @@ class SkSeparator(SkWidget):
         width = self.theme.get_style_attr(self.style_name, "width")
         # print(self.id, orient)
 
+        # Configured only on change, configuring damages the widget and would repaint it forever
         if orient == Orient.H:
-            self.configure(dheight=width)
-        else:
+            if self.cget("dheight") != width:
+                self.configure(dheight=width)
+        elif self.cget("dwidth") != width:
             self.configure(dwidth=width)
 
         if orient == Orient.H:
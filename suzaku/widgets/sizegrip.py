@@ -19,8 +19,8 @@ class SkSizeGrip(SkWidget):
         super().__init__(parent=parent, style_name=style, cursor=cursor, **kwargs)
 
         self.bind("mouse_press", self._mouse_press)
-        self.window.bind("mouse_motion", self._mouse_motion)
-        self.window.bind("mouse_release", self._mouse_release)
+        self.bind("mouse_motion", self._mouse_motion)
+        self.bind("mouse_release", self._mouse_release)
 
         self._x1 = None
         self._y1 = None
@@ -31,6 +31,7 @@ class SkSizeGrip(SkWidget):
             self._y1 = event["y"]
             self._width1 = self.window.width
             self._height1 = self.window.height
+            self.grab_pointer()
 
     def _mouse_motion(self, event: SkEvent):
         minwidth, minheight = self.window.wm_minsize()
@@ -31,6 +31,7 @@ class SkSlider(SkWidget):
         def record_mouse_pressing(event: SkEvent):
             self._pressing = True
             self._x1 = event["x"]
+            self.grab_pointer()
 
         def record_mouse_released(event: SkEvent):
             if self._pressing:
@@ -44,8 +45,8 @@ class SkSlider(SkWidget):
         self._pressing = False
         self.bind("mouse_motion", lambda event: self.update(True))
         self.bind("mouse_press", record_mouse_pressing)
-        self.window.bind("mouse_move", record_mouse_pos)
-        self.window.bind("mouse_release", record_mouse_released)
+        self.bind("mouse_move", record_mouse_pos)
+        self.bind("mouse_release", record_mouse_released)
 
         self.attributes["orient"]: Orient = orient
         self.attributes["tick"]: int | float | None = tick
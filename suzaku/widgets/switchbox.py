@@ -25,6 +25,7 @@ class SkSwitchBox(SkCheckBox):
         def record_mouse_pressing(event: SkEvent):
             self._pressing = True
             self._x1 = event["x"]
+            self.grab_pointer()
 
         def record_mouse_released(event: SkEvent):
             if self._pressing:
@@ -34,8 +35,8 @@ class SkSwitchBox(SkCheckBox):
         self._x1 = None
         self._pressing = False
         self.bind("mouse_press", record_mouse_pressing)
-        self.window.bind("mouse_move", record_mouse_pos)
-        self.window.bind("mouse_release", record_mouse_released)
+        self.bind("mouse_move", record_mouse_pos)
+        self.bind("mouse_release", record_mouse_released)
 
     def _on_click(self, event: SkEvent):
         center_x = self.canvas_x + self.width / 2
@@ -2,6 +2,7 @@ import typing
 
 import skia
 
+from ..event import SkEvent
 from ..styles.color import style_to_color
 from ..styles.font import default_font
 from ..var import SkStringVar
@@ -37,17 +38,24 @@ class SkText(SkWidget):
         self.attributes["font"]: skia.Font = default_font
         self.attributes["align"] = align
         self.help_parent_scroll = True
+        if textvariable:
+            textvariable.bind("change", self._text_changed, weak=True)
 
     def set(self, text: str) -> typing.Self:
         """Set the text"""
         if self.attributes["textvariable"]:
-            self.attributes["textvariable"].set(text)
+            self.attributes["textvariable"].set(text)  # Calls `_text_changed()` on change
         else:
             self.attributes["text"] = text
-        if not self.cget("dwidth") or not self.cget("dheight"):
-            self.parent.update_layout()
+            self._text_changed()
         return self
 
+    def _text_changed(self, event: SkEvent | None = None) -> None:
+        # The size of an auto sized text follows the text
+        if not self.cget("dwidth") or not self.cget("dheight"):
+            self.parent.invalidate_child(self)
+        self.invalidate_rect()
+
     def get(self) -> str:
         """Get the text"""
         if self.attributes["textvariable"]:
@@ -59,7 +67,7 @@ class SkText(SkWidget):
     def dwidth(self):
         _width = self.cget("dwidth")
         if _width <= 0:
-            _width = self.measure_text(self.get()) + self.ipadx * 2
+            _width = self.text_width(self.get()) + self.ipadx * 2
         return _width
 
     @property
@@ -71,6 +79,10 @@ class SkText(SkWidget):
 
     # region Draw
 
+    def content_key(self) -> typing.Hashable:
+        # The text may come from the textvariable
+        return super().content_key(), self.get()
+
     def draw_widget(self, canvas: skia.Canvas, rect: skia.Rect):
         canvas.save()
         canvas.clipRect(rect)
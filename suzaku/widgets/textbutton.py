@@ -59,7 +59,7 @@ class SkTextButton(SkButton, SkText):
     def dwidth(self):
         _width = self.cget("dwidth")
         if _width <= 0:
-            _width = self.measure_text(self.get()) + self.ipadx * 2
+            _width = self.text_width(self.get()) + self.ipadx * 2
         return _width
 
     @property
@@ -49,8 +49,9 @@ class SkTitleBar(SkCard):
         self.bind("double_click", self._double_click)
         self.title.bind("mouse_press", self._mouse_press)
         self.title.bind("double_click", self._double_click)
-        self.window.bind("mouse_motion", self._mouse_motion)
-        self.window.bind("mouse_release", self._mouse_release)
+        for widget in (self, self.title):
+            widget.bind("mouse_motion", self._mouse_motion)
+            widget.bind("mouse_release", self._mouse_release)
         self.window.bind("configure", self._window_configure)
 
         self._x1 = None
@@ -75,6 +76,8 @@ class SkTitleBar(SkCard):
         ) or not self.window.resizable():
             self._x1 = event["x"]
             self._y1 = event["y"]
+            # The pressed widget keeps getting the moves, so the title still gets its clicks
+            event.widget.grab_pointer()
 
     def _mouse_motion(self, event: SkEvent):
         """When the mouse is moved, move the window based on the initial position."""
@@ -1,5 +1,6 @@
+import gc
 import typing
-from functools import cache
+import weakref
 
 import skia
 
@@ -7,20 +8,25 @@ from ..event import SkEvent, SkEventHandling
 from ..misc import SkMisc
 from ..styles.color import SkGradient
 from ..styles.drop_shadow import SkDropShadow
-from ..styles.font import default_font
+from ..styles.font import default_font, text_measure_cache
 from ..styles.theme import SkStyleNotFoundError, SkTheme, default_theme
 from .appwindow import SkAppWindow
 from .draw import SkDraw
+from .geometry import SkGeometryStore
 from .window import SkWindow
 
 
 class SkWidget(SkEventHandling, SkMisc, SkDraw):
 
     _instance_count = 0
+    _live_widgets: "weakref.WeakSet[SkWidget]" = weakref.WeakSet()  # See `leak_report()`
 
     theme = default_theme
     debug = False
     debug_border = skia.ColorBLUE
+    # Record `draw_widget` into a skia.Picture and replay it while `content_key()` is unchanged
+    # 【将draw_widget录制为skia.Picture，content_key()不变时直接回放】
+    retained = False
 
     # region __init__ 初始化
 
@@ -44,6 +50,14 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         SkEventHandling.__init__(self)
 
         self.focused_redraw: bool = False
+        self._painted_rect: skia.Rect | None = None  # Damage rect of the last paint
+        self._painted_bounds: skia.Rect | None = None  # Rect of the last paint
+        self._picture: skia.Picture | None = None  # Recorded `draw_widget` in retained mode
+        self._picture_key: typing.Hashable = None
+        self._damage_outset: tuple[typing.Hashable, float] = (None, 0)
+        # Last (font, text, width) and (font, metrics) measured, see `text_width()`
+        self._measured_text: tuple[skia.Font, str, float] | None = None
+        self._measured_metrics: tuple[skia.Font, skia.FontMetrics] | None = None
         self.parent: SkWidget = parent
         self.style_name: str = style_name
 
@@ -56,9 +70,15 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
             self.application = self.window.application
         except AttributeError:
             raise AttributeError(f"Parent component is not a SkWindow-based object. {self.parent}")
+        # Geometry lives in the arrays of the window, see the properties below
+        if not hasattr(self, "_slot"):  # Once, for widgets running several base __init__
+            self._geometry: SkGeometryStore = self.window.geometry
+            self._slot: int = self._geometry.allocate(self)
         self.anti_alias = self.window.anti_alias
         self.id = self.window.id + "." + self.__class__.__name__ + str(self._instance_count + 1)
         SkWidget._instance_count += 1
+        self.destroyed: bool = False
+        SkWidget._live_widgets.add(self)
 
         # self.task = {
         #     "resize": dict(),
@@ -107,40 +127,27 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
             "disabled": disabled,
         }
 
+        self.layout_config: dict[str, dict] = {"none": {}}
+
         self.apply_theme(self.parent.theme)
         self.styles = self.theme.styles
 
         self._state = "rest"
         self._preview_state = self._state
-        # 相对于父组件的坐标
-        self._x: int | float = 0
-        self._y: int | float = 0
-        # 相对于整个画布、整个窗口（除了标题栏）的坐标
-        self._canvas_x: int | float = self.parent.x + self._x
-        self._canvas_y: int | float = self.parent.y + self._y
-        # 相对于整个屏幕的坐标
-        self._root_x: int | float = self.window.root_x
-        self._root_y: int | float = self.window.root_y
         # 鼠标坐标
         self.mouse_x = 0
         self.mouse_y = 0
         self.mouse_root_x = 0
         self.mouse_root_y = 0
 
-        self.width: int | float = 0
-        self.height: int | float = 0
-
         self.ipadx: int | float = 3
         self.ipady: int | float = 3
 
         self.focusable: bool = False
-        self.visible: bool = False
         self.help_parent_scroll: bool = (
             False  # 当鼠标放在该组件上，并且鼠标滚轮滚动、父组件支持滚动，也会滚动父组件
         )
 
-        self.layout_config: dict[str, dict] = {"none": {}}
-
         if "SkContainer" in SkMisc.sk_get_type(self.parent):
             self.parent.add_child(self)
         else:
@@ -223,30 +230,108 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
             self._on_mouse_leave(event)
 
     def _pos_update(self, event: SkEvent | None = None):
-        # 更新组件的位置
-        # 相对整个画布的坐标
-
-        @cache
-        def update_pos():
-            self._canvas_x = self.parent.canvas_x + self._x
-            self._canvas_y = self.parent.canvas_y + self._y
-            # 相对整个窗口（除了标题栏）的坐标
-            self._root_x = self.canvas_x + self.window.root_x
-            self._root_y = self.canvas_y + self.window.root_y
-
-        update_pos()
-
-        self.trigger(
-            "move",
-            SkEvent(
-                widget=self,
-                event_type="move",
-                x=self._x,
-                y=self._y,
-                rootx=self._root_x,
-                rooty=self._root_y,
-            ),
-        )
+        # 更新组件及其子组件的位置，在 geometry_batch() 中推迟到批次结束
+        if self.destroyed:
+            return  # Out of the geometry store of the window
+        if self.window.geometry_batching:
+            self.window.defer_move(self)
+        else:
+            self._update_position_tree()
+
+    def _update_position_tree(self) -> None:
+        """Recompute the canvas and root positions of the widget and of its descendants.
+
+        The subtree moves as a whole in the geometry store, a `move` event is triggered on the
+        widget and on the descendants listening to it.
+
+        :return: None
+        """
+        self._trigger_move(self._shift_position_tree(), (self,))
+
+    def _shift_position_tree(self) -> list["SkWidget"]:
+        """Move the subtree of the widget in the geometry store, without triggering events.
+
+        :return: The widgets that moved
+        """
+        geometry = self._geometry
+        slot = self._slot
+        dx = self.parent.canvas_x + geometry.x[slot] - geometry.canvas_x[slot]
+        dy = self.parent.canvas_y + geometry.y[slot] - geometry.canvas_y[slot]
+        if not dx and not dy:
+            return []
+        slots = geometry.subtree(slot) if getattr(self, "children", None) else (slot,)
+        geometry.shift(slots, dx, dy)
+        self.window.hit_index.invalidate()
+        return geometry.widgets_of(slots)
+
+    @staticmethod
+    def _trigger_move(
+        widgets: typing.Iterable["SkWidget"], moved: typing.Container["SkWidget"]
+    ) -> None:
+        """Trigger one `move` event on each moved widget and on the others listening to it.
+
+        :param widgets: The widgets whose position changed
+        :param moved: The widgets moved themselves, triggered even without `move` tasks
+        :return: None
+        """
+        for widget in widgets:
+            if widget in moved or widget.tasks.get("move"):
+                widget.trigger(
+                    "move",
+                    SkEvent(
+                        widget=widget,
+                        event_type="move",
+                        x=widget.x,
+                        y=widget.y,
+                        rootx=widget.root_x,
+                        rooty=widget.root_y,
+                    ),
+                )
+
+    def set_geometry(
+        self,
+        x: int | float | None = None,
+        y: int | float | None = None,
+        width: int | float | None = None,
+        height: int | float | None = None,
+    ) -> typing.Self:
+        """Move and resize the widget at once.
+
+        The positions of the widget and of its descendants are recomputed once, and at most one
+        `move` and one `resize` event are triggered, only if the geometry changed. Inside
+        `SkContainer.geometry_batch()` the events wait for the end of the batch.
+
+        Example
+        -------
+        .. code-block:: python
+            widget.set_geometry(10, 10, 100, 30)
+
+        :param x: X position in the parent, unchanged if None
+        :param y: Y position in the parent, unchanged if None
+        :param width: Width, unchanged if None
+        :param height: Height, unchanged if None
+        :return: self
+        """
+        if width is not None or height is not None:
+            size = self.width, self.height
+            if width is not None:
+                self.width = width
+            if height is not None:
+                self.height = height
+            if (self.width, self.height) != size:
+                if self.window.geometry_batching:
+                    self.window.defer_resize(self)
+                else:
+                    self.trigger("resize", SkEvent(widget=self.parent, event_type="resize"))
+        geometry = self._geometry
+        slot = self._slot
+        if (x is not None and x != geometry.x[slot]) or (y is not None and y != geometry.y[slot]):
+            if x is not None:
+                geometry.x[slot] = x
+            if y is not None:
+                geometry.y[slot] = y
+            self._pos_update()
+        return self
 
     def _on_mouse_release(self, event) -> None:
         if self.is_mouse_floating:
@@ -260,13 +345,85 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
             else:
                 self.click_time = time
 
+    def route(self) -> list["SkEventHandling"]:
+        """Get the ancestors of the widget through the `parent` chain, from the parent up to the
+        window.
+
+        :return: list
+        """
+        route = []
+        node = self.parent
+        window = self.window
+        while node is not None and node is not window:
+            route.append(node)
+            node = getattr(node, "parent", None)
+        route.append(window)
+        return route
+
+    def dispatch(
+        self, event_type: str, event: SkEvent, aliases: tuple[str, ...] = ()
+    ) -> SkEvent:
+        """To route an event to the widget.
+
+        The `capture` tasks of its ancestors are executed from the window down, then the tasks of
+        the widget itself, then the `bubble` tasks of its ancestors back up. Any task can stop the
+        route with `event.stop_propagation()`. Only the widgets of that route are visited.
+
+        Example
+        -------
+        .. code-block
+            form.bind("mouse_press", lambda event: print(event.widget), phase="bubble")
+            my_button.dispatch("mouse_press", SkEvent(event_type="mouse_press"))
+        This shows the form seeing a press of a button inside it.
+
+        :param event_type: The type of event to route
+        :param event: The event object, its `widget` is set to this widget
+        :param aliases: Other names of the event, routed with it, e.g. `mouse_press[b1]`, see
+            `SkEventHandling.trigger()`
+        :return: The event object
+        """
+        event.widget = self
+        route = self.route()
+        for node in reversed(route):
+            if event.propagation_stopped:
+                return event
+            node.trigger(event_type, event, "capture", aliases)
+        if event.propagation_stopped:
+            return event
+        self.trigger(event_type, event, aliases=aliases)
+        for node in route:
+            if event.propagation_stopped:
+                return event
+            node.trigger(event_type, event, "bubble", aliases)
+        return event
+
+    def grab_pointer(self) -> typing.Self:
+        """To capture the pointer, the window routes the mouse moves and the next mouse release
+        to the widget only, wherever the pointer is. Mostly used for drags.
+
+        The grab is released after the mouse release, or by `release_pointer()`.
+
+        :return: self
+        """
+        self.window.pointer_grab = self
+        return self
+
+    def release_pointer(self) -> typing.Self:
+        """To release the pointer captured by `grab_pointer()`.
+
+        :return: self
+        """
+        if self.window.pointer_grab is self:
+            self.window.pointer_grab = None
+        return self
+
     # endregion
 
     # region Draw the widget 绘制组件
 
     def update(self, redraw: bool | None = None, update_event: bool | None = True) -> None:
         if redraw:
-            self.window.need_redraw = redraw
+            self.invalidate_rect()
 
         if "SkContainer" in SkMisc.sk_get_type(self):
             from .container import SkContainer
@@ -287,13 +444,22 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         if self.width <= 0 or self.height <= 0:
             return
 
-        @cache
-        def rect(x, y, w, h):
-            return skia.Rect.MakeXYWH(x, y, w, h)
+        self.rect = skia.Rect.MakeXYWH(self.canvas_x, self.canvas_y, self.width, self.height)
 
-        self.rect = rect(self.canvas_x, self.canvas_y, self.width, self.height)
+        damage_rect = self.damage_rect()
+        if self._painted_bounds is not None and self._painted_bounds != self.rect:
+            # Moved or resized without being invalidated, repaint where it was in the next frame
+            frame_damage = self.window.frame_damage
+            for rect in self._painted_rect, damage_rect:
+                if frame_damage is not None and not frame_damage.contains(rect.roundOut()):
+                    self.window.invalidate_rect(rect)
+        self._painted_rect = damage_rect
+        self._painted_bounds = self.rect
 
-        self.draw_widget(canvas, self.rect)
+        if self.retained:
+            self.draw_widget_retained(canvas, self.rect)
+        else:
+            self.draw_widget(canvas, self.rect)
 
         if self.debug:
             canvas.drawRoundRect(
@@ -308,7 +474,6 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
             )
 
         if hasattr(self, "draw_children"):
-            self.update_layout(None)
             self.draw_children(canvas)
 
         self.trigger("redraw", SkEvent(self, "redraw"))
@@ -322,6 +487,123 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         """
         ...
 
+    def content_key(self) -> typing.Hashable:
+        """Get a cheap key of everything `draw_widget` depends on, used in retained mode.
+
+        Covers the rect, the style state, the theme and the attributes (plain values by value,
+        others such as fonts by identity), widgets drawing other state have to extend it.
+
+        :return: typing.Hashable
+        """
+        return (
+            self.rect.left(),
+            self.rect.top(),
+            self.rect.width(),
+            self.rect.height(),
+            self.get_style_selector(),
+            id(self.theme),
+            self.is_focus,
+            self.is_mouse_floating,
+            self.window.pressing_widget is self,
+            self.anti_alias,
+            tuple(
+                value if value is None or isinstance(value, str | int | float) else id(value)
+                for value in self.attributes.values()
+            ),
+        )
+
+    def draw_widget_retained(self, canvas: skia.Canvas, rect: skia.Rect) -> None:
+        """Replay the recorded `draw_widget`, re-record it when `content_key()` has changed.
+        【回放录制的draw_widget，content_key()变化时重新录制】
+
+        :param canvas: skia.Canvas
+        :param rect: skia.Rect
+        :return: None
+        """
+        key = self.content_key()
+        if self._picture is None or key != self._picture_key:
+            recorder = skia.PictureRecorder()
+            self.draw_widget(recorder.beginRecording(self.damage_rect()), rect)
+            self._picture = recorder.finishRecordingAsPicture()
+            self._picture_key = key
+        canvas.drawPicture(self._picture)
+
+    @property
+    def damage_outset(self) -> float:
+        """How far the widget paints outside its rect (border and shadow).
+        【组件绘制超出自身矩形的距离（边框与阴影）】
+        """
+        style_selector = self.get_style_selector()
+        key = (style_selector, id(self.theme))
+        if self._damage_outset[0] == key:
+            return self._damage_outset[1]
+
+        try:
+            width = self._style2(self.theme, style_selector, "width", 0)
+            bd_shadow = self._style2(self.theme, style_selector, "bd_shadow")
+        except SkStyleNotFoundError:
+            # Widgets composing their own selectors (e.g. SkCheckBox) 【自行拼接选择器的组件】
+            width = self._style2(self.theme, self.style_name, "width", 0)
+            bd_shadow = self._style2(self.theme, self.style_name, "bd_shadow")
+        outset = 1 + (width / 2 if isinstance(width, int | float) else 0)  # 1 for anti-aliasing
+        if bd_shadow:
+            dx, dy, sigma_x, sigma_y = bd_shadow[:4]
+            # A blur is visible for about 3 sigmas
+            outset += max(abs(dx) + 3 * sigma_x, abs(dy) + 3 * sigma_y)
+        self._damage_outset = (key, outset)
+        return outset
+
+    def damage_rect(self) -> skia.Rect:
+        """Get the area the widget paints on, in window coordinates.
+
+        :return: skia.Rect
+        """
+        if self.width <= 0 or self.height <= 0:
+            return skia.Rect.MakeEmpty()
+        outset = self.damage_outset
+        return skia.Rect.MakeXYWH(self.canvas_x, self.canvas_y, self.width, self.height).makeOutset(
+            outset, outset
+        )
+
+    def is_damaged(self, damage: skia.Region) -> bool:
+        """Check whether the widget has to be painted for the given damage region.
+
+        :param damage: Damage of the frame
+        :return: bool
+        """
+        if getattr(self, "allowed_out_of_bounds", False):
+            return True  # Children may paint anywhere
+        return damage.intersects(self.damage_rect().roundOut())
+
+    def invalidate_rect(self, rect: skia.Rect | None = None) -> typing.Self:
+        """Mark the widget to be repainted in the next frame.
+        【标记组件在下一帧重绘】
+
+        Only the area of the widget (and where it was painted last time) is repainted,
+        not the whole window.
+
+        :param rect: Damaged rect in window coordinates, the whole widget if None
+        :return: self
+        """
+        if rect is None:
+            if self._painted_rect is not None:
+                self.window.invalidate_rect(self._painted_rect)
+            rect = self.damage_rect()
+        self._invalidate_layers()
+        self.window.invalidate_rect(rect)
+        return self
+
+    def _invalidate_layers(self) -> None:
+        """Mark the cached layers of the ancestors as outdated (see `SkContainer.cache_as_layer`).
+
+        :return: None
+        """
+        parent = self.parent
+        while isinstance(parent, SkWidget):
+            if parent.cache_as_layer:
+                parent._layer_dirty = True
+            parent = parent.parent
+
     # endregion
 
     # region Widget attribute configs 组件属性配置
@@ -352,6 +634,7 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
             )
             self._preview_state = self._state
             self._state = state
+            self.invalidate_rect()
             return self
         else:
             return self._state
@@ -388,75 +671,210 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         _height = self.cget("dheight")
         return _height
 
+    def _layout_size(self) -> tuple[int | float, int | float] | None:
+        """Get the size the widget asks its parent layout for, None if it is not laid out."""
+        if "none" in self.layout_config:
+            return None
+        return self.dwidth, self.dheight
+
     def destroy(self) -> None:
+        """Destroy the widget and its children.
+
+        The widget is removed from its parent, the window forgets it, and every task bound to it
+        or bound to other objects for it (e.g. to its window) is unbound, so it no longer
+        receives events and can be garbage collected.
+
+        :return: None
+        """
+        if self.destroyed:
+            return
+        self.destroyed = True
+        self.trigger("destroy", SkEvent(widget=self, event_type="destroy"))
+        for child in tuple(getattr(self, "children", ())):
+            child.destroy()
+
+        window = self.window
+        if self.visible and window.alive:
+            self._invalidate_layers()
+            window.invalidate_rect(self._painted_rect)
+        self.visible = False
+        if hasattr(self.parent, "remove_child"):
+            self.parent.remove_child(self)
+        if window.focus_widget is self:
+            window.focus_widget = window
+        if window.pressing_widget is self:
+            window.pressing_widget = None
+        if window.last_entered_widget is self:
+            window.last_entered_widget = None
+        if self in window.entered_widgets:
+            window.entered_widgets.remove(self)
+        self.release_pointer()
+        if SkEvent.latest.widget is self:  # The last event, often its own `destroy`
+            SkEvent.latest = SkEvent(widget=None, event_type="NO_EVENT")
+
+        self.unbind_subscriptions()
+        for tasks in tuple(self.tasks.values()):
+            for task in tuple(tasks):
+                self.unbind(task)
         self.gradient = None
-        del self
+        # Keep the last geometry, without holding a slot of the window
+        self._geometry = self._geometry.detach(self._slot)
+        self._slot = 0
+
+    @staticmethod
+    def leak_report(collect: bool = True) -> dict[str, dict[str, typing.Any]]:
+        """Report the widgets still alive, per window.
+
+        Destroyed widgets in the report are still referenced somewhere, i.e. leaked.
+
+        Example
+        -------
+        .. code-block:: python
+            print(SkWidget.leak_report())
+            # {'SkAppWindow0': {'alive': 12, 'destroyed': 0, 'types': {'SkTextButton': 3, ...}}}
+
+        :param collect: If to run the garbage collector first
+        :return: {window id: {"alive": count, "destroyed": count, "types": {class name: count}}}
+        """
+        if collect:
+            gc.collect()
+        report = {}
+        for widget in list(SkWidget._live_widgets):
+            entry = report.setdefault(widget.window.id, {"alive": 0, "destroyed": 0, "types": {}})
+            entry["alive"] += 1
+            entry["destroyed"] += widget.destroyed
+            name = widget.__class__.__name__
+            entry["types"][name] = entry["types"].get(name, 0) + 1
+        return report
 
     @property
     def text_height(self):
-        return self.metrics.fDescent - self.metrics.fAscent
+        metrics = self.metrics
+        return metrics.fDescent - metrics.fAscent
 
     @property
     def metrics(self):
-        return self.cget("font").getMetrics()
+        font: skia.Font = self.cget("font")
+        measured = self._measured_metrics
+        if measured is None or measured[0] is not font:
+            measured = self._measured_metrics = (font, font.getMetrics())
+        return measured[1]
 
     def measure_text(self, text, *args) -> float | int:
+        """Measure the width of a text with the font of the widget.
+
+        The widths are cached in `suzaku.styles.font.text_measure_cache`, shared by the widgets.
+        """
         font: skia.Font = self.cget("font")
-        return font.measureText(str(text), *args)
+        if args:
+            return font.measureText(str(text), *args)
+        return text_measure_cache.measure(font, str(text))
+
+    def text_width(self, text: str) -> float | int:
+        """Measure the width of the text of the widget, e.g. for `dwidth`.
+
+        The last width is kept until the text or the font changes, or `invalidate_measure()`.
+
+        :param text: The text
+        :return: Width
+        """
+        font: skia.Font = self.cget("font")
+        measured = self._measured_text
+        if measured is not None and measured[0] is font and measured[1] == text:
+            text_measure_cache.widget_hits += 1
+            return measured[2]
+        width = self.measure_text(text)
+        self._measured_text = (font, text, width)
+        return width
+
+    def invalidate_measure(self) -> None:
+        """Forget the text widths and font metrics kept by the widget.
+
+        Called when the font or the theme changes, and needed after changing a font in place.
+
+        :return: None
+        """
+        self._measured_text = self._measured_metrics = None
 
     @property
-    def x(self):
-        return self._x
+    def x(self) -> float:
+        """X position in the parent 【相对于父组件的坐标】"""
+        return self._geometry.x[self._slot]
 
     @x.setter
     def x(self, value):
-        self._x = value
+        self._geometry.x[self._slot] = value
         self._pos_update()
 
     @property
-    def y(self):
-        return self._y
+    def y(self) -> float:
+        """Y position in the parent"""
+        return self._geometry.y[self._slot]
 
     @y.setter
     def y(self, value):
-        self._y = value
+        self._geometry.y[self._slot] = value
         self._pos_update()
 
     @property
-    def canvas_x(self):
-        return self._canvas_x
+    def canvas_x(self) -> float:
+        """X position in the window, setting it moves the widget 【相对于整个画布的坐标】"""
+        return self._geometry.canvas_x[self._slot]
 
     @canvas_x.setter
     def canvas_x(self, value):
-        self._canvas_x = value
-        self._pos_update()
+        self.x = value - self.parent.canvas_x
 
     @property
-    def canvas_y(self):
-        return self._canvas_y
+    def canvas_y(self) -> float:
+        """Y position in the window, setting it moves the widget"""
+        return self._geometry.canvas_y[self._slot]
 
     @canvas_y.setter
     def canvas_y(self, value):
-        self._canvas_y = value
-        self._pos_update()
+        self.y = value - self.parent.canvas_y
 
     @property
-    def root_x(self):
-        return self._root_x
+    def root_x(self) -> float:
+        """X position on the screen, setting it moves the widget 【相对于整个屏幕的坐标】"""
+        return self._geometry.root_x[self._slot]
 
     @root_x.setter
     def root_x(self, value):
-        self._root_x = value
-        self._pos_update()
+        self.canvas_x = value - self.window.root_x
 
     @property
-    def root_y(self):
-        return self._root_y
+    def root_y(self) -> float:
+        """Y position on the screen, setting it moves the widget"""
+        return self._geometry.root_y[self._slot]
 
     @root_y.setter
     def root_y(self, value):
-        self._root_y = value
-        self._pos_update()
+        self.canvas_y = value - self.window.root_y
+
+    @property
+    def width(self) -> float:
+        return self._geometry.width[self._slot]
+
+    @width.setter
+    def width(self, value):
+        self._geometry.width[self._slot] = value
+
+    @property
+    def height(self) -> float:
+        return self._geometry.height[self._slot]
+
+    @height.setter
+    def height(self, value):
+        self._geometry.height[self._slot] = value
+
+    @property
+    def visible(self) -> bool:
+        return self._geometry.visible[self._slot]
+
+    @visible.setter
+    def visible(self, value):
+        self._geometry.visible[self._slot] = value
 
     def get_attribute(self, attribute_name: str) -> typing.Any:
         """Get attribute of a widget by name.
@@ -473,8 +891,16 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         :param kwargs: attribute name and _value
         :return: self
         """
+        size = self._layout_size()
         self.attributes.update(**kwargs)
+        self._picture = None  # Objects changed in place keep their identity in `content_key()`
+        if "font" in kwargs:
+            self.invalidate_measure()
         self.trigger("configure", SkEvent(event_type="configure", widget=self))
+        if self._layout_size() != size:
+            self.parent.invalidate_child(self)
+        if self._painted_rect is not None:
+            self.invalidate_rect()
         return self
 
     configure = config = set_attribute
@@ -508,8 +934,12 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         """
         self.theme = new_theme
         self.styles = self.theme.styles
+        self._picture = None
+        self._layer_dirty = True
+        self.invalidate_measure()
         self.read_size(self.style_name)
         if hasattr(self, "children"):
+            self.invalidate_layout()  # Fonts and paddings may have changed
             child: SkWidget
             self.children: list
             for child in self.children:
@@ -527,7 +957,12 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         【将自己、有布局的子类的visible设为True】
         :return: self
         """
+        if not self.visible:
+            self.parent.invalidate_layout()
         self.visible = True
+        self._invalidate_layers()
+        self.window.invalidate_rect()
+        self.window.invalidate_traversal()
 
         if hasattr(self, "children"):
             for child in self.children:
@@ -541,7 +976,12 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
 
         :return: self
         """
+        if self.visible:
+            self.parent.invalidate_layout()
         self.visible = False
+        self._invalidate_layers()
+        self.window.invalidate_rect()
+        self.window.invalidate_traversal()
         if hasattr(self, "children"):
             for child in self.children:
                 child.visible = False
@@ -557,6 +997,7 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         for layer in self.parent.draw_list:
             if self in layer:
                 layer.remove(self)
+        self.window.invalidate_traversal()
         return self
 
     def fixed(
@@ -591,7 +1032,7 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
                     "height": height,
                 }
             )
-            self.parent.update_layout()
+            self.parent.invalidate_layout()
         else:
             self.layout_config = {
                 "fixed": {
@@ -668,24 +1109,48 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
     ):
         """Position the widget with box layout.
 
+        The directions (`n`, `s`, `w`, `e`) are the sides of `box()`.
+
         :param direction: Direction of the layout
         :param padx: Paddings on x direction
         :param pady: Paddings on y direction
         :param expand: Whether to expand the widget
         :return: self
         """
+        side = {"n": "top", "s": "bottom", "w": "left", "e": "right"}[direction]
+        return self.box(side=side, padx=padx, pady=pady, expand=expand)
 
-        self.show()
-        self.layout_config = {
-            "pack": {
-                "direction": direction,
-                "padx": padx,
-                "pady": pady,
-                "expand": expand,
-            }
-        }
-        self.parent.add_layer1_child(self)
+    def flow(
+        self,
+        padx: int | float | tuple[int | float, int | float] = 5,
+        pady: int | float | tuple[int | float, int | float] = 5,
+        ipadx: int | float | tuple[int | float, int | float] | None = 0,
+        ipady: int | float | tuple[int | float, int | float] | None = 0,
+    ):
+        """Position the widget with flow layout: left to right, in lines wrapped at the width of
+        the parent, e.g. tags or thumbnails.
+
+        Example
+        -------
+        .. code-block:: python
+            for tag in tags:
+                SkTextButton(frame, text=tag).flow()
 
+        :param padx: Paddings on x direction
+        :param pady: Paddings on y direction
+        :param ipadx: Internal paddings on x direction
+        :param ipady: Internal paddings on y direction
+        :return: self
+        """
+
+        self.show()
+        config = {"padx": padx, "pady": pady, "ipadx": ipadx, "ipady": ipady}
+        if self.layout_config.get("flow"):
+            self.layout_config["flow"].update(config)
+            self.parent.invalidate_layout()
+        else:
+            self.layout_config = {"flow": config}
+            self.parent.add_layer1_child(self)
         return self
 
     def box(
@@ -720,6 +1185,7 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
                     "expand": expand,
                 }
             )
+            self.parent.invalidate_layout()
         else:
             self.layout_config = {
                 "box": {
@@ -748,12 +1214,16 @@ class SkWidget(SkEventHandling, SkMisc, SkDraw):
         """
         if self.focusable and not self.cget("disabled"):
             if not self.is_focus:
-                self.window.focus_get().trigger("focus_loss", SkEvent(event_type="focus_loss"))
-                self.window.focus_get().is_focus = False
+                previous = self.window.focus_get()
+                previous.trigger("focus_loss", SkEvent(event_type="focus_loss"))
+                previous.is_focus = False
+                if previous is not self.window:
+                    previous.invalidate_rect()  # Without its focus style
                 self.window.focus_widget = self
                 self.is_focus = True
 
                 self.trigger("focus_gain", SkEvent(event_type="focus_gain"))
+                self.invalidate_rect()
 
     def focus_get(self) -> None:
         """
@@ -14,6 +14,8 @@ from ..styles.theme import SkTheme, default_theme
 from .app import SkApp
 from .container import SkContainer
 from .draw import SkDraw
+from .geometry import SkGeometryStore
+from .hitindex import SkHitIndex
 
 
 class SkWindow(SkWindowBase, SkContainer, SkDraw):
@@ -35,8 +37,16 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
         :param theme: Theme
         :param kwargs: SkWindowBase Kwargs
         """
+        self.geometry: SkGeometryStore = SkGeometryStore(self)  # Geometry of the widgets
+        self.hit_index: SkHitIndex = SkHitIndex(self)  # Finds the widget under the mouse
+        self._traversal: tuple[SkWidget, ...] | None = None  # Cache of `traverse()`
+        # Widgets moved and resized in `geometry_batch()`, ordered sets 【批量几何修改】
+        self._geometry_batch: int = 0
+        self._moved_widgets: dict["SkWidget", None] = {}
+        self._resized_widgets: dict["SkWidget", None] = {}
         SkWindowBase.__init__(self, parent=parent, *args, size=size, **kwargs)
         SkContainer.__init__(self)
+        self.window: SkWindow = self
 
         self.theme: SkTheme | None = None
         self.styles: dict | None = None
@@ -55,7 +65,6 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
         self.focus_widget = self
         self.draws: list[typing.Callable] = []
 
-        self.window: SkWindow = self
         self._anti_alias: bool = anti_alias
 
         # self.previous_widget = None
@@ -63,6 +72,7 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
 
         self.entered_widgets = []
         self.pressing_widget: SkWidget | None = None
+        self.pointer_grab: SkWidget | None = None  # See `SkWidget.grab_pointer()`
         self.last_entered_widget: SkWidget | None = None
 
         self._x1 = None
@@ -87,14 +97,29 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
         self.bind("scroll", self._scroll)
 
         self.bind("resize", self._resize)
+        self.bind("move", self._move)
 
     # endregion
 
     # region Theme related 主题相关
 
     def _resize(self, event: SkEvent = None) -> None:
-        if hasattr(self, "update_layout"):
-            self.update_layout()
+        self._mark_layout_dirty()
+
+    def _move(self, event: SkEvent = None) -> None:
+        self.geometry.move_window(self.root_x, self.root_y)
+
+    def layout_if_needed(self) -> None:
+        """Lay out the dirty containers of the window, called before painting a frame.
+
+        :return: None
+        """
+        # Laying out a container may dirty its ancestors again (content size, resized
+        # children), which settles in a few passes
+        for _ in range(8):
+            if not (self._layout_dirty or self._child_layout_dirty):
+                break
+            super().layout_if_needed()
 
     @property
     def anti_alias(self) -> bool:
@@ -117,6 +142,7 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
         for child in self.children:
             child.apply_theme(new_theme)
 
+        self.invalidate_layout()
         self.update(True)
 
     # endregion
@@ -129,8 +155,12 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
             self.parent.remove_child(self)
 
     def _scroll(self, event: SkEvent) -> None:
-        if self.focus_get() is not self:
+        widget = self.last_entered_widget
+        if self.focus_get() is not self and self.focus_get() is not widget:
             self.focus_get().trigger("scroll", event)
+        # Routed from the widget under the pointer, its scrollable ancestors see it bubble up
+        if widget is not None and widget.visible:
+            widget.dispatch("scroll", event)
 
     def _key_press(self, event: SkEvent):
         """Key press event for SkWindow.
@@ -146,6 +176,9 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
                     # self.focus_set()
                 else:
                     self.destroy()
+        if event["key"] == glfw.KEY_TAB:
+            self.focus_next(reverse=bool(event["mods_key"] & glfw.MOD_SHIFT))
+            return
         if self.focus_get() is not self:
             self.focus_get().trigger("key_press", event)
             if event["key"] == glfw.KEY_ENTER:
@@ -153,6 +186,9 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
                     self.focus_get().invoke()
 
     def _key_repeat(self, event: SkEvent) -> None:
+        if event["key"] == glfw.KEY_TAB:
+            self.focus_next(reverse=bool(event["mods_key"] & glfw.MOD_SHIFT))
+            return
         if self.focus_get() is not self:
             self.focus_get().trigger("key_repeat", event)
 
@@ -215,23 +251,19 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
             self._height1 = self.window.height
             self._right = self.root_x + self.width
             self._bottom = self.root_y + self.height
-        children = self.visible_children
-        # children.reverse()
-        for widget in reversed(children):
-            if self.is_widget_mouse_floating(widget, event):
-                if widget.focusable and not widget.cget("disabled"):
-                    widget.focus_set()
-                self.pressing_widget = widget
-                widget.is_mouse_floating = True
-                widget.button = event["button"]
-                names = [
-                    "mouse_press",
-                    f"mouse_press[button{event["button"] + 1}]",
-                    f"mouse_press[b{event["button"] + 1}]",
-                ]
-                for name in names:
-                    widget.trigger(name, event)
-                break
+        widget = self.hit_index.widget_at(event["x"], event["y"])
+        if widget is not None:
+            if widget.focusable and not widget.cget("disabled"):
+                widget.focus_set()
+            self.pressing_widget = widget
+            widget.is_mouse_floating = True
+            widget.button = event["button"]
+            # Routed once, the tasks bound to the button specific names run once too
+            aliases = (
+                f"mouse_press[button{event["button"] + 1}]",
+                f"mouse_press[b{event["button"] + 1}]",
+            )
+            widget.dispatch("mouse_press", event, aliases)
 
     def _mouse_move(self, event: SkEvent) -> None:
         """Mouse move event for SkWindow.
@@ -246,23 +278,19 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
         rootx = event["rootx"]
         rooty = event["rooty"]
 
-        motion_event = SkEvent(
-            widget=self,
-            event_type="mouse_motion",
-            button=self.button,
-            x=x,
-            y=y,
-            rootx=rootx,
-            rooty=rooty,
-        )
-
-        children = self.visible_children
+        grab = self.pointer_grab
+        if grab is not None:
+            # Captured for a drag, no hit testing and no enter / leave until released
+            grab.trigger("mouse_move", event)
+            if button >= 0:
+                for name in ("mouse_motion", f"button{button+1}_motion", f"b{button+1}_motion"):
+                    grab.trigger(name, event)
+            else:
+                grab.trigger("mouse_motion", event)
+            return
 
         # 找到当前鼠标所在的组件
-        current_widget = None
-        for widget in children:
-            if self.is_widget_mouse_floating(widget, event):
-                current_widget = widget
+        current_widget = self.hit_index.widget_at(x, y)
 
         # 处理上一个元素的离开事件
         if self.last_entered_widget and self.last_entered_widget != current_widget:
@@ -364,11 +392,8 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
         self._y1 = None
 
         button = self.button
-        names = [
-            "mouse_release",
-            f"mouse_release[button{button+1}]",
-            f"mouse_release[b{button+1}]",
-        ]
+        # Routed once, the tasks bound to the button specific names run once too
+        aliases = (f"mouse_release[button{button+1}]", f"mouse_release[b{button+1}]")
 
         """_widget = None
 
@@ -378,18 +403,24 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
                 print()"""
 
         if button >= 0:
-            for name in names:
-                event = SkEvent(
-                    event_type=name,
-                    button=button,
-                    x=event["x"],
-                    y=event["y"],
-                    rootx=self.mouse_rootx,
-                    rooty=self.mouse_rooty,
-                )
-                if self.pressing_widget and not self.pressing_widget.cget("disabled"):
-                    self.pressing_widget.trigger(name, event)
+            event = SkEvent(
+                event_type="mouse_release",
+                button=button,
+                x=event["x"],
+                y=event["y"],
+                rootx=self.mouse_rootx,
+                rooty=self.mouse_rooty,
+            )
+            grab = self.pointer_grab
+            if grab is not None:
+                # The release ends the drag, even if it is outside the widget
+                grab.dispatch("mouse_release", event, aliases)
+                self.pointer_grab = None
+                if grab is self.pressing_widget:
                     self.pressing_widget = None
+            elif self.pressing_widget and not self.pressing_widget.cget("disabled"):
+                self.pressing_widget.dispatch("mouse_release", event, aliases)
+                self.pressing_widget = None
         return None
 
     def _mouse_leave(self, event: SkEvent) -> None:
@@ -429,8 +460,114 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
         if self.focus_widget is not self:
             self.focus_widget.focus = False
             self.focus_widget.trigger("focus_loss", SkEvent(event_type="focus_loss"))
+            self.focus_widget.invalidate_rect()
             self.focus_widget: SkWindow | SkWidget = self
-        glfw.focus_window(self.the_window)
+        if self.framework == "glfw":
+            glfw.focus_window(self.the_window)
+
+    def focus_next(self, reverse: bool = False) -> "SkWidget | None":
+        """Move the focus to the next focusable widget in `traverse()` order (Tab order),
+        wrapping around.
+
+        :param reverse: Move to the previous one instead (Shift+Tab)
+        :return: The focused widget, None if no widget can take the focus
+        """
+        candidates = [
+            widget
+            for widget in self.traverse()
+            if widget.focusable and not widget.cget("disabled")
+        ]
+        if not candidates:
+            return None
+        step = -1 if reverse else 1
+        if self.focus_widget in candidates:
+            index = (candidates.index(self.focus_widget) + step) % len(candidates)
+        else:
+            index = -1 if reverse else 0
+        widget = candidates[index]
+        widget.focus_set()
+        return widget
+
+    # endregion
+
+    # region Traversal 遍历
+
+    def traverse(self) -> typing.Iterator["SkWidget"]:
+        """Iterate the visible widgets of the window in paint order, from back to front: the
+        layers of each container, each child followed by its own children.
+
+        Hit testing (`hit_index`), focus traversal (`focus_next()`) and `visible_children` share
+        this order. It is cached until a structural change (`invalidate_traversal()`).
+
+        Example
+        -------
+        .. code-block:: python
+            buttons = [widget for widget in window.traverse() if isinstance(widget, SkButton)]
+
+        :return: Iterator of the widgets
+        """
+        if self._traversal is None:
+            order = []
+            self._collect_traversal(self, order)
+            self._traversal = tuple(order)
+        return iter(self._traversal)
+
+    @staticmethod
+    def _collect_traversal(container: SkContainer, order: list) -> None:
+        for layer in container.draw_list:
+            for child in layer:
+                if child.visible:
+                    order.append(child)
+                    if hasattr(child, "draw_list"):
+                        SkWindow._collect_traversal(child, order)
+
+    def invalidate_traversal(self) -> None:
+        """Mark `traverse()` to be collected again, after widgets were added, removed, shown or
+        hidden. The hit index is rebuilt too.
+
+        :return: None
+        """
+        self._traversal = None
+        self.hit_index.invalidate()
+
+    # endregion
+
+    # region Geometry 几何
+
+    @property
+    def geometry_batching(self) -> bool:
+        """Whether a `SkContainer.geometry_batch()` is open in the window."""
+        return self._geometry_batch > 0
+
+    def defer_move(self, widget: "SkWidget") -> None:
+        """Recompute the position of the widget at the end of the geometry batch.
+
+        :param widget: The moved widget
+        :return: None
+        """
+        self._moved_widgets[widget] = None
+
+    def defer_resize(self, widget: "SkWidget") -> None:
+        """Trigger the `resize` event of the widget at the end of the geometry batch.
+
+        :param widget: The resized widget
+        :return: None
+        """
+        self._resized_widgets[widget] = None
+
+    def _flush_geometry(self) -> None:
+        from .widget import SkWidget
+
+        moved, self._moved_widgets = self._moved_widgets, {}
+        resized, self._resized_widgets = self._resized_widgets, {}
+        # Parents first, a moved parent updates its whole subtree in one traversal, then one
+        # `move` per widget, however many of its ancestors moved too
+        shifted: dict[SkWidget, None] = {}
+        for widget in sorted(moved, key=lambda widget: len(widget.route())):
+            shifted.update(dict.fromkeys(widget._shift_position_tree()))
+        SkWidget._trigger_move(shifted, moved)
+        for widget in resized:
+            widget.trigger("resize", SkEvent(widget=widget.parent, event_type="resize"))
 
     # endregion
 
@@ -453,6 +590,16 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
     def _draw(self, canvas: skia.Canvas) -> None:
         # print(style_to_color())
         self.rect = skia.Rect.MakeLTRB(0, 0, self.width, self.height)
+
+        # Only repaint the damaged region, the rest of the surface keeps the previous frame
+        # 【仅重绘脏区域，其余部分保留上一帧】
+        damage = self.frame_damage
+        if damage is not None:
+            if damage.isEmpty():
+                return None
+            canvas.save()
+            canvas.clipRegion(damage)
+
         # print(self.id, "draw")
         radius = self.theme.get_style_attr(self.style, "radius")
         if not radius:
@@ -507,6 +654,8 @@ class SkWindow(SkWindowBase, SkContainer, SkDraw):
                             )
                             # print(bd_shader["linear_gradient"])
                 canvas.drawRRect(rrect, bd_paint)
+        if damage is not None:
+            canvas.restore()
         return None
 
     # endregion
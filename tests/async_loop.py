@@ -0,0 +1,37 @@
+import asyncio
+
+from suzaku import *
+
+# Coroutine handlers are awaited by the asyncio loop running the application
+root = Sk(framework="raster", size=(320, 240))
+text = SkText(root, text="Waiting...")
+text.box(padx=10, pady=10)
+
+
+async def on_click(event) -> None:
+    reader, writer = await asyncio.open_connection(*server_address)
+    writer.write(b"ping\n")
+    text.set((await reader.readline()).decode().strip())
+    writer.close()
+    root.bind("delay[50ms]", lambda _: root.quit())
+
+
+async def handle(reader, writer) -> None:
+    await reader.readline()
+    writer.write(b"pong\n")
+    await writer.drain()
+    writer.close()
+
+
+async def main() -> None:
+    global server_address
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    server_address = server.sockets[0].getsockname()[:2]
+    text.bind("click", on_click)
+    root.bind("delay[10ms]", lambda _: text.trigger("click"))
+    await root.run_async()
+    server.close()
+    print(text.get())
+
+
+asyncio.run(main())
@@ -0,0 +1,62 @@
+import gc
+import sys
+import tracemalloc
+
+from suzaku import *
+from suzaku.event import SkEventHandling, SkEventKey
+
+# Memory of 10k widgets with bindings, it has to be given back when they are destroyed
+root = Sk(framework="raster", size=(320, 240))
+root.update(True)
+
+
+def table_size(obj: SkEventHandling) -> int:
+    return sys.getsizeof(obj.tasks) + sum(sys.getsizeof(tasks) for tasks in obj.tasks.values())
+
+
+def create() -> tuple[SkFrame, list[SkTextButton]]:
+    frame = SkFrame(root)
+    widgets = [SkTextButton(frame, text=f"Button {i}") for i in range(10_000)]
+    for widget in widgets:
+        widget.bind("mouse_move[b1]", lambda event: None)
+        widget.bind("custom_event", lambda event: None)
+    return frame, widgets
+
+
+# Warm up, so that the caches and the arrays of the window are already grown
+frame, widgets = create()
+frame.destroy()
+del frame, widgets
+gc.collect()
+
+event_types = len(SkEventHandling.EVENT_TYPES)
+tracemalloc.start()
+baseline = tracemalloc.get_traced_memory()[0]
+
+frame, widgets = create()
+root.update(True)
+created = tracemalloc.get_traced_memory()[0]
+tables = sum(table_size(widget) for widget in widgets)
+for widget in widgets[:100]:
+    widget.clear_bind("*")
+tables_cleared = sum(table_size(widget) for widget in widgets[:100])
+
+frame.destroy()
+del frame, widgets, widget
+gc.collect()
+root.update(True)
+destroyed = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+print(f"Created: {(created - baseline) / 1024 / 1024:.1f}MiB for 10k widgets")
+print(f"Left after destroy: {(destroyed - baseline) / 1024:.0f}KiB")
+print(f"Binding tables: {tables / 10_000:.0f} bytes/widget, {tables_cleared / 100:.0f} after clear_bind")
+print(f"Event types: {event_types} -> {len(SkEventHandling.EVENT_TYPES)}")
+assert destroyed - baseline < (created - baseline) * 0.05, "Destroyed widgets were kept alive"
+assert len(SkEventHandling.EVENT_TYPES) == event_types  # Registered once, by the warm up
+
+# Keys with params are made up freely (`delay[...]`), only the recent ones stay interned
+for index in range(10_000):
+    SkEventKey.get(f"delay[{index}ms]")
+assert len(SkEventKey._param_cache) <= SkEventKey.param_cache_size
+assert SkEventKey.get("delay[9999ms]") is SkEventKey.get("delay[9999ms]")
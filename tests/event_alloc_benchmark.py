@@ -0,0 +1,37 @@
+import time
+import tracemalloc
+
+from suzaku import *
+
+# Allocations of 10k synthetic mouse moves, with and without recycled event objects
+MOVES = 10_000
+
+root = Sk(framework="raster", size=(400, 400))
+for i in range(10):
+    SkTextButton(root, text=f"Button {i}").box(padx=10, pady=2)
+root.update(True)
+
+
+def bench(recycle: bool) -> None:
+    root.recycle_events = recycle
+    for i in range(100):  # Warm up caches
+        root._on_cursor_pos(root.the_window, i % 400, i % 400)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(MOVES):
+        root._on_cursor_pos(root.the_window, i % 400, (i * 7) % 400)
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"recycle={recycle!s:<5} {seconds * 1e6 / MOVES:6.1f}us/move (traced), "
+        f"peak {peak / 1024:6.1f}KiB, {current / 1024:6.1f}KiB kept"
+    )
+
+
+bench(False)
+bench(True)
+tracemalloc.start()
+event = SkEvent(event_type="mouse_move", x=1, y=2, rootx=3, rooty=4, glfw_window=None)
+print(f"One mouse move event: {tracemalloc.get_traced_memory()[0]} bytes")
+tracemalloc.stop()
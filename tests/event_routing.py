@@ -0,0 +1,96 @@
+import glfw
+
+from suzaku import *
+
+# Routed events go down the `parent` chain (capture), to the widget, then back up (bubble)
+root = Sk(framework="raster", size=(320, 240))
+frame = SkFrame(root).box(side="top", padx=10, pady=10)
+button = SkTextButton(frame, text="Button").box(padx=10, pady=10)
+slider = SkSlider(root).box(side="top")
+root.update(True)
+
+log = []
+root.bind("mouse_press", lambda event: log.append("root capture"), phase="capture")
+frame.bind("mouse_press", lambda event: log.append("frame capture"), phase="capture")
+button.bind("mouse_press", lambda event: log.append("button"))
+frame.bind("mouse_press", lambda event: log.append(f"frame bubble {event.widget}"), phase="bubble")
+root.bind("mouse_press", lambda event: log.append("root bubble"), phase="bubble")
+# Button specific names are the same event, their own tasks run in the same route
+button.bind("mouse_press[b1]", lambda event: log.append("button b1"))
+button.bind("mouse_press[button1]", lambda event: log.append("button button1"))
+button.bind("mouse_press[b2]", lambda event: log.append("button b2"))
+root.bind("mouse_press[b1]", lambda event: log.append("root bubble b1"), phase="bubble")
+button.bind("mouse_release", lambda event: log.append("release"))
+button.bind("mouse_release[b1]", lambda event: log.append("release b1"))
+
+
+def click(widget, dx=5):
+    x, y = widget.canvas_x + dx, widget.canvas_y + widget.height / 2
+    root._on_cursor_pos(root.the_window, x, y)
+    root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.PRESS, 0)
+    return x, y
+
+
+click(button)
+root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.RELEASE, 0)
+print(*log, sep="\n")
+# One click is routed once
+assert log == [
+    "root capture",
+    "frame capture",
+    "button",
+    "button button1",
+    "button b1",
+    f"frame bubble {button}",
+    "root bubble",
+    "root bubble b1",
+    "release",
+    "release b1",
+], log
+
+# A capture task can keep the event from the widget
+log.clear()
+frame.bind("mouse_press", lambda event: event.stop_propagation(), phase="capture")
+click(button)
+root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.RELEASE, 0)
+# The release is another event, not stopped
+assert log == ["root capture", "frame capture", "release", "release b1"], log
+
+# Dragging a slider captures the pointer, the moves outside of it still reach it
+released = []
+slider.bind("changed", lambda event: released.append(slider.value))
+x, y = click(slider)
+assert root.pointer_grab is slider
+for step in range(1, 40):
+    root._on_cursor_pos(root.the_window, x + step * 10, y + 100)
+root.update(True)  # The slider takes its value while drawing
+root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.RELEASE, 0)
+print("Slider value:", slider.value)
+assert root.pointer_grab is None
+assert released and slider.value == slider.cget("maxvalue"), (released, slider.value)
+
+# The wheel is routed from the widget under the pointer, up to the frame that scrolls
+page = SkFrame(root).fixed(0, 0, 320, 240)  # Over the widgets above
+scrolled = SkFrame(page).fixed(0, 0, 150, 200)
+rows = [SkTextButton(scrolled, text=f"{index}").box(pady=5) for index in range(20)]
+other = SkFrame(page).fixed(160, 0, 150, 200)
+for index in range(20):
+    SkTextButton(other, text=f"{index}").box(pady=5)
+scrolled.bind_scroll_event()
+other.bind_scroll_event()
+popup = SkPopup(root)
+root.update(True)
+assert len(root.tasks["scroll"]) == 1  # Nothing bound to the window by the frames
+root._on_cursor_pos(root.the_window, rows[1].canvas_x + 5, rows[1].canvas_y + 5)
+assert root.last_entered_widget is rows[1]
+root._on_scroll(root.the_window, 0, -1)
+root.flush_input()
+assert scrolled.y_offset == -18 and other.y_offset == 0, (scrolled.y_offset, other.y_offset)
+
+# A popup closes on a release anywhere in the window, seen in the capture phase
+popup.popup(x=200, y=50, width=100, height=100)
+root.update(True)
+assert popup.is_popup and popup.is_focus
+click(rows[1])
+root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.RELEASE, 0)
+assert not popup.is_popup
@@ -0,0 +1,39 @@
+import threading
+import time
+
+from suzaku import *
+
+# Work runs in the thread pool, widget changes come back through call_soon()
+root = Sk(framework="raster", size=(320, 240))
+text = SkText(root, text="Loading...")
+text.box(padx=10, pady=10)
+root.update(True)
+
+
+def parse(n: int) -> int:
+    time.sleep(0.05)  # Stands for file parsing or a network call
+    return sum(range(n))
+
+
+def on_parsed(result: int) -> None:
+    assert threading.current_thread() is threading.main_thread()
+    text.set(f"Result: {result}")
+
+
+text.run_in_executor(parse, 1000, callback=on_parsed)
+
+
+def on_click(event) -> None:
+    assert threading.current_thread() is not threading.main_thread()
+    text.call_soon(print, "Multithread handler ran in", threading.current_thread().name)
+
+
+text.bind("click", on_click, multithread=True)
+text.trigger("click")
+
+start = time.perf_counter()
+while text.get() == "Loading..." and time.perf_counter() - start < 2:
+    root.app.update()
+    time.sleep(0.001)
+root.app.update()
+print(text.get())
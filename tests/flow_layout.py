@@ -0,0 +1,80 @@
+import time
+
+from suzaku import *
+
+# The flow layout wraps its children in lines and only flows again from the affected line
+root = Sk(framework="raster", size=(400, 300))
+frame = SkFrame(root).fixed(0, 0, 200, 300)
+chips = [SkText(frame, text=f"{i}").configure(dwidth=40, dheight=20) for i in range(10)]
+for chip in chips:
+    chip.flow(padx=5, pady=5)
+root.update(True)
+engine = frame.flow_layout
+assert engine.line_starts == [0, 4, 8], engine.line_starts  # 4 chips of 50 per line
+assert (chips[5].x, chips[5].y) == (55, 35)
+assert (frame.content_width, frame.content_height) == (200, 90)
+
+# A chip growing pushes the next ones, the first line is kept
+flows = engine.flow_count
+chips[6].configure(dwidth=90)
+root.update(True)
+assert engine.line_starts == [0, 4, 7], engine.line_starts
+assert engine.flow_count - flows == 2
+assert (chips[7].x, chips[7].y) == (5, 65)
+
+# A chip changing size without changing the breaks only flows its line
+flows = engine.flow_count
+chips[1].configure(dwidth=25)
+root.update(True)
+assert engine.flow_count - flows == 1 and chips[2].x == 90
+
+# A shrinking first chip of a line may go back on the previous line
+chips[6].configure(dwidth=40)
+chips[4].configure(dwidth=5)
+root.update(True)
+assert engine.line_starts == [0, 5, 9], engine.line_starts
+assert chips[4].y == 5
+
+# Resizing keeps the lines that still fit
+flows = engine.flow_count
+frame.fixed(0, 0, 205, 300)
+root.update(True)
+assert engine.flow_count == flows
+frame.fixed(0, 0, 400, 300)
+root.update(True)
+assert engine.line_starts == [0, 9], engine.line_starts
+
+# Thousands of thumbnails: one resized thumbnail reflows from its line only
+wall = SkFrame(root).fixed(0, 0, 360, 300)
+wall.allowed_scrolled = True
+thumbs = [SkFrame(wall).configure(dwidth=32, dheight=32) for _ in range(3000)]
+start = time.perf_counter()
+for thumb in thumbs:
+    thumb.flow(padx=2, pady=2)
+root.update(True)
+print(f"Flow of {len(thumbs)} children: {(time.perf_counter() - start) * 1e3:.1f} ms")
+wall_engine = wall.flow_layout
+assert len(wall_engine.line_starts) == 300  # 10 thumbnails of 36 per line
+assert wall.content_height == 300 * 36
+
+flows, measures = wall_engine.flow_count, wall_engine.measure_count
+start = time.perf_counter()
+thumbs[2950].configure(dwidth=40)
+wall.layout_if_needed()
+print(f"Reflow after one change: {(time.perf_counter() - start) * 1e3:.3f} ms")
+assert wall_engine.measure_count - measures == 1
+# From the line before it (it starts its line) to the end, the next ones are pushed along
+assert wall_engine.flow_count - flows == 301 - 294, wall_engine.flow_count - flows
+assert thumbs[2959].y == thumbs[2950].y + 36  # Pushed to the next line
+
+# A taller thumbnail only flows its line, the next lines are moved down as they are
+flows = wall_engine.flow_count
+y = thumbs[2000].y
+thumbs[1505].configure(dheight=40)
+root.update(True)
+assert wall_engine.flow_count - flows == 1
+assert thumbs[2000].y == y + 8
+
+# The content size lets the container scroll
+wall.y_offset = -5000
+assert thumbs[1500].y == 150 * 36 + 2 - 5000 and thumbs[1510].y == 151 * 36 + 8 + 2 - 5000
@@ -0,0 +1,57 @@
+import glfw
+
+from suzaku import *
+
+# One cached paint order per window, shared by hit testing and Tab focus traversal
+root = Sk(framework="raster", size=(320, 240))
+first = SkLineInput(root).box(side="top")
+tabs = SkTabs(root).box(side="top", expand=True)
+page1 = SkFrame(tabs)
+page2 = SkFrame(tabs)
+inside1 = SkLineInput(page1).box(side="top")
+inside2 = SkLineInput(page2).box(side="top")
+tabs.add(page1, text="Page 1")
+tabs.add(page2, text="Page 2")
+tabs.select(0)
+root.update(True)
+
+order = list(root.traverse())
+assert all(widget.visible for widget in order)
+assert inside1 in order and inside2 not in order  # Hidden pages are not traversed
+assert order.index(tabs) < order.index(inside1)  # Children come after their parent
+root.update(True)
+assert root._traversal is not None and list(root.traverse()) == order  # Repaints keep the cache
+
+
+def tab(shift=False):
+    mods = glfw.MOD_SHIFT if shift else 0
+    root._on_key(root.the_window, glfw.KEY_TAB, 0, glfw.PRESS, mods)
+    root._on_key(root.the_window, glfw.KEY_TAB, 0, glfw.RELEASE, mods)
+    return root.focus_get()
+
+
+focusable = [widget for widget in order if widget.focusable]
+assert tab() is focusable[0]
+assert tab() is focusable[1]
+assert tab(shift=True) is focusable[0]
+assert tab(shift=True) is focusable[-1]  # Wraps around
+
+# Typing and moving the focus only damage the widgets concerned, not the whole window
+first.focus_set()
+root.update(True)
+root._on_char(root.the_window, ord("a"))
+assert first.get() == "a"
+assert not root.damage_full and root.damage.contains(first.damage_rect().roundOut())
+assert not root.damage.intersects(inside1.damage_rect().roundOut())
+root.update(True)
+assert tab() is focusable[1] and not root.damage_full
+assert root.damage.contains(first.damage_rect().roundOut())
+assert root.damage.contains(focusable[1].damage_rect().roundOut())
+
+# Switching tabs is a structural change
+tabs.select(1)
+root.update(True)
+order = list(root.traverse())
+assert inside2 in order and inside1 not in order
+assert root.hit_index.widget_at(inside2.canvas_x + 5, inside2.canvas_y + 5) is inside2
+print("Tab order:", [str(widget) for widget in order if widget.focusable])
@@ -0,0 +1,28 @@
+import glfw
+
+from suzaku import *
+
+# A burst of key events between two frames is drawn once, not once per event
+root = Sk(framework="raster", size=(320, 240), max_fps=60)
+entry = SkLineInput(root, placeholder="Type here")
+entry.box(padx=10, pady=10)
+root.update(True)
+
+scheduler = root.app.frame_scheduler
+scheduler.reset_stats()
+for char in "suzaku":
+    root._on_key(root.the_window, ord(char.upper()), 0, glfw.PRESS, 0)
+    root._on_char(root.the_window, ord(char))
+    root._on_key(root.the_window, ord(char.upper()), 0, glfw.RELEASE, 0)
+print("Frames drawn by the callbacks:", scheduler.frame_count)
+
+while root.need_redraw:
+    root.app.update()
+print("Frames after the burst:", scheduler.frame_count)
+print(scheduler.stats())
+
+# An idle loop sleeps until the next input event, delay task or animation frame
+root.update(True)
+print("Idle timeout:", root.app.time_until_next_event())
+root.bind("delay[200ms]", lambda _: print("Delay 200ms"))
+print("Timeout with a delay task:", root.app.time_until_next_event())
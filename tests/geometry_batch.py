@@ -0,0 +1,60 @@
+from suzaku import *
+
+# Layouts and `set_geometry()` trigger at most one move per widget that actually moved
+root = Sk(framework="raster", size=(320, 240))
+frame = SkFrame(root).fixed(10, 10, 300, 200)
+cells = [SkTextButton(frame, text=f"{row}:{column}") for row in range(3) for column in range(3)]
+for index, cell in enumerate(cells):
+    cell.grid(row=index // 3, column=index % 3)
+nested = SkFrame(frame).fixed(0, 150, 100, 40)
+inner = SkTextButton(nested, text="Inner").fixed(5, 5, 50, 20)
+root.update(True)
+
+moves: dict[str, int] = {}
+resizes: dict[str, int] = {}
+
+
+def counter(counts: dict[str, int], widget_id: str):
+    return lambda event: counts.update({widget_id: counts.get(widget_id, 0) + 1})
+
+
+for widget in [frame, nested, inner, *cells]:
+    widget.bind("move", counter(moves, widget.id))
+    widget.bind("resize", counter(resizes, widget.id))
+
+# A relayout that changes nothing moves nothing
+frame.update_layout()
+assert not moves and not resizes, moves
+
+# Moving the frame moves its whole subtree once, without laying it out again
+count = frame.layout_count
+frame.fixed(40, 30, 300, 200)
+root.update(True)
+assert frame.layout_count == count
+assert set(moves.values()) == {1} and len(moves) == len(cells) + 3, moves
+assert (inner.canvas_x, inner.canvas_y) == (40 + 0 + 5, 30 + 150 + 5)
+assert root.hit_index.widget_at(inner.canvas_x + 2, inner.canvas_y + 2) is inner
+
+# Batched changes are applied at the end of the block, once
+moves.clear()
+with frame.geometry_batch():
+    nested.set_geometry(x=10)
+    nested.set_geometry(y=160, width=120)
+    assert nested.canvas_x == 40 and not moves  # Deferred
+assert moves == {nested.id: 1, inner.id: 1} and resizes == {nested.id: 1}, (moves, resizes)
+assert (inner.canvas_x, inner.canvas_y) == (40 + 10 + 5, 30 + 160 + 5)
+
+# Unchanged geometry does not trigger anything
+moves.clear()
+resizes.clear()
+nested.set_geometry(10, 160, 120, nested.height)
+assert not moves and not resizes
+
+# A parent and its descendants moved in one batch still move once each
+moves.clear()
+with frame.geometry_batch():
+    frame.set_geometry(x=50)
+    nested.set_geometry(x=20)
+    inner.set_geometry(x=15)
+assert set(moves.values()) == {1} and len(moves) == len(cells) + 3, moves
+assert (inner.canvas_x, inner.canvas_y) == (50 + 20 + 15, 30 + 160 + 5)
@@ -0,0 +1,76 @@
+import time
+
+import skia
+
+import suzaku.widgets.geometry as geometry_module
+from suzaku import *
+
+# The geometry of the widgets lives in per-window arrays, moved in one operation
+root = Sk(framework="raster", size=(400, 300))
+clipper = SkFrame(root).fixed(20, 20, 200, 100)
+list_frame = SkFrame(clipper).fixed(0, 0, 200, 2000)
+rows = [SkFrame(list_frame).fixed(0, index * 20, 200, 20) for index in range(100)]
+labels = [SkText(row, text=f"Row {index}").fixed(5, 2, 80, 16) for index, row in enumerate(rows)]
+root.update(True)
+
+store = root.geometry
+assert store.widgets[labels[3]._slot] is labels[3]
+assert labels[3].canvas_y == 20 + 3 * 20 + 2
+
+# Scrolling moves every descendant at once, without laying them out again
+clipper.content_height = 2000
+counts = [row.layout_count for row in rows]
+start = time.perf_counter()
+clipper.y_offset = -510
+elapsed = (time.perf_counter() - start) * 1e3
+print(f"Scroll of {len(clipper.children)} widgets: {elapsed:.3f} ms")
+assert [row.layout_count for row in rows] == counts
+assert labels[27].canvas_y == 20 - 510 + 27 * 20 + 2
+assert root.hit_index.widget_at(30, labels[27].canvas_y + 5) is labels[27]
+assert root.need_redraw and root.damage.contains(skia.IRect.MakeXYWH(20, 20, 200, 100))
+
+# The mouse wheel path, `scroll()`, does not lay out either and repaints the container
+root.update(True)
+assert not root.need_redraw
+counts = [row.layout_count for row in rows]
+clipper_count = clipper.layout_count
+clipper.scroll(0, -20)
+assert clipper.y_offset == -530 and labels[27].canvas_y == 20 - 530 + 27 * 20 + 2
+assert clipper.layout_count == clipper_count and [row.layout_count for row in rows] == counts
+assert root.need_redraw and root.damage.contains(skia.IRect.MakeXYWH(20, 20, 200, 100))
+clipper.scroll(0, 20)
+root.update(True)
+
+# Visible parts are clipped by `clipper`
+visible = root.geometry.query_rect(0, 0, 400, 300)
+assert labels[27] in visible and labels[0] not in visible and labels[60] not in visible
+left, top, right, bottom, shown = store.clipped_rects()
+assert top[rows[24]._slot] > bottom[rows[24]._slot]  # Scrolled out
+assert (top[rows[25]._slot], bottom[rows[25]._slot]) == (20, 30)  # Partly hidden
+
+# The loops used without NumPy give the same results
+numpy_results = [list(column) for column in store.clipped_rects()]
+numpy = geometry_module.numpy
+geometry_module.numpy = None
+try:
+    assert [list(column) for column in store.clipped_rects()] == numpy_results
+    assert sorted(store.subtree(rows[2]._slot)) == sorted([rows[2]._slot, labels[2]._slot])
+finally:
+    geometry_module.numpy = numpy
+
+# Moving the window moves the root positions of all the widgets
+root.root_x, root.root_y = 100, 50
+root.trigger("move")
+label = labels[27]
+assert (label.root_x, label.root_y) == (label.canvas_x + 100, label.canvas_y + 50)
+
+# Destroyed widgets give their slot back and keep their last geometry
+slot = labels[99]._slot
+position = labels[99].canvas_x, labels[99].canvas_y
+labels[99].destroy()
+assert store.widgets[slot] is None
+assert (labels[99].canvas_x, labels[99].canvas_y) == position
+labels[99].x += 10
+labels[99].update()  # Out of the store, not positioned anymore
+assert labels[99].x == 15 and (labels[99].canvas_x, labels[99].canvas_y) == position
+assert SkText(rows[99], text="Again")._slot == slot
@@ -0,0 +1,65 @@
+import time
+
+from suzaku import *
+
+# The grid layout caches its track sizes and only measures the cells that changed
+root = Sk(framework="raster", size=(800, 600))
+frame = SkFrame(root).fixed(0, 0, 800, 600)
+
+# Spanning cells grow the tracks they span, the tracks use prefix sums for their offsets
+a = SkText(frame, text="A").configure(dwidth=50, dheight=20).grid(0, 0, padx=0, pady=0)
+b = SkText(frame, text="B").configure(dwidth=30, dheight=20).grid(0, 1, padx=0, pady=0)
+wide = SkText(frame, text="Wide").configure(dwidth=140, dheight=20)
+wide.grid(1, 0, columnspan=2, padx=0, pady=0)
+root.update(True)
+columns = frame.grid_layout.columns
+assert columns.sizes == [80, 60], columns.sizes  # 140 - (50 + 30) = 60 more, split evenly
+assert (b.x, wide.width, frame.content_width) == (80, 140, 140)
+
+# Weighted columns take the space left in the container, spanning cells grow them first
+frame.grid_columnconfigure(1, weight=1)
+root.update(True)
+assert columns.sizes == [50, 750], columns.sizes
+assert (b.x, b.width, wide.width) == (50, 750, 800)
+assert frame.content_width == 140  # Natural size, so that auto sized parents can shrink
+frame.grid_rowconfigure(0, minsize=40)
+root.update(True)
+assert (wide.y, a.height) == (40, 40)
+
+# A 40x6 settings page: typing in one cell only measures that cell again
+page = SkFrame(root).fixed(0, 0, 800, 600)
+inputs = []
+for row in range(40):
+    for column in range(6):
+        if column % 2:
+            inputs.append(SkLineInput(page, text=f"{row}").grid(row, column))
+        else:
+            SkText(page, text=f"Setting {row}.{column}").grid(row, column)
+page.grid_columnconfigure(5, weight=1)
+root.update(True)
+engine = page.grid_layout
+assert len(engine.cells) == 240
+
+label = engine.cells[next(iter(engine.cells))].widget
+count = engine.measure_count
+start = time.perf_counter()
+for index in range(20):
+    label.configure(text=f"Setting {'x' * index}")
+    root.update(True)
+elapsed = (time.perf_counter() - start) * 1e3 / 20
+print(f"Keystroke in a 40x6 grid: {elapsed:.3f} ms/frame")
+assert engine.measure_count - count <= 20 * 2, engine.measure_count - count
+assert label.width >= label.dwidth
+assert inputs[1].x == engine.columns.offsets[3] + 5
+
+# Resizing the container does not measure the cells, only distributes the space again
+count = engine.measure_count
+page.fixed(0, 0, 900, 600)
+root.update(True)
+assert engine.measure_count == count
+assert engine.columns.offsets[-1] == 900
+
+# Hiding a cell rebuilds the grid without it
+label.hide()
+root.update(True)
+assert label not in engine.cells and len(engine.cells) == 239
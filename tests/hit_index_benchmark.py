@@ -0,0 +1,64 @@
+import random
+import time
+
+from suzaku import *
+
+# Hit testing of 5000 widgets: the spatial index against testing every widget
+root = Sk(framework="raster", size=(1280, 800))
+for row in range(10):
+    for column in range(10):
+        frame = SkFrame(root).fixed(x=column * 128, y=row * 80, width=120, height=72)
+        for index in range(50):
+            # Some children are partly outside of their frame, which clips them
+            SkFrame(frame).fixed(x=(index % 10) * 13, y=(index // 10) * 15, width=12, height=14)
+root.update(True)
+widgets = len(root.visible_children)
+print("Widgets:", widgets)
+assert widgets >= 5000
+
+
+def linear_widget_at(x, y):
+    """What `SkWindow` did before: test every widget and its ancestors."""
+    current = None
+    for widget in root.visible_children:
+        if widget.is_entered(x, y):
+            parent = widget.parent
+            while parent is not root:
+                if not parent.allowed_out_of_bounds and not parent.is_entered(x, y):
+                    break
+                parent = parent.parent
+            else:
+                current = widget
+    return current
+
+
+random.seed(1)
+points = [(random.uniform(0, 1280), random.uniform(0, 800)) for _ in range(100)]
+for x, y in points:
+    assert root.hit_index.widget_at(x, y) is linear_widget_at(x, y), (x, y)
+
+start = time.perf_counter()
+for x, y in points:
+    linear_widget_at(x, y)
+linear = (time.perf_counter() - start) / len(points)
+
+start = time.perf_counter()
+for _ in range(100):
+    for x, y in points:
+        root.hit_index.widget_at(x, y)
+indexed = (time.perf_counter() - start) / len(points) / 100
+
+start = time.perf_counter()
+root.hit_index.rebuild()
+rebuild = time.perf_counter() - start
+
+print(f"Linear:  {linear * 1e6:10.1f} us per lookup")
+print(f"Indexed: {indexed * 1e6:10.1f} us per lookup")
+print(f"Rebuild: {rebuild * 1e3:10.1f} ms")
+
+# Mouse moves and repaints do not rebuild the index, only layout changes do
+rebuilds = root.hit_index.rebuild_count
+for x, y in points:
+    root._on_cursor_pos(root.the_window, x, y)
+    root.update()
+assert root.hit_index.rebuild_count == rebuilds, root.hit_index.rebuild_count - rebuilds
@@ -0,0 +1,28 @@
+import glfw
+
+from suzaku import *
+
+# Moves and scrolls between two frames are merged, clicks are never reordered across them
+root = Sk(framework="raster", size=(320, 240), coalesce_input=True)
+root.update(True)
+
+log = []
+root.bind("mouse_move", lambda event: log.append(("move", event["x"], event["y"])))
+root.bind("scroll", lambda event: log.append(("scroll", event["y_offset"])))
+root.bind("mouse_press[b1]", lambda event: log.append(("press", event["x"], event["y"])))
+root.bind("resize", lambda event: log.append(("resize", event["width"], event["height"])))
+
+for x in range(10, 60):
+    root._on_cursor_pos(root.the_window, x, 20)
+root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.PRESS, 0)
+for x in range(60, 100):
+    root._on_cursor_pos(root.the_window, x, 30)
+for _ in range(8):
+    root._on_scroll(root.the_window, 0, -1)
+for width in range(320, 400, 10):
+    root._on_resizing(root.the_window, width, 240)
+root.update(True)  # Next frame
+
+print(*log, sep="\n")
+print("Merged events:", root.coalesced_events)
+assert log[:3] == [("move", 59, 20), ("press", 59, 20), ("move", 99, 30)], log
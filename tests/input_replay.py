@@ -0,0 +1,49 @@
+import os
+import tempfile
+
+import glfw
+
+from suzaku import *
+from suzaku.base import SkInputRecorder, SkInputReplayer
+
+
+def build(window):
+    entry = SkLineInput(window).box(side="top")
+    slider = SkSlider(window).box(side="top")
+    window.update(True)
+    return entry, slider
+
+
+# Record a session on a window, replay it on another one, both end in the same state
+root = Sk(framework="raster", size=(320, 240))
+entry, slider = build(root)
+path = os.path.join(tempfile.mkdtemp(), "session.jsonl")
+
+with SkInputRecorder(root, path) as recorder:
+    x, y = entry.canvas_x + 10, entry.canvas_y + entry.height / 2
+    root._on_cursor_pos(root.the_window, x, y)
+    root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.PRESS, 0)
+    root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.RELEASE, 0)
+    for char in "Hello":
+        root._on_char(root.the_window, ord(char))
+    root.update(True)
+    x, y = slider.canvas_x + 5, slider.canvas_y + slider.height / 2
+    root._on_cursor_pos(root.the_window, x, y)
+    root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.PRESS, 0)
+    for step in range(30):
+        root._on_cursor_pos(root.the_window, x + step * 4, y)
+        root.update(True)
+    root._on_mouse_button(root.the_window, glfw.MOUSE_BUTTON_LEFT, glfw.RELEASE, 0)
+    root._on_scroll(root.the_window, 0, -1)
+    root.update(True)
+
+print("Recorded events:", len(recorder.records))
+assert entry.get() == "Hello"
+
+replay = SkWindow(root, size=(320, 240))
+replay_entry, replay_slider = build(replay)
+stats = SkInputReplayer(replay, path, speed=None).run()
+print(stats)
+assert stats["events"] == len(recorder.records)
+assert replay_entry.get() == entry.get()
+assert replay_slider.value == slider.value, (replay_slider.value, slider.value)
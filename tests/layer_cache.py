@@ -0,0 +1,45 @@
+import time
+
+from suzaku import *
+
+# Scroll a large frame with and without caching its children as a layer
+root = Sk(framework="raster", size=(300, 400))
+
+frames = []
+for cache_as_layer in (False, True):
+    frame = SkFrame(root, cache_as_layer=cache_as_layer)
+    frame.box(side="left", expand=True)
+    for i in range(80):
+        SkTextButton(frame, text=f"Button {i}").box(padx=10, pady=3)
+    frame.bind_scroll_event()
+    frames.append(frame)
+
+root.update(True)
+
+layers = root.render_context.layers
+cached = frames[1]
+layer = layers.get(cached.id)
+assert layer is not None and not cached._layer_dirty
+
+for frame in frames:
+    start = time.perf_counter()
+    for i in range(50):
+        frame.scroll(0, -3 if i % 2 else 3)
+        root.update()
+    print(
+        f"cache_as_layer={frame.cache_as_layer}: "
+        f"{(time.perf_counter() - start) / 50 * 1000:.2f}ms/frame"
+    )
+
+# Scrolling only moves the layer, it is not rendered again
+assert cached.y_offset != 0
+assert not cached._layer_dirty
+assert layers.get(cached.id) is layer
+
+# A child changing renders the layer again
+cached.children[0].configure(text="Changed")
+assert cached._layer_dirty
+root.update()
+assert not cached._layer_dirty and layers.get(cached.id) is not layer
+
+print(f"{len(layers)} layer(s), {layers.bytes / 1024 / 1024:.1f}MB")
@@ -0,0 +1,54 @@
+import time
+
+from suzaku import *
+
+# Layouts only run for dirty containers, once before a frame
+root = Sk(framework="raster", size=(320, 240))
+sidebar = SkFrame(root).box(side="left", padx=0, pady=0)
+content = SkFrame(root).box(side="left", expand=True)
+rows = [SkFrame(content).box(side="top") for _ in range(20)]
+labels = [SkText(row, text=f"Row {index}").box(side="left") for index, row in enumerate(rows)]
+button = SkTextButton(sidebar, text="Button").box(side="top")
+root.update(True)
+
+containers = [root, sidebar, content, *rows]
+
+
+def layout_counts():
+    return [container.layout_count for container in containers]
+
+
+# A steady UI does not lay out anything
+counts = layout_counts()
+start = time.perf_counter()
+for _ in range(100):
+    root.update(True)
+print(f"100 steady frames: {(time.perf_counter() - start) * 10:.3f} ms/frame")
+assert layout_counts() == counts, "Steady frames ran layouts"
+
+# Configuring a child only lays out the containers its size depends on
+labels[0].configure(dwidth=140)
+root.update(True)
+changed = [c for c, a, b in zip(containers, counts, layout_counts()) if a != b]
+assert rows[0] in changed and rows[1] not in changed and sidebar not in changed
+assert labels[0].width == 140
+
+# Auto sized text follows its textvariable
+var = SkStringVar("Short")
+label = SkText(rows[0], textvariable=var).box(side="left")
+root.update(True)
+width = label.width
+var.set("A much longer text than before")
+root.update(True)
+assert label.width > width
+
+# Resizing the window lays out the resized subtrees again
+counts = layout_counts()
+root.resize(480, 320)
+root.update(True)
+assert all(a != b for a, b in zip(counts, layout_counts())), "Resized containers were skipped"
+assert content.width > 320 - sidebar.width - 20
+counts = layout_counts()
+root.update(True)
+assert layout_counts() == counts
+print("Layout counts:", sum(layout_counts()))
@@ -0,0 +1,32 @@
+import time
+
+from suzaku import *
+
+# Render without any display, then save a screenshot
+root = Sk(framework="raster", size=(320, 160))
+
+button = SkTextButton(root, text="Button", command=lambda: print("Click"))
+button.box(padx=10, pady=10)
+
+entry = SkEntry(root, placeholder="Entry")
+entry.box(padx=10)
+
+root.update(True)  # Lay out and draw the first frame
+
+# Inject a click on the button and some typing into the entry
+root._on_cursor_pos(root.the_window, 30, 25)
+root._on_mouse_button(root.the_window, 0, True, 0)
+root._on_mouse_button(root.the_window, 0, False, 0)
+
+root._on_cursor_pos(root.the_window, 30, 75)
+root._on_mouse_button(root.the_window, 0, True, 0)
+root._on_mouse_button(root.the_window, 0, False, 0)
+for char in "suzaku":
+    root._on_char(root.the_window, ord(char))
+
+start = time.perf_counter()
+for _ in range(100):
+    root.update(True)
+print(f"100 frames in {time.perf_counter() - start:.3f}s")
+
+root.save("raster.png")
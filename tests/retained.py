@@ -0,0 +1,36 @@
+import time
+
+import skia
+
+from suzaku import *
+
+# Compare steady-state frames of a large form with and without retained drawing
+root = Sk(framework="raster", size=(800, 3200))
+
+for i in range(300):
+    SkTextButton(root, text=f"Button {i}").box(padx=10, pady=2)
+
+root.update(True)  # Lay out and draw the first frame
+
+
+def bench(retained: bool) -> float:
+    SkWidget.retained = retained
+    root.update(True)  # Record the pictures
+    start = time.perf_counter()
+    for _ in range(20):
+        root.update(True)
+    return (time.perf_counter() - start) / 20
+
+
+print(f"immediate: {bench(False) * 1000:.2f}ms/frame")
+print(f"retained: {bench(True) * 1000:.2f}ms/frame")
+
+# Attributes that are objects, like fonts, are part of the key by identity
+SkWidget.retained = True
+button = root.draw_list[0][0]
+root.update(True)
+key = button._picture_key
+button.configure(font=skia.Font(skia.Typeface(None), 30))
+assert button._picture is None  # Dropped by configure()
+root.update(True)
+assert button._picture is not None and button._picture_key != key
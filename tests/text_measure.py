@@ -0,0 +1,42 @@
+import skia
+
+from suzaku import *
+from suzaku.styles.font import SkTextMeasureCache, text_measure_cache
+
+# Text widths are kept by the widgets and in a shared LRU cache
+root = Sk(framework="raster", size=(400, 300))
+frame = SkFrame(root).fixed(0, 0, 400, 300)
+labels = [SkText(frame, text="Same text").grid(row, 0) for row in range(20)]
+root.update(True)
+
+text_measure_cache.clear()
+widths = [label.dwidth for label in labels]
+stats = text_measure_cache.stats()
+assert stats["misses"] == 0 and stats["widget_hits"] == 20, stats  # Kept by each widget
+
+# A new text is measured once for all the widgets sharing the font
+for label in labels:
+    label.configure(text="Another text")
+    assert label.dwidth == label.measure_text("Another text") + label.ipadx * 2
+stats = text_measure_cache.stats()
+assert stats["misses"] == 1 and stats["hits"] >= 19, stats
+
+# A font change is measured again, with the same width as measureText
+font = skia.Font(skia.Typeface(None), 30)
+labels[0].configure(font=font)
+assert labels[0].dwidth == font.measureText("Another text") + labels[0].ipadx * 2
+assert labels[0].text_height == font.getMetrics().fDescent - font.getMetrics().fAscent
+
+# Changing a font in place needs `invalidate_measure()`
+font.setSize(10)
+labels[0].invalidate_measure()
+assert labels[0].dwidth == font.measureText("Another text") + labels[0].ipadx * 2
+
+# The shared cache keeps the most recently used widths
+cache = SkTextMeasureCache(maxsize=2)
+for text in "a", "b", "a", "c":
+    cache.measure(font, text)
+cache.measure(font, "a")
+cache.measure(font, "b")
+assert cache.stats() == {"hits": 2, "misses": 4, "widget_hits": 0, "size": 2}, cache.stats()
+print("Text measure cache:", text_measure_cache.stats())
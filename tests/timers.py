@@ -0,0 +1,34 @@
+import time
+
+from suzaku import *
+
+# Delay and repeat tasks share one timer heap, the main loop sleeps until the earliest one
+root = Sk(framework="raster", size=(320, 240))
+entry = SkLineInput(root, placeholder="Type here")
+entry.box(padx=10, pady=10)
+root.update(True)
+
+ticks = []
+root.bind("delay[50ms]", lambda _: ticks.append("delay"))
+repeat = root.bind("repeat[20ms]", lambda _: ticks.append("repeat"))
+
+entry.focus_set()  # Starts the repeat timer of the blinking cursor
+timers = root.app.timer_scheduler
+print("Scheduled timers:", len(timers))
+
+start = time.perf_counter()
+while time.perf_counter() - start < 0.12:
+    time.sleep(timers.time_until_next() or 0)
+    root.app.update()
+print("Ticks:", ticks.count("repeat"), "repeat,", ticks.count("delay"), "delay")
+
+root.unbind(repeat)
+# Widget timers bound the idle wait of the loop too, here the blinking cursor only
+root.update(True)
+timeout = root.app.time_until_next_event()
+assert timeout is not None and timeout <= 0.5, timeout
+
+root.focus_set()  # Stops the repeat timer of the blinking cursor
+print("Scheduled timers:", len(timers))
+root.update(True)
+assert root.app.time_until_next_event() is None  # Nothing pending, wait for input
@@ -0,0 +1,56 @@
+import gc
+import weakref
+
+from suzaku import *
+
+# Destroyed widgets are unbound from their window, removed from their parent and collected
+root = Sk(framework="raster", size=(320, 240))
+root.update(True)
+window_tasks = sum(len(tasks) for tasks in root.tasks.values())
+
+for _ in range(50):  # Dynamic list rows
+    row = SkFrame(root).box(side="top")
+    row.bind_scroll_event()  # Binds `scroll` to the window
+    SkText(row, text="Name").box(side="left")
+    SkLineInput(row).box(side="left")
+    SkPopup(row)  # Binds `mouse_release` to the window
+    root.update(True)
+    row.destroy()
+del row  # The last row is still referenced here
+
+root.update(True)
+report = SkWidget.leak_report()
+print(report)
+assert not root.children and not any(root.draw_list), root.children
+assert sum(len(tasks) for tasks in root.tasks.values()) == window_tasks
+assert all(entry["destroyed"] == 0 for entry in report.values()), report
+
+
+# Weak bindings do not keep their target alive
+class Listener:
+    def __init__(self):
+        self.count = 0
+
+    def on_configure(self, event):
+        self.count += 1
+
+
+listener = Listener()
+task = root.bind("configure", listener.on_configure, weak=True)
+root.trigger("configure")
+assert listener.count == 1
+del listener
+gc.collect()
+root.trigger("configure")
+assert task not in root.tasks.get("configure", ())
+
+# Widgets following a variable are unbound from it when destroyed
+variable = SkIntVar(10)
+progress = SkProgressBar(root, variable=variable)
+variable.set(20)
+assert progress.cget("value") == 20
+progress.destroy()
+progress = weakref.ref(progress)
+gc.collect()
+assert progress() is None, "The variable keeps the destroyed progress bar alive"
+assert not variable.tasks.get("change")